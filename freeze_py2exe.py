@@ -43,7 +43,6 @@ EXCLUDE_MODULES = [
     "lib2to3",
     "unittest",
     "xmlrpc",
-    "multiprocessing",
     # "_ssl",
     # "ssl",
     # "email",
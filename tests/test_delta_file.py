@@ -0,0 +1,87 @@
+import os
+import random
+import sys
+import tempfile
+
+sys.path.append(".")
+
+
+def random_rows(rng: random.Random, columns: int):
+    """Generate random delta rows, strictly ascending distance"""
+    rows = []
+    values = [0.0] * columns
+    for _ in range(rng.randint(10, 3000)):
+        values = [round(value + rng.uniform(0.01, 20), 6) for value in values]
+        rows.append(tuple(values))
+    return tuple(rows)
+
+
+def test_delta_binary(rounds: int = 200, seed: int = 0):
+    """Delta binary file test, pack/unpack roundtrip & corrupted data"""
+    from tinypedal.userfile.delta_binary import pack_delta_columns, unpack_delta_columns
+
+    rng = random.Random(seed)
+    for round_index in range(rounds):
+        rows = random_rows(rng, rng.choice((2, 3)))
+        data = pack_delta_columns(tuple(zip(*rows)))
+        assert tuple(zip(*unpack_delta_columns(data))) == rows, f"round {round_index}: roundtrip mismatch"
+        # Flip a payload byte
+        corrupted = bytearray(data)
+        corrupted[rng.randrange(20, len(data))] ^= 0xFF
+        # Truncate payload
+        truncated = data[:rng.randrange(0, len(data))]
+        for invalid in (bytes(corrupted), truncated):
+            try:
+                unpack_delta_columns(invalid)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"round {round_index}: invalid data not detected")
+
+
+def test_delta_file_migration():
+    """Delta file test, legacy CSV file migration"""
+    from tinypedal.const_file import FileExt
+    from tinypedal.userfile.delta_best import load_delta_best_file, save_delta_best_file
+    from tinypedal.userfile.delta_binary import export_delta_csv, import_delta_csv
+    from tinypedal.userfile.fuel_delta import load_fuel_delta_file, save_fuel_delta_file
+
+    rng = random.Random(1)
+    with tempfile.TemporaryDirectory() as temp_path:
+        filepath = f"{temp_path}/"
+        # Delta best
+        rows = random_rows(rng, 2)
+        export_delta_csv(f"{filepath}best{FileExt.CSV}", rows)
+        result = load_delta_best_file(filepath, "best", ((), 0))
+        assert result == (rows, rows[-1][1]), "delta best: migration failed"
+        assert os.path.exists(f"{filepath}best{FileExt.DELTA}"), "delta best: binary file not created"
+        os.remove(f"{filepath}best{FileExt.CSV}")
+        assert load_delta_best_file(filepath, "best", ((), 0)) == result, "delta best: binary file load failed"
+        rows = random_rows(rng, 2)
+        save_delta_best_file(filepath, "best", rows)
+        assert load_delta_best_file(filepath, "best", ((), 0))[0] == rows, "delta best: binary file save failed"
+        # Fuel & energy delta
+        for extension in (FileExt.FUEL, FileExt.ENERGY):
+            rows = random_rows(rng, 3)
+            export_delta_csv(f"{filepath}combo{extension}", rows)
+            result = load_fuel_delta_file(filepath, "combo", extension, ((), 0, 0))
+            assert result == (rows, rows[-1][1], rows[-1][2]), f"{extension}: migration failed"
+            rows = random_rows(rng, 3)
+            save_fuel_delta_file(filepath, "combo", extension, rows)
+            os.remove(f"{filepath}combo{extension}")
+            result = load_fuel_delta_file(filepath, "combo", extension, ((), 0, 0))
+            assert result[0] == rows, f"{extension}: binary file save failed"
+        # CSV export
+        for extension in (FileExt.CSV, FileExt.FUEL, FileExt.ENERGY):
+            rows = random_rows(rng, 3)
+            save_fuel_delta_file(filepath, "export", extension, rows, export_csv=True)
+            assert import_delta_csv(f"{filepath}export{extension}") == rows, f"{extension}: CSV export failed"
+        save_delta_best_file(filepath, "export_best", rows)
+        assert not os.path.exists(f"{filepath}export_best{FileExt.CSV}"), "CSV exported while disabled"
+        # Missing file
+        assert load_delta_best_file(filepath, "missing", ((), 0)) == ((), 0), "missing file: defaults not returned"
+
+
+if __name__ == "__main__":
+    test_delta_binary()
+    test_delta_file_migration()
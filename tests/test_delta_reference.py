@@ -0,0 +1,86 @@
+import random
+import sys
+
+sys.path.append(".")
+
+
+def random_lap(rng: random.Random):
+    """Generate random delta lap rows, strictly ascending distance"""
+    rows = [(0.0, 0.0)]
+    distance = 0.0
+    laptime = 0.0
+    for _ in range(rng.randint(0, 2000)):
+        distance = round(distance + rng.uniform(5, 20), 6)
+        laptime = round(laptime + rng.uniform(0.05, 0.5), 6)
+        rows.append((distance, laptime))
+    return tuple(rows)
+
+
+def random_positions(rng: random.Random, track_length: float):
+    """Generate forward moving positions, with wraps, jumps and stalls"""
+    position = rng.uniform(0, track_length)
+    for _ in range(rng.randint(1, 3000)):
+        roll = rng.random()
+        if roll < 0.01:
+            position = rng.uniform(0, track_length)  # jump
+        elif roll < 0.05:
+            pass  # stall
+        else:
+            position += rng.uniform(0, 30)
+            if position > track_length + 20:
+                position = rng.uniform(0, 10)  # wrap
+        yield position
+
+
+def test_delta_reference(rounds: int = 200, seed: int = 0):
+    """Delta reference test, cursor lookup vs binary search"""
+    from tinypedal import calculation as calc
+    from tinypedal.process.delta import DeltaReference
+
+    rng = random.Random(seed)
+    for round_index in range(rounds):
+        dataset = random_lap(rng)
+        reference = DeltaReference(dataset)
+        track_length = dataset[-1][0]
+        for position in random_positions(rng, track_length):
+            laptime = rng.uniform(0, 200)
+            expected = calc.delta_telemetry(dataset, position, laptime)
+            result = reference.delta(position, laptime)
+            assert abs(expected - result) <= 1e-9, (
+                f"round {round_index}: mismatch at {position}, {expected} != {result}")
+        assert reference.rows() == dataset, f"round {round_index}: rows mismatch"
+
+
+def test_delta_engine(rounds: int = 100, seed: int = 1):
+    """Delta engine test, batched references vs separated smoothed delta"""
+    from tinypedal import calculation as calc
+    from tinypedal.process.delta import DeltaEngine, DeltaReference
+
+    rng = random.Random(seed)
+    for round_index in range(rounds):
+        factor = calc.ema_factor(rng.randint(1, 100))
+        engine = DeltaEngine(factor)
+        datasets = {}
+        for name in ("best", "last", "session", "file"):
+            datasets[name] = random_lap(rng)
+            engine.register(name, DeltaReference(datasets[name]))
+        # Shared columns
+        datasets["stint"] = datasets["best"]
+        engine.register("stint").assign(engine.reference("best"))
+        expected = dict.fromkeys(datasets, 0.0)
+        track_length = datasets["best"][-1][0]
+        for position in random_positions(rng, track_length):
+            laptime = rng.uniform(0, 200)
+            condition = rng.random() < 0.9
+            engine.update(position, laptime, condition)
+            for name, dataset in datasets.items():
+                expected[name] = calc.exp_mov_avg(
+                    factor, expected[name], calc.delta_telemetry(dataset, position, laptime, condition))
+        result = engine.deltas()
+        for name, value in expected.items():
+            assert abs(value - result[name]) <= 1e-6, f"round {round_index}: {name} mismatch"
+
+
+if __name__ == "__main__":
+    test_delta_reference()
+    test_delta_engine()
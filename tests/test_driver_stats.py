@@ -0,0 +1,100 @@
+import json
+import random
+import sys
+import tempfile
+from dataclasses import astuple
+
+sys.path.append(".")
+
+
+def test_driver_stats(rounds: int = 200, seed: int = 0):
+    """Driver stats test, legacy import & increment upsert vs dict update"""
+    from tinypedal.userfile.driver_stats import (
+        DriverStats,
+        load_driver_stats,
+        save_driver_stats,
+    )
+
+    rng = random.Random(seed)
+    tracks = [f"Track {index}" for index in range(5)]
+    vehicles = [f"Vehicle {index}" for index in range(8)]
+    with tempfile.TemporaryDirectory() as temp_path:
+        filepath = f"{temp_path}/"
+        # Legacy stats, with invalid value type & unknown key
+        expected = {
+            "Track 0": {"Vehicle 0": {"pb": 100.5, "meters": "1000", "valid": 3, "unknown": 1}},
+            "Track 1": {"Vehicle 1": {"pb": None, "races": 2}},
+        }
+        with open(f"{filepath}driver.stats", "w", encoding="utf-8") as jsonfile:
+            json.dump(expected, jsonfile)
+        expected = {
+            ("Track 0", "Vehicle 0"): DriverStats(pb=100.5, meters=1000.0, valid=3),
+            ("Track 1", "Vehicle 1"): DriverStats(races=2),
+        }
+        for _ in range(rounds):
+            key_list = (rng.choice(tracks), rng.choice(vehicles))
+            update = DriverStats(
+                pb=rng.uniform(90, 110),
+                meters=rng.uniform(0, 5000),
+                valid=rng.randint(0, 5),
+                wins=rng.randint(0, 1),
+            )
+            save_driver_stats(key_list, update, filepath)
+            stats = expected.setdefault(key_list, DriverStats())
+            stats.pb = min(stats.pb, update.pb)
+            stats.meters += update.meters
+            stats.valid += update.valid
+            stats.wins += update.wins
+        for key_list, stats in expected.items():
+            result = load_driver_stats(key_list, filepath)
+            for expected_value, result_value in zip(astuple(stats), astuple(result)):
+                assert abs(expected_value - result_value) <= 1e-6, f"{key_list}: {stats} != {result}"
+
+
+def test_driver_stats_query():
+    """Driver stats test, paged & sorted query"""
+    from tinypedal.userfile.driver_stats import (
+        DriverStats,
+        count_stats_vehicles,
+        delete_stats,
+        query_stats_tracks,
+        query_stats_vehicles,
+        reset_stats_value,
+        save_driver_stats,
+    )
+
+    rng = random.Random(1)
+    with tempfile.TemporaryDirectory() as temp_path:
+        filepath = f"{temp_path}/"
+        pb_list = {}
+        for index in range(250):
+            vehicle = f"vehicle {index:03d}"
+            pb_list[vehicle] = round(rng.uniform(90, 110), 3)
+            save_driver_stats(("track", vehicle), DriverStats(pb=pb_list[vehicle]), filepath)
+        save_driver_stats(("Another track", "vehicle"), DriverStats(), filepath)
+        assert query_stats_tracks(filepath) == ("Another track", "track")
+        assert count_stats_vehicles(filepath, "track") == 250
+        expected = sorted(pb_list, key=pb_list.get, reverse=True)
+        result = []
+        for offset in range(0, 250, 100):
+            result.extend(vehicle for vehicle, _ in query_stats_vehicles(
+                filepath, "track", order_by="pb", descending=True, limit=100, offset=offset))
+        assert result == expected, "paged query order mismatch"
+        reset_stats_value(filepath, "track", expected[0], "pb")
+        delete_stats(filepath, "track", expected[1])
+        delete_stats(filepath, "Another track")
+        assert count_stats_vehicles(filepath, "track") == 249
+        assert query_stats_tracks(filepath) == ("track",)
+        result = query_stats_vehicles(filepath, "track", order_by="pb", limit=1)
+        assert result[0][0] == expected[-1], "fastest vehicle mismatch after reset"
+        try:
+            query_stats_vehicles(filepath, "track", order_by="pb; DROP TABLE driver_stats")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("invalid sort key accepted")
+
+
+if __name__ == "__main__":
+    test_driver_stats()
+    test_driver_stats_query()
@@ -0,0 +1,49 @@
+import random
+import struct
+import sys
+
+sys.path.append(".")
+
+
+def read_field(payload: bytes, field: dict):
+    """Read field from payload using schema description only"""
+    values = struct.unpack_from(f"<{field['count']}{field['type']}", payload, field["offset"])
+    return values[0] if field["count"] == 1 else list(values)
+
+
+def test_export_layout(rounds: int = 500, seed: int = 0):
+    """Export layout test, values read back through schema match minfo"""
+    from tinypedal.module.module_export import EXPORT_GROUPS, create_layout
+    from tinypedal.module_info import minfo
+
+    rng = random.Random(seed)
+    mcfg = {f"enable_{group}_export": True for group in EXPORT_GROUPS}
+    layout = create_layout(mcfg)
+    fields = {field["name"]: field for field in layout.schema["fields"]}
+    for round_index in range(rounds):
+        minfo.delta.deltaBest = rng.uniform(-10, 10)
+        minfo.delta.isValidLap = rng.random() < 0.5
+        minfo.fuel.amountCurrent = rng.uniform(0, 100)
+        minfo.energy.estimatedLaps = rng.uniform(0, 30)
+        relative = [(rng.uniform(-60, 60), rng.randrange(-1, 128)) for _ in range(rng.randint(1, 40))]
+        minfo.relative.relative = relative
+        minfo.relative.standings = [rng.randrange(128) for _ in range(rng.randint(1, 128))]
+        payload = layout.pack(minfo)
+        expected = {
+            "delta.deltaBest": minfo.delta.deltaBest,
+            "delta.isValidLap": minfo.delta.isValidLap,
+            "fuel.amountCurrent": minfo.fuel.amountCurrent,
+            "energy.estimatedLaps": minfo.energy.estimatedLaps,
+            "relative.relativeCount": len(relative),
+            "relative.standingsCount": len(minfo.relative.standings),
+        }
+        for name, value in expected.items():
+            assert read_field(payload, fields[name]) == value, f"round {round_index}: {name} mismatch"
+        indexes = read_field(payload, fields["relative.relativeIndex"])
+        assert indexes[:len(relative)] == [entry[1] for entry in relative], (
+            f"round {round_index}: relative index mismatch")
+        assert not set(indexes[len(relative):]) - {-1}, f"round {round_index}: relative padding mismatch"
+
+
+if __name__ == "__main__":
+    test_export_layout()
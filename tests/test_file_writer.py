@@ -0,0 +1,58 @@
+import os
+import sys
+import tempfile
+import threading
+
+sys.path.append(".")
+
+
+def test_file_writer():
+    """File writer test, ordering, coalescing & waiting"""
+    from tinypedal.file_writer import FileWriter
+
+    writer = FileWriter()
+    written = []
+    blocker = threading.Event()
+
+    writer.submit("block", blocker.wait)  # hold writer thread
+    for value in range(10):
+        writer.submit("coalesced", lambda value=value: written.append(("coalesced", value)))
+        writer.submit("queued", lambda value=value: written.append(("queued", value)), coalesce=False)
+    writer.submit("other", lambda: written.append(("other", 0)))
+    assert not writer.wait("coalesced", timeout=0.1), "wait returned before pending task finished"
+    blocker.set()
+    assert writer.wait("coalesced", timeout=5), "wait timeout"
+    assert ("coalesced", 9) in written, "pending task not finished"
+    assert writer.flush(timeout=5)
+    expected = [("coalesced", 9)] + [("queued", value) for value in range(10)] + [("other", 0)]
+    assert written == expected
+    # Failed task should not stop writer
+    writer.submit("error", lambda: 1 / 0)
+    writer.submit("after", lambda: written.append(("after", 0)))
+    assert writer.flush(timeout=5), "failed task stopped writer"
+    assert written[-1] == ("after", 0)
+    assert not writer.pending()
+
+
+def test_atomic_open():
+    """Atomic open test, target file untouched if writing failed"""
+    from tinypedal.file_writer import atomic_open
+
+    with tempfile.TemporaryDirectory() as temp_path:
+        filename_full = os.path.join(temp_path, "test.txt")
+        with atomic_open(filename_full, "w", encoding="utf-8") as temp_file:
+            temp_file.write("old")
+        try:
+            with atomic_open(filename_full, "w", encoding="utf-8") as temp_file:
+                temp_file.write("new")
+                raise OSError
+        except OSError:
+            pass
+        with open(filename_full, encoding="utf-8") as file:
+            assert file.read() == "old", "target file modified"
+        assert os.listdir(temp_path) == ["test.txt"], "temporary file not removed"
+
+
+if __name__ == "__main__":
+    test_file_writer()
+    test_atomic_open()
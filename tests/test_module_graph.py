@@ -0,0 +1,23 @@
+import sys
+
+sys.path.append(".")
+
+
+def test_module_graph():
+    """Module dependency graph test, check declared minfo fields & run order"""
+    from tinypedal import module
+    from tinypedal.module_control import create_module_pack
+    from tinypedal.module_graph import ModuleGraph
+    from tinypedal.module_info import minfo
+
+    graph = ModuleGraph(create_module_pack(module), minfo)
+    assert not graph.errors, graph.errors
+    # Producers must run before consumers
+    for name, dependencies in graph.dependencies.items():
+        for producer in dependencies:
+            assert graph.order.index(producer) < graph.order.index(name), (
+                f"{producer} runs after {name}")
+
+
+if __name__ == "__main__":
+    test_module_graph()
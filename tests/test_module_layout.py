@@ -0,0 +1,136 @@
+import os
+import random
+import sys
+from collections import deque
+from types import MappingProxyType
+
+sys.path.append(".")
+
+
+def same_value(source, target) -> bool:
+    """Compare values and types, recursively for slots objects & containers
+
+    Nested list & tuple items (such as relative list entries) are interchangeable.
+    """
+    if type(source) is not type(target) and not (
+        type(source) in (list, tuple) and type(target) in (list, tuple)
+    ):
+        return False
+    if hasattr(type(source), "__slots__") and not isinstance(source, tuple):
+        return all(
+            same_field(getattr(source, name), getattr(target, name))
+            for name in type(source).__slots__
+        )
+    if isinstance(source, (list, tuple, deque)):
+        return len(source) == len(target) and all(map(same_value, source, target))
+    if isinstance(source, (dict, MappingProxyType)):
+        return source.keys() == target.keys() and all(
+            same_field(source[key], target[key]) for key in source)
+    return source == target
+
+
+def same_field(source, target) -> bool:
+    """Compare field value, field type must match"""
+    return type(source) is type(target) and same_value(source, target)
+
+
+def round_trip(group_name: str, source) -> tuple:
+    """Encode source group, decode into default group"""
+    from tinypedal.module_layout import GroupLayout, GroupReader, GroupWriter
+
+    layout = GroupLayout(group_name, type(source)())
+    writer = GroupWriter(layout)
+    reader = GroupReader(layout)
+    target = type(source)()
+    payload = writer.update(source)
+    assert payload is not None and len(payload) <= layout.size, f"{group_name}: payload size"
+    reader.update(target, payload)
+    return layout, writer, reader, target
+
+
+def test_default_groups():
+    """Default minfo groups round trip"""
+    from tinypedal.module_info import ModuleInfo
+
+    info = ModuleInfo()
+    for group_name in type(info).__slots__:
+        source = getattr(info, group_name)
+        target = round_trip(group_name, source)[3]
+        assert same_value(source, target), f"{group_name}: default values mismatch"
+
+
+def test_changed_groups():
+    """Changed minfo groups round trip, keep int/float/bool types"""
+    from tinypedal.module_info import ConsumptionDataSet, ModuleInfo, WeatherNode
+
+    rng = random.Random(1)
+    info = ModuleInfo()
+    for index, data in enumerate(info.vehicles.dataSet[:60]):
+        data.driverName = f"Driver {index} ü"
+        data.gapBehindNext = 2 if index % 5 == 0 else rng.random() * 10  # int = laps
+        data.inPit = index % 7
+        data.isPlayer = index == 3
+        data.pitTimer.pitting = index % 2 == 0
+        data.pitTimer.elapsed = rng.random()
+        data.lapTimeHistory[index % 6] = rng.random() * 100
+    info.vehicles.totalVehicles = 60
+    info.delta.deltaBestData = tuple((rng.random(), rng.random()) for _ in range(500))
+    info.delta.deltaBest = -0.25
+    info.mapping.coordinates = tuple((rng.random(), rng.random()) for _ in range(2000))
+    info.mapping.sectors = (100, 200)
+    info.history.consumptionDataSet.appendleft(ConsumptionDataSet(3, 1, 90.5, 2.5))
+    info.pacenotes.currentNote = MappingProxyType({"distance": 120.5, "pacenote": "3 left"})
+    info.relative.relative = [[3, 1, 0.5], [-1]]
+    info.relative.classes = [[0, 1, "GT3", 90.5, 2, -1, 3, True]]
+    info.restapi.forecastRace = [WeatherNode(0.0, 1, 20.5, 0.1)] * 5
+    info.restapi.stintVirtualEnergy = {"Driver 2": (50.0, 2.5, 3.0)}
+    info.history.consumptionDataVersion = 3132179846742510857  # 64-bit hash
+    info.vehicles.dataSetVersion = -(2**63)
+
+    for group_name in type(info).__slots__:
+        source = getattr(info, group_name)
+        target = round_trip(group_name, source)[3]
+        assert same_value(source, target), f"{group_name}: changed values mismatch"
+
+
+def test_changed_fields_only():
+    """Only changed units are decoded, unchanged group writes nothing"""
+    from tinypedal.module_info import VehiclesInfo
+
+    source = VehiclesInfo()
+    _, writer, reader, target = round_trip("vehicles", source)
+    assert writer.update(source) is None, "unchanged group: payload written"
+
+    source.dataSet[10].gapBehindLeader = 1
+    assert reader.update(target, writer.update(source)) == 1, "decoded units not 1"
+    assert target.dataSet[10].gapBehindLeader == 1, "changed field not decoded"
+    assert type(target.dataSet[10].gapBehindLeader) is int, "int gap decoded as float"
+
+    source.dataSet[10].gapBehindLeader = 1.0
+    assert reader.update(target, writer.update(source)) == 1, "type change not decoded"
+    assert type(target.dataSet[10].gapBehindLeader) is float, "float gap decoded as int"
+
+
+def test_malformed_payload():
+    """Malformed payload never raises"""
+    from tinypedal.module_info import DeltaInfo, VehiclesInfo
+
+    for group_name, source in (("delta", DeltaInfo()), ("vehicles", VehiclesInfo())):
+        layout, writer, reader, target = round_trip(group_name, source)
+        payload = writer.update(type(source)()) or b""
+        rng = random.Random(2)
+        for _ in range(200):
+            size = rng.randrange(0, layout.size + 64)
+            reader.update(target, os.urandom(min(size, 4096)))
+            if payload:
+                broken = bytearray(payload)
+                broken[rng.randrange(len(broken))] ^= 0xFF
+                reader.update(target, bytes(broken))
+        assert same_value(source, round_trip(group_name, source)[3]), "reader broken"
+
+
+if __name__ == "__main__":
+    test_default_groups()
+    test_changed_groups()
+    test_changed_fields_only()
+    test_malformed_payload()
@@ -0,0 +1,183 @@
+import random
+import sys
+
+sys.path.append(".")
+
+CLASS_NAMES = ("Hypercar", "LMP2", "LMGT3", "GTE", "LMP3")
+
+
+class FakeVehicle:
+    """Fake vehicle reader"""
+
+    def __init__(self, grid):
+        self.grid = grid
+
+    def in_garage(self, index):
+        return self.grid["in_garage"][index]
+
+    def in_pits(self, index):
+        return self.grid["in_pits"][index]
+
+    def class_name(self, index):
+        return self.grid["class_names"][index]
+
+    def place(self, index):
+        return self.grid["places"][index]
+
+    def in_garage_column(self):
+        return self.grid["in_garage"]
+
+    def in_pits_column(self):
+        return self.grid["in_pits"]
+
+    def class_name_column(self):
+        return self.grid["class_names"]
+
+    def place_column(self):
+        return self.grid["places"]
+
+
+class FakeTiming:
+    """Fake timing reader"""
+
+    def __init__(self, grid):
+        self.grid = grid
+
+    def estimated_laptime(self):
+        return self.grid["laptime_est"]
+
+    def estimated_time_into(self, index=None):
+        if index is None:
+            return self.grid["plr_time"]
+        return self.grid["time_into"][index]
+
+    def best_laptime(self, index):
+        return self.grid["laptime_best"][index]
+
+    def last_laptime(self, index):
+        return self.grid["laptime_last"][index]
+
+    def estimated_time_into_column(self):
+        return self.grid["time_into"]
+
+    def best_laptime_column(self):
+        return self.grid["laptime_best"]
+
+    def last_laptime_column(self):
+        return self.grid["laptime_last"]
+
+
+class FakeRead:
+    """Fake API reader"""
+
+    def __init__(self, grid):
+        self.vehicle = FakeVehicle(grid)
+        self.timing = FakeTiming(grid)
+
+
+class FakeAPI:
+    """Fake API"""
+
+    def __init__(self, grid):
+        self.read = FakeRead(grid)
+
+
+def random_grid(rng: random.Random, veh_total: int, num_classes: int):
+    """Generate random multiclass grid, with ties & invalid laptimes"""
+    laptime_est = rng.choice((0.0, 90.0, 123.456, 210.5))
+    places = list(range(1, veh_total + 1))
+    rng.shuffle(places)
+    if veh_total > 2 and rng.random() < 0.2:
+        places[rng.randrange(veh_total)] = 1  # duplicated leader
+    time_into = [round(rng.uniform(-5, 250), rng.choice((0, 1, 3))) for _ in range(veh_total)]
+    return {
+        "laptime_est": laptime_est,
+        "plr_time": rng.choice(time_into) if rng.random() < 0.3 else rng.uniform(0, 250),
+        "in_garage": [rng.random() < 0.1 for _ in range(veh_total)],
+        "in_pits": [rng.random() < 0.15 for _ in range(veh_total)],
+        "time_into": time_into,
+        "class_names": [rng.choice(CLASS_NAMES[:num_classes]) for _ in range(veh_total)],
+        "places": places,
+        "laptime_best": [rng.choice((0.0, -1.0, 95.5, rng.uniform(80, 130))) for _ in range(veh_total)],
+        "laptime_last": [rng.choice((0.0, 96.0, rng.uniform(80, 130))) for _ in range(veh_total)],
+    }
+
+
+def run_default_engine(module, grid, plr_index, show_in_garage):
+    """Run default python engine, copy output from reused temp lists"""
+    module.api = FakeAPI(grid)
+    veh_total = len(grid["places"])
+    relative_ahead, relative_behind, classes_list, draw_order, is_multi_class = module.get_vehicles_info(
+        veh_total, plr_index, show_in_garage)
+    class_pos_list, plr_class_name, plr_class_place = module.create_position_in_class(
+        classes_list, plr_index)
+    return (
+        [list(row) for row in relative_ahead],
+        [list(row) for row in relative_behind],
+        [list(row) for row in classes_list],
+        list(draw_order),
+        is_multi_class,
+        [list(row) for row in class_pos_list],
+        plr_class_name,
+        plr_class_place,
+    )
+
+
+def run_array_engine(module, grid, plr_index, show_in_garage):
+    """Run array engine"""
+    module.api = FakeAPI(grid)
+    return module.compute_vehicles_info_array(
+        plr_index, show_in_garage, *module.gather_vehicles_data())
+
+
+def compare_engines(module, grid, array_grid, plr_index, show_in_garage, round_index):
+    """Compare array engine output against default engine output"""
+    expected = run_default_engine(module, grid, plr_index, show_in_garage)
+    result = run_array_engine(module, array_grid, plr_index, show_in_garage)
+    for name, value_expected, value_result in zip(
+        ("relative_ahead", "relative_behind", "classes", "draw_order", "is_multi_class",
+         "class_pos", "plr_class_name", "plr_class_place"), expected, result):
+        assert value_result == value_expected, f"round {round_index}: {name} mismatch"
+
+
+def test_relative_engine(rounds: int = 2000, seed: int = 0):
+    """Relative engine equivalence test, array engine vs default engine"""
+    from tinypedal.module import module_relative
+
+    rng = random.Random(seed)
+    original_api = module_relative.api
+    try:
+        for round_index in range(rounds):
+            veh_total = rng.randint(1, 80)
+            grid = random_grid(rng, veh_total, rng.randint(1, len(CLASS_NAMES)))
+            plr_index = rng.choice((rng.randrange(veh_total), -1))
+            show_in_garage = rng.random() < 0.5
+            compare_engines(module_relative, grid, grid, plr_index, show_in_garage, round_index)
+    finally:
+        module_relative.api = original_api
+
+
+def test_relative_engine_empty():
+    """Relative engine equivalence test, no vehicle, default engine reads zeroed vehicle"""
+    from tinypedal.module import module_relative
+
+    original_api = module_relative.api
+    try:
+        for laptime_est in (0.0, 90.0):
+            empty_grid = random_grid(random.Random(0), 0, 1)
+            empty_grid["laptime_est"] = laptime_est
+            zeroed_grid = dict(empty_grid)
+            zeroed_grid.update(
+                in_garage=[False], in_pits=[False], time_into=[0.0], class_names=[""],
+                places=[0], laptime_best=[0.0], laptime_last=[0.0])
+            for plr_index in (0, -1):
+                for show_in_garage in (True, False):
+                    compare_engines(module_relative, zeroed_grid, empty_grid,
+                        plr_index, show_in_garage, "empty")
+    finally:
+        module_relative.api = original_api
+
+
+if __name__ == "__main__":
+    test_relative_engine()
+    test_relative_engine_empty()
@@ -0,0 +1,53 @@
+import multiprocessing
+import os
+import sys
+
+sys.path.append(".")
+
+
+def write_payloads(name: str, rounds: int):
+    """Writer process, payload is repeated byte of round index"""
+    from tinypedal.shared_block import SharedBlock
+
+    block = SharedBlock(name)
+    for index in range(1, rounds + 1):
+        block.write(bytes((index % 256,)) * (1 + index % 4096))
+    block.close()
+
+
+def test_shared_block(rounds: int = 500000):
+    """Shared block test, reader never sees torn payload"""
+    from tinypedal.shared_block import SharedBlock
+
+    name = f"tinypedal_test_{os.getpid()}"
+    block = SharedBlock(name, 4096, create=True, layout_id=1)
+    try:
+        assert block.read() is None, "empty block: payload not None"
+        assert not block.write(bytes(4097)), "oversized payload: write not rejected"
+        try:
+            SharedBlock(name, layout_id=2)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("layout mismatch: not rejected")
+
+        context = multiprocessing.get_context("spawn")
+        writer = context.Process(target=write_payloads, args=(name, rounds))
+        writer.start()
+        reads = 0
+        while writer.is_alive():
+            payload = block.read(block.sequence)
+            if payload is None:
+                continue
+            reads += 1
+            assert payload.count(payload[0]) == len(payload), f"torn payload: size {len(payload)}"
+            assert (len(payload) - 1) % 256 == payload[0], f"torn payload: size {len(payload)}"
+        writer.join()
+        assert writer.exitcode == 0 and reads, "writer failed or no payload read"
+        assert block.read(-1) == bytes((rounds % 256,)) * (1 + rounds % 4096), "last payload mismatch"
+    finally:
+        block.close()
+
+
+if __name__ == "__main__":
+    test_shared_block()
@@ -0,0 +1,103 @@
+import ctypes
+import random
+import sys
+
+sys.path.append(".")
+
+CLASS_NAMES = (b"Hypercar", b"LMP2", b"LMGT3", "GTÉ".encode(), b"")
+
+
+class FakeScoringInfo(ctypes.Structure):
+    """Fake scoring info, rF2 layout subset"""
+
+    _pack_ = 4
+    _fields_ = [
+        ("mTrackName", ctypes.c_char * 64),
+        ("mNumVehicles", ctypes.c_int),
+    ]
+
+
+class FakeVehicleScoring(ctypes.Structure):
+    """Fake vehicle scoring, rF2 layout subset"""
+
+    _pack_ = 4
+    _fields_ = [
+        ("mID", ctypes.c_int),
+        ("mVehicleClass", ctypes.c_char * 32),
+        ("mPlace", ctypes.c_ubyte),
+        ("mInPits", ctypes.c_bool),
+        ("mInGarageStall", ctypes.c_bool),
+        ("mTimeIntoLap", ctypes.c_double),
+        ("mBestLapTime", ctypes.c_double),
+        ("mLastLapTime", ctypes.c_double),
+    ]
+
+
+class FakeScoring(ctypes.Structure):
+    """Fake scoring, rF2 layout subset"""
+
+    _pack_ = 4
+    _fields_ = [
+        ("mScoringInfo", FakeScoringInfo),
+        ("mVehicles", FakeVehicleScoring * 128),
+    ]
+
+
+class FakeSource:
+    """Fake mmap source"""
+
+    def __init__(self, data):
+        self.data = data
+
+
+def random_scoring(rng: random.Random) -> FakeScoring:
+    """Generate random scoring data, with invalid values & garbage after null terminator"""
+    data = FakeScoring()
+    data.mScoringInfo.mNumVehicles = rng.randint(0, 128)
+    for index, veh_info in enumerate(data.mVehicles):
+        veh_info.mID = index
+        raw_name = rng.choice(CLASS_NAMES)
+        name_buffer = (raw_name + b"\0" + bytes(rng.randrange(1, 256) for _ in range(8)))[:32]
+        ctypes.memmove(ctypes.addressof(veh_info) + FakeVehicleScoring.mVehicleClass.offset,
+                       name_buffer, len(name_buffer))
+        veh_info.mPlace = rng.randint(1, 128)
+        veh_info.mInPits = rng.random() < 0.2
+        veh_info.mInGarageStall = rng.random() < 0.1
+        veh_info.mTimeIntoLap = rng.choice((rng.uniform(0, 200), float("nan")))
+        veh_info.mBestLapTime = rng.choice((rng.uniform(-1, 200), float("inf")))
+        veh_info.mLastLapTime = rng.choice((rng.uniform(-1, 200), -float("inf")))
+    return data
+
+
+def test_vehicle_arrays(rounds: int = 50, seed: int = 0):
+    """Vehicle arrays test, array columns vs per-vehicle ctypes values"""
+    from tinypedal.adapter.rf2_numpy import VehicleArrays, numpy_available
+    from tinypedal.validator import bytes_to_str as tostr
+    from tinypedal.validator import infnan_to_zero as rmnan
+
+    rng = random.Random(seed)
+    for _ in range(rounds):
+        source = FakeSource(random_scoring(rng))
+        total = source.data.mScoringInfo.mNumVehicles
+        vehicles = source.data.mVehicles[:total]
+        indexes = list(range(128))
+        rng.shuffle(indexes)
+        for use_numpy in (True, False):
+            arrays = VehicleArrays(source)
+            assert arrays.use_numpy == numpy_available()
+            arrays.use_numpy = use_numpy and arrays.use_numpy
+            assert arrays.total() == total
+            for name in ("mID", "mPlace", "mInPits", "mInGarageStall"):
+                expected = [getattr(veh_info, name) for veh_info in vehicles]
+                assert list(arrays.column(name)) == expected, name
+                expected = [getattr(source.data.mVehicles[index], name) for index in indexes[:total]]
+                assert list(arrays.column(name, indexes)) == expected, name
+            for name in ("mTimeIntoLap", "mBestLapTime", "mLastLapTime"):
+                expected = [rmnan(getattr(veh_info, name)) for veh_info in vehicles]
+                assert list(arrays.finite_column(name)) == expected, name
+            expected = [tostr(veh_info.mVehicleClass) for veh_info in vehicles]
+            assert arrays.text_column("mVehicleClass") == expected
+
+
+if __name__ == "__main__":
+    test_vehicle_arrays()
@@ -0,0 +1,126 @@
+import math
+import random
+import sys
+
+sys.path.append(".")
+
+
+def random_session(rng: random.Random, veh_total: int):
+    """Generate random vehicle kinematics columns"""
+    track_length = rng.choice((0.0, 3500.0, 13626.0))
+    lap_distance = [rng.uniform(-10, track_length + 10) for _ in range(veh_total)]
+    laps_completed = [rng.randint(0, 5) for _ in range(veh_total)]
+    lap_progress = [
+        0 if track_length < 1 else min(max(dist / track_length, 0), 1) for dist in lap_distance]
+    plr_index = rng.randrange(veh_total) if rng.random() < 0.9 else -1
+    speed = [rng.choice((0.0, 5.0, rng.uniform(0, 90))) for _ in range(veh_total)]
+    return {
+        "is_player": [index == plr_index for index in range(veh_total)],
+        "lap_distance": lap_distance,
+        "lap_progress_total": [laps + prog for laps, prog in zip(laps_completed, lap_progress)],
+        "time_into": [rng.uniform(-5, 130) for _ in range(veh_total)],
+        "speed": speed,
+        "in_pit": [rng.choice((0, 0, 0, 1, 2)) for _ in range(veh_total)],
+        "pos_x": [rng.uniform(-2000, 2000) for _ in range(veh_total)],
+        "pos_y": [rng.uniform(-2000, 2000) for _ in range(veh_total)],
+        "ori_yaw": [rng.uniform(-math.pi, math.pi) for _ in range(veh_total)],
+        "plr_pos_x": rng.uniform(-2000, 2000),
+        "plr_pos_y": rng.uniform(-2000, 2000),
+        "plr_ori_yaw": rng.uniform(-math.pi, math.pi),
+        "plr_lap_distance": rng.uniform(0, track_length),
+        "plr_lap_progress_total": rng.uniform(0, 6),
+        "plr_laptime_est": rng.choice((0.0, 95.0, 123.4)),
+        "plr_timeinto_est": rng.uniform(0, 125),
+        "track_length": track_length,
+        "in_race": rng.random() < 0.7,
+        "max_lap_diff_ahead": 0.9,
+        "max_lap_diff_behind": 0.9,
+    }
+
+
+def run_reference(calc, MAX_METERS, MAX_SECONDS, s):
+    """Per-vehicle reference calculation, same as original update loop"""
+    veh_total = len(s["is_player"])
+    rel_ori = [0.0] * veh_total
+    rel_pos_x = [0.0] * veh_total
+    rel_pos_y = [0.0] * veh_total
+    rel_distance = [0.0] * veh_total
+    is_lapped = [0] * veh_total
+    is_yellow = [False] * veh_total
+    nearest_line = MAX_METERS
+    nearest_time_behind = -MAX_SECONDS
+    nearest_yellow = MAX_METERS
+    for index in range(veh_total):
+        is_yellow[index] = s["speed"][index] < 8
+        if s["is_player"][index]:
+            if is_yellow[index]:
+                nearest_yellow = 0.0
+            continue
+        pos_x = s["pos_x"][index]
+        pos_y = s["pos_y"][index]
+        rel_ori[index] = s["ori_yaw"][index] - s["plr_ori_yaw"]
+        rel_pos_x[index], rel_pos_y[index] = calc.rotate_coordinate(
+            s["plr_ori_yaw"] - 3.14159265, pos_x - s["plr_pos_x"], pos_y - s["plr_pos_y"])
+        rel_distance[index] = calc.distance((s["plr_pos_x"], s["plr_pos_y"]), (pos_x, pos_y))
+        is_lapped[index] = calc.lap_difference(
+            s["lap_progress_total"][index], s["plr_lap_progress_total"],
+            s["max_lap_diff_ahead"], s["max_lap_diff_behind"]) if s["in_race"] else 0
+        if nearest_line > rel_distance[index]:
+            nearest_line = rel_distance[index]
+        if not s["in_pit"][index]:
+            opt_time_behind = calc.circular_relative_distance(
+                s["plr_laptime_est"], s["plr_timeinto_est"], s["time_into"][index])
+            if 0 > opt_time_behind > nearest_time_behind:
+                nearest_time_behind = opt_time_behind
+        if is_yellow[index] and nearest_yellow > 0:
+            opt_rel_distance = abs(calc.circular_relative_distance(
+                s["track_length"], s["plr_lap_distance"], s["lap_distance"][index]))
+            if nearest_yellow > opt_rel_distance:
+                nearest_yellow = opt_rel_distance
+    return (
+        rel_ori, rel_pos_x, rel_pos_y, rel_distance, is_lapped, is_yellow,
+        nearest_line, nearest_time_behind, nearest_yellow,
+    )
+
+
+def mask_player(output, opponents):
+    """Drop player row from per-vehicle lists, player row is not used"""
+    columns = [
+        [value for value, is_opponent in zip(column, opponents) if is_opponent]
+        for column in output[:5]
+    ]
+    columns.append(list(output[5]))
+    columns.extend(output[6:])
+    return columns
+
+
+def is_close(expected, result):
+    """Compare nested output with float tolerance"""
+    if isinstance(expected, (list, tuple)):
+        return len(expected) == len(result) and all(map(is_close, expected, result))
+    return math.isclose(expected, result, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def test_vehicle_kinematics(rounds: int = 2000, seed: int = 0):
+    """Vehicle kinematics batch calculation test, against per-vehicle reference"""
+    from tinypedal import calculation as calc
+    from tinypedal.const_common import MAX_METERS, MAX_SECONDS
+    from tinypedal.module import module_vehicles
+
+    engines = [module_vehicles.calc_vehicles_kinematics]
+    if module_vehicles.np is not None:
+        engines.append(module_vehicles.calc_vehicles_kinematics_array)
+
+    rng = random.Random(seed)
+    for round_index in range(rounds):
+        session = random_session(rng, rng.randint(1, 104))
+        expected = run_reference(calc, MAX_METERS, MAX_SECONDS, session)
+        opponents = [not is_player for is_player in session["is_player"]]
+        for engine in engines:
+            result = engine(**session)
+            assert is_close(mask_player(expected, opponents), mask_player(result, opponents)), (
+                f"round {round_index}: mismatch in {engine.__name__}")
+
+
+if __name__ == "__main__":
+    test_vehicle_kinematics()
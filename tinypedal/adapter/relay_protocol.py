@@ -0,0 +1,507 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Remote relay wire protocol
+
+Message layout (version 2):
+    message header: magic (uint8), protocol version (uint8), codec id (uint8)
+    segment header: type id (uint8), flags (uint8), sequence (uint32), payload length (uint32)
+    segment payload: compressed keyframe or XOR delta
+
+Version 1 message header has no codec id, payload is always zlib compressed.
+
+Sparse segment data (before delta & compression):
+    sparse header: number of entries (uint16), head size (uint32)
+    entry indexes (uint8 per entry), head data, entry data, tail data
+
+Legacy (version 0) messages have no message header,
+each segment is: type id (uint8), payload length (uint32), zlib compressed payload.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import logging
+import struct
+import zlib
+from time import perf_counter
+from typing import Callable, Iterator, Sequence
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+RELAY_MAGIC = 0xA5
+RELAY_VERSION = 2
+
+CODEC_RAW = 0x00
+CODEC_ZLIB = 0x01
+CODEC_LZ4 = 0x02
+CODEC_ZSTD = 0x03
+CODEC_IDS = {
+    "none": CODEC_RAW,
+    "zlib": CODEC_ZLIB,
+    "lz4": CODEC_LZ4,
+    "zstd": CODEC_ZSTD,
+}
+
+FLAG_KEYFRAME = 0x01
+FLAG_DELTA = 0x02
+FLAG_SPARSE = 0x04
+
+MAX_SEQUENCE = 0xFFFFFFFF
+SCHEDULE_TOLERANCE = 0.002  # seconds, batch segments due at nearly same time
+
+MESSAGE_HEADER = struct.Struct("!BBB")  # magic, version, codec id
+MESSAGE_HEADER_V1 = struct.Struct("!BB")  # magic, version
+SEGMENT_HEADER = struct.Struct("!BBII")  # type id, flags, sequence, length
+LEGACY_SEGMENT_HEADER = struct.Struct("!BI")  # type id, length
+SPARSE_HEADER = struct.Struct("!HI")  # number of entries, head size
+
+
+def xor_bytes(data: bytes, base: bytes) -> bytes:
+    """XOR two equal length byte buffers
+
+    Unchanged bytes result in zero, which compresses to almost nothing.
+    Applying the same operation to the delta and base restores data.
+    """
+    return (
+        int.from_bytes(data, "little") ^ int.from_bytes(base, "little")
+    ).to_bytes(len(data), "little")
+
+
+def next_sequence(sequence: int) -> int:
+    """Next segment sequence number, wrap around at uint32 limit"""
+    return sequence + 1 if sequence < MAX_SEQUENCE else 1
+
+
+def available_codecs() -> tuple[str, ...]:
+    """Codec names available on this system"""
+    return tuple(name for name, codec_id in CODEC_IDS.items() if get_decompressor(codec_id))
+
+
+def get_compressor(codec_id: int, level: int = 6) -> Callable[[bytes], bytes] | None:
+    """Get compress function, or None if codec is not available
+
+    Args:
+        codec_id: Codec id.
+        level: Compression level, ignored by raw codec.
+    """
+    if codec_id == CODEC_RAW:
+        return bytes
+    if codec_id == CODEC_ZLIB:
+        level = min(max(level, 1), 9)
+        return lambda data: zlib.compress(data, level)
+    if codec_id == CODEC_LZ4 and lz4_frame is not None:
+        return lambda data: lz4_frame.compress(data, compression_level=level)
+    if codec_id == CODEC_ZSTD and zstandard is not None:
+        return zstandard.ZstdCompressor(level=level).compress
+    return None
+
+
+def get_decompressor(codec_id: int) -> Callable[[bytes], bytes] | None:
+    """Get decompress function, or None if codec is not available"""
+    if codec_id == CODEC_RAW:
+        return bytes
+    if codec_id == CODEC_ZLIB:
+        return zlib.decompress
+    if codec_id == CODEC_LZ4 and lz4_frame is not None:
+        return lz4_frame.decompress
+    if codec_id == CODEC_ZSTD and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompress
+    return None
+
+
+def is_relay_message(msg: bytes) -> bool:
+    """Check if message uses versioned relay protocol"""
+    return len(msg) >= MESSAGE_HEADER_V1.size and msg[0] == RELAY_MAGIC
+
+
+def message_codec(msg: bytes) -> int:
+    """Get codec id from versioned message header"""
+    if msg[1] == 1:
+        return CODEC_ZLIB
+    if len(msg) < MESSAGE_HEADER.size:
+        raise ValueError("Invalid message header")
+    return msg[2]
+
+
+def pack_message(segments: list[bytes], codec_id: int = CODEC_ZLIB) -> bytes:
+    """Pack encoded segments into versioned message"""
+    return MESSAGE_HEADER.pack(RELAY_MAGIC, RELAY_VERSION, codec_id) + b"".join(segments)
+
+
+def unpack_message(msg: bytes) -> Iterator[tuple[int, int, int, bytes]]:
+    """Unpack versioned message
+
+    Yields:
+        Type id, flags, sequence, decompressed payload.
+
+    Raises:
+        ValueError: if protocol version or codec is not supported.
+    """
+    version = msg[1]
+    if version == 1:
+        offset = MESSAGE_HEADER_V1.size
+    elif version == RELAY_VERSION:
+        offset = MESSAGE_HEADER.size
+    else:
+        raise ValueError(f"Unsupported relay protocol version {version}")
+    codec_id = message_codec(msg)
+    decompress = get_decompressor(codec_id)
+    if decompress is None:
+        raise ValueError(f"Unsupported relay codec {codec_id}")
+    msg_size = len(msg)
+    while offset < msg_size:
+        if offset + SEGMENT_HEADER.size > msg_size:
+            raise ValueError("Invalid segment header")
+        type_id, flags, sequence, length = SEGMENT_HEADER.unpack_from(msg, offset)
+        offset += SEGMENT_HEADER.size
+        yield type_id, flags, sequence, decompress(msg[offset:offset + length])
+        offset += length
+
+
+def unpack_legacy_message(msg: bytes) -> Iterator[tuple[int, bytes]]:
+    """Unpack legacy (unversioned) message
+
+    Yields:
+        Type id, decompressed payload.
+    """
+    offset = 0
+    msg_size = len(msg)
+    while offset < msg_size:
+        if offset + LEGACY_SEGMENT_HEADER.size > msg_size:
+            raise ValueError("Invalid header")
+        type_id, length = LEGACY_SEGMENT_HEADER.unpack_from(msg, offset)
+        offset += LEGACY_SEGMENT_HEADER.size
+        yield type_id, zlib.decompress(msg[offset:offset + length])
+        offset += length
+
+
+def pack_sparse(
+    raw_bytes: bytes, array_offset: int, item_size: int, array_length: int,
+    indexes: Sequence[int]) -> bytes:
+    """Pack struct data with only selected array entries
+
+    Args:
+        raw_bytes: Full struct data.
+        array_offset: Array field offset in struct.
+        item_size: Array item size.
+        array_length: Total number of array items.
+        indexes: Array item indexes to keep.
+
+    Returns:
+        Sparse struct data.
+    """
+    view = memoryview(raw_bytes)
+    array_end = array_offset + item_size * array_length
+    return b"".join((
+        SPARSE_HEADER.pack(len(indexes), array_offset),
+        bytes(indexes),
+        view[:array_offset],
+        *(view[array_offset + index * item_size:array_offset + (index + 1) * item_size]
+          for index in indexes),
+        view[array_end:],
+    ))
+
+
+def unpack_sparse_into(
+    payload: bytes, dst: ctypes.Structure, array_offset: int, item_size: int,
+    array_length: int) -> None:
+    """Unpack sparse struct data into ctypes struct, unused array items are cleared
+
+    Raises:
+        ValueError: if sparse data does not match struct layout.
+    """
+    count, head_size = SPARSE_HEADER.unpack_from(payload, 0)
+    array_size = item_size * array_length
+    tail_size = ctypes.sizeof(dst) - array_offset - array_size
+    offset = SPARSE_HEADER.size
+    indexes = payload[offset:offset + count]
+    offset += count
+    if (head_size != array_offset
+        or len(payload) != offset + head_size + count * item_size + tail_size
+        or any(index >= array_length for index in indexes)):
+        raise ValueError("Sparse data does not match struct layout")
+    view = memoryview(dst).cast("B")
+    view[:head_size] = payload[offset:offset + head_size]
+    offset += head_size
+    ctypes.memset(ctypes.addressof(dst) + array_offset, 0, array_size)
+    for index in indexes:
+        item_offset = array_offset + index * item_size
+        view[item_offset:item_offset + item_size] = payload[offset:offset + item_size]
+        offset += item_size
+    if tail_size:
+        view[array_offset + array_size:] = payload[offset:]
+
+
+class SegmentScheduler:
+    """Schedule segment sending with independent intervals
+
+    Segment is skipped if its data version (or content hash)
+    has not changed since last send.
+
+    Attributes:
+        intervals: Segment type id & sending interval (seconds) dictionary.
+    """
+
+    __slots__ = (
+        "_next_times",
+        "_last_versions",
+        "intervals",
+    )
+
+    def __init__(self, intervals: dict[int, float]) -> None:
+        self._next_times: dict[int, float] = {}
+        self._last_versions: dict[int, int] = {}
+        self.intervals = {type_id: max(interval, 0.001) for type_id, interval in intervals.items()}
+
+    def reset(self) -> None:
+        """Send all segments on next check regardless of version"""
+        self._next_times.clear()
+        self._last_versions.clear()
+
+    def due(self, now: float) -> list[int]:
+        """Get segment type ids due for sending, and schedule next time"""
+        next_times = self._next_times
+        type_ids = []
+        for type_id, interval in self.intervals.items():
+            next_time = next_times.get(type_id, 0.0)
+            if now >= next_time - SCHEDULE_TOLERANCE:
+                # Keep phase unless fell behind more than one interval
+                next_times[type_id] = max(next_time + interval, now)
+                type_ids.append(type_id)
+        return type_ids
+
+    def next_due(self) -> float:
+        """Earliest next sending time"""
+        return min((self._next_times.get(type_id, 0.0) for type_id in self.intervals), default=0.0)
+
+    def changed(self, type_id: int, version: int) -> bool:
+        """Check if segment version changed since last send"""
+        return self._last_versions.get(type_id) != version
+
+    def record(self, type_id: int, version: int) -> None:
+        """Record segment version as sent, call only after segment captured"""
+        self._last_versions[type_id] = version
+
+
+class SegmentEncoder:
+    """Encode segment as keyframe or XOR delta against last sent frame
+
+    Attributes:
+        keyframe_interval: Number of delta frames between keyframes.
+        codec_id: Compression codec id.
+    """
+
+    __slots__ = (
+        "_last_frames",
+        "_sequences",
+        "_delta_counts",
+        "_compress",
+        "keyframe_interval",
+        "codec_id",
+    )
+
+    def __init__(self, keyframe_interval: int = 50, codec: str = "zlib", level: int = 6) -> None:
+        self._last_frames: dict[int, bytearray] = {}
+        self._sequences: dict[int, int] = {}
+        self._delta_counts: dict[int, int] = {}
+        self.keyframe_interval = max(int(keyframe_interval), 0)
+        self.set_codec(codec, level)
+
+    def set_codec(self, codec: str, level: int = 6) -> None:
+        """Set compression codec, fall back to zlib if not available"""
+        codec_id = CODEC_IDS.get(codec, CODEC_ZLIB)
+        compress = get_compressor(codec_id, level)
+        if compress is None:
+            logger.warning("relay: codec %s not available, fall back to zlib", codec)
+            codec_id = CODEC_ZLIB
+            compress = get_compressor(codec_id, level)
+        self.codec_id = codec_id
+        self._compress = compress
+        self.request_keyframe()
+
+    def request_keyframe(self) -> None:
+        """Force keyframe for all segments on next encode"""
+        self._last_frames.clear()
+
+    def pack(self, segments: list[bytes]) -> bytes:
+        """Pack encoded segments into versioned message with encoder codec"""
+        return pack_message(segments, self.codec_id)
+
+    def encode(self, type_id: int, raw_bytes: bytes | memoryview, flags: int = 0) -> bytes:
+        """Encode segment
+
+        Args:
+            type_id: Segment type id.
+            raw_bytes: Full (or sparse) segment data.
+            flags: Additional segment flags, such as FLAG_SPARSE.
+
+        Returns:
+            Encoded segment with header.
+        """
+        sequence = self._sequences[type_id] = next_sequence(self._sequences.get(type_id, 0))
+        last_frame = self._last_frames.get(type_id)
+        delta_count = self._delta_counts.get(type_id, 0)
+        if (last_frame is None
+            or len(last_frame) != len(raw_bytes)
+            or delta_count >= self.keyframe_interval):
+            flags |= FLAG_KEYFRAME
+            payload = raw_bytes
+            self._delta_counts[type_id] = 0
+        else:
+            flags |= FLAG_DELTA
+            payload = xor_bytes(raw_bytes, last_frame)
+            self._delta_counts[type_id] = delta_count + 1
+        # Reuse base frame buffer, raw bytes may be a view over reused snapshot buffer
+        if last_frame is None or len(last_frame) != len(raw_bytes):
+            self._last_frames[type_id] = bytearray(raw_bytes)
+        else:
+            last_frame[:] = raw_bytes
+        compressed = self._compress(payload)
+        return SEGMENT_HEADER.pack(type_id, flags, sequence, len(compressed)) + compressed
+
+
+class SegmentDecoder:
+    """Decode keyframe or XOR delta segment against last received frame
+
+    Delta segment is dropped if no matching base frame received,
+    or sequence number is not continuous. Decoder then waits for next keyframe.
+    """
+
+    __slots__ = (
+        "_last_frames",
+        "_sequences",
+        "keyframe_needed",
+        "unsupported_codec",
+    )
+
+    def __init__(self) -> None:
+        self._last_frames: dict[int, bytes] = {}
+        self._sequences: dict[int, int] = {}
+        self.keyframe_needed = False
+        self.unsupported_codec = -1
+
+    def reset(self) -> None:
+        """Reset decoder state"""
+        self._last_frames.clear()
+        self._sequences.clear()
+        self.keyframe_needed = False
+        self.unsupported_codec = -1
+
+    def reset_frames(self) -> None:
+        """Drop all base frames, wait for keyframe"""
+        self._last_frames.clear()
+        self._sequences.clear()
+        self.keyframe_needed = True
+
+    def decode(self, msg: bytes) -> list[tuple[int, int, bytes]]:
+        """Decode versioned message
+
+        Returns:
+            List of type id, flags & full (or sparse) segment data.
+        """
+        parts = []
+        codec_id = message_codec(msg)
+        if get_decompressor(codec_id) is None:
+            self.unsupported_codec = codec_id
+            self.reset_frames()
+            return parts
+        for type_id, flags, sequence, payload in unpack_message(msg):
+            if flags & FLAG_KEYFRAME:
+                raw_bytes = payload
+            elif (flags & FLAG_DELTA
+                and self._sequences.get(type_id, -1) > 0
+                and next_sequence(self._sequences[type_id]) == sequence
+                and len(self._last_frames[type_id]) == len(payload)):
+                raw_bytes = xor_bytes(payload, self._last_frames[type_id])
+            else:
+                self._sequences.pop(type_id, None)
+                self._last_frames.pop(type_id, None)
+                self.keyframe_needed = True
+                continue
+            self._sequences[type_id] = sequence
+            self._last_frames[type_id] = raw_bytes
+            parts.append((type_id, flags, raw_bytes))
+        return parts
+
+
+def benchmark_codecs(
+    samples: Sequence[bytes], rounds: int = 20) -> list[tuple[str, int, float, float]]:
+    """Benchmark available codecs on sample buffers
+
+    Args:
+        samples: Sample buffers, such as captured rF2 data.
+        rounds: Number of compress rounds per codec.
+
+    Returns:
+        List of codec name, level, average compress time (milliseconds), compression ratio.
+    """
+    raw_size = sum(len(data) for data in samples) or 1
+    results = []
+    for name, codec_id in CODEC_IDS.items():
+        if codec_id == CODEC_RAW:
+            levels = (0,)
+        elif codec_id == CODEC_ZLIB:
+            levels = range(1, 10)
+        else:
+            levels = (1, 3, 6)
+        for level in levels:
+            compress = get_compressor(codec_id, level)
+            if compress is None:
+                continue
+            compressed_size = 0
+            timer_start = perf_counter()
+            for _ in range(rounds):
+                compressed_size = sum(len(compress(data)) for data in samples)
+            timer = (perf_counter() - timer_start) / max(rounds, 1) * 1000
+            results.append((name, level, timer, raw_size / max(compressed_size, 1)))
+    return results
+
+
+def test_codec_benchmark():
+    """Codec benchmark run on captured shared memory buffers"""
+    from .rf2_connector import MMapDataSet
+
+    dataset = MMapDataSet()
+    dataset.create_mmap(0, "")
+    samples = [
+        bytes(dataset.scor.data),
+        bytes(dataset.tele.data),
+        bytes(dataset.ext.data),
+        bytes(dataset.ffb.data),
+    ]
+    dataset.close_mmap()
+    print(f"sample size: {sum(map(len, samples))} bytes")
+    print(f"{'codec':<6}{'level':>6}{'time ms':>10}{'ratio':>10}")
+    for name, level, timer, ratio in benchmark_codecs(samples):
+        print(f"{name:<6}{level:>6}{timer:>10.3f}{ratio:>10.2f}")
+
+
+if __name__ == "__main__":
+    test_codec_benchmark()
@@ -1,15 +1,32 @@
 import threading
 import ctypes
+import logging
+import struct
+from types import SimpleNamespace
+from typing import Callable
 from pyRfactor2SharedMemory.rF2MMap import rF2data
+from .relay_protocol import unpack_sparse_into
+from .rf2_numpy import VehicleArrays
+from .rf2_snapshot import VehicleFrame, VehicleSnapshot
 from .rf2_websocket import RF2WebSocket
 
+logger = logging.getLogger(__name__)
+
 class RemoteRF2Info:
-    def __init__(self, session_uri: str, session_name: str):
+    def __init__(self, session_uri: str, session_name: str, vehicle_snapshot: bool = False):
         self._scor = rF2data.rF2Scoring()
         self._tele = rF2data.rF2Telemetry()
         self._ext = rF2data.rF2Extended()
         self._ffb = rF2data.rF2ForceFeedback()
         self._lock = threading.Lock()
+        # Remote telemetry index is same as scoring index
+        self._tele_indexes = list(range(len(self._scor.mVehicles)))
+        self._vehicle_snapshot = VehicleSnapshot() if vehicle_snapshot else None
+        self._tick_callback = None
+        self._vehicle_arrays = {
+            "scor": VehicleArrays(SimpleNamespace(data=self._scor)),
+            "tele": VehicleArrays(SimpleNamespace(data=self._tele)),
+        }
 
         self._ws = RF2WebSocket(
             uri=session_uri,
@@ -19,7 +36,7 @@ class RemoteRF2Info:
         )
         self._ws.start()
 
-    def apply_segment_data(self, type_id: int, data: bytes):
+    def apply_segment_data(self, type_id: int, data: bytes, sparse: bool = False):
         with self._lock:
             dst = None
             if type_id == 1:
@@ -30,8 +47,33 @@ class RemoteRF2Info:
                 dst = self._ext
             elif type_id == 4:
                 dst = self._ffb
-            if dst:
-                ctypes.memmove(ctypes.addressof(dst), data, ctypes.sizeof(dst))
+            if dst and sparse:
+                # Unused vehicle slots are cleared
+                vehicles = dst.mVehicles
+                try:
+                    unpack_sparse_into(
+                        data,
+                        dst,
+                        type(dst).mVehicles.offset,
+                        ctypes.sizeof(vehicles) // len(vehicles),
+                        len(vehicles),
+                    )
+                except (ValueError, struct.error) as error:
+                    logger.warning("Segment %s invalid sparse data: %s", type_id, error)
+            elif dst:
+                size = ctypes.sizeof(dst)
+                if len(data) != size:
+                    logger.warning("Segment %s size mismatch: %s != %s", type_id, len(data), size)
+                    return
+                ctypes.memmove(ctypes.addressof(dst), data, size)
+            if self._vehicle_snapshot is not None and type_id in (1, 2):
+                self._vehicle_snapshot.update(self._scor, self._tele, self._tele_indexes, 0)
+        if self._tick_callback is not None and type_id in (1, 2):
+            self._tick_callback()
+
+    def setTickCallback(self, callback: Callable[[], None] | None = None):
+        """Set callback on new scoring or telemetry data (called from websocket thread)"""
+        self._tick_callback = callback
 
     def rf2ScorVeh(self, index: int | None = None):
         with self._lock:
@@ -63,6 +105,15 @@ class RemoteRF2Info:
     def playerIndex(self):
         return 0
 
+    def vehicleArrays(self, key: str) -> VehicleArrays:
+        return self._vehicle_arrays[key]
+
+    @property
+    def vehicleSnapshot(self) -> VehicleFrame | None:
+        """Latest published vehicle snapshot frame, None if disabled"""
+        snapshot = self._vehicle_snapshot
+        return None if snapshot is None else snapshot.frame
+
     def isPlayer(self, index: int) -> bool:
         return index == 0
 
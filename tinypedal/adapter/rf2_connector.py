@@ -26,7 +26,7 @@ import logging
 import threading
 from copy import copy
 from time import monotonic, sleep
-from typing import TYPE_CHECKING, Sequence
+from typing import TYPE_CHECKING, Callable, Sequence
 import websockets
 import asyncio
 import json
@@ -51,8 +51,16 @@ from pyRfactor2SharedMemory.rF2MMap import (
     rFactor2Constants,
 )
 
+from .rf2_snapshot import VehicleSnapshot
+
 logger = logging.getLogger(__name__)
 
+MAX_READ_RETRIES = 3  # max extra copy attempts for torn read
+POLL_MIN_DELAY = 0.002  # min polling delay (seconds) while active
+POLL_MAX_DELAY = 0.05  # max polling delay (seconds) while active
+POLL_OFFSET = 0.001  # poll just after expected publish time
+PUBLISH_EMA_FACTOR = 0.1  # publish interval smoothing factor
+
 TYPE_IDS = {
     "scor": 0x01,
     "tele": 0x02,
@@ -73,14 +81,183 @@ def local_scoring_index(scor_veh: Sequence[rF2data.rF2VehicleScoring]) -> int:
     return INVALID_INDEX
 
 
+class MMapSnapshot:
+    """Double-buffered consistent snapshot of mmap data
+
+    Snapshot is copied into back buffer, and only swapped to front
+    if version begin & end matches (not torn by rF2 writing).
+    Each consumer should create its own snapshot.
+
+    Attributes:
+        data: Front buffer data (ctypes structure).
+        view: Front buffer byte memoryview.
+        version: Front buffer update version.
+    """
+
+    __slots__ = (
+        "_source",
+        "_buffers",
+        "_views",
+        "_index",
+        "_size",
+        "data",
+        "view",
+        "version",
+    )
+
+    def __init__(self, source: MMapControl) -> None:
+        self._source = source
+        buffer_type = type(source.data)
+        self._buffers = (buffer_type(), buffer_type())
+        self._views = tuple(memoryview(buffer).cast("B") for buffer in self._buffers)
+        self._index = 0
+        self._size = ctypes.sizeof(buffer_type)
+        self.data = self._buffers[0]
+        self.view = self._views[0]
+        self.version = -1
+
+    def source_version(self) -> int:
+        """Current source update version without copying, or content hash if no version field"""
+        source = self._source.data
+        version = getattr(source, "mVersionUpdateEnd", None)
+        if version is None:
+            return zlib.crc32(memoryview(source).cast("B"))
+        return version
+
+    def capture(self, max_retries: int = 3) -> bool:
+        """Capture consistent copy from source into back buffer, then swap
+
+        Args:
+            max_retries: Max copy attempts while source is being updated.
+
+        Returns:
+            True if captured, False if all attempts were torn (front buffer unchanged).
+        """
+        source = self._source.data
+        back_index = self._index ^ 1
+        back = self._buffers[back_index]
+        for _ in range(max_retries):
+            ctypes.memmove(ctypes.addressof(back), ctypes.addressof(source), self._size)
+            version = getattr(back, "mVersionUpdateEnd", -1)
+            if getattr(back, "mVersionUpdateBegin", version) == version:
+                self._index = back_index
+                self.data = back
+                self.view = self._views[back_index]
+                self.version = version
+                return True
+        return False
+
+
+def vehicle_id_signature(data: rF2data.rF2Scoring | rF2data.rF2Telemetry, num_vehicles: int) -> bytes:
+    """Vehicle mID signature of populated mVehicles entries
+
+    Read mID bytes with strided memoryview slices,
+    without accessing each vehicle through ctypes.
+
+    Args:
+        data: Scoring or telemetry data.
+        num_vehicles: Number of populated vehicles.
+    """
+    veh_type = type(data.mVehicles)._type_
+    veh_size = ctypes.sizeof(veh_type)
+    num_vehicles = min(max(num_vehicles, 0), len(data.mVehicles))
+    start = type(data).mVehicles.offset + veh_type.mID.offset
+    end = start + num_vehicles * veh_size
+    view = memoryview(data).cast("B")
+    return b"".join(
+        bytes(view[start + byte_idx:end:veh_size]) for byte_idx in range(veh_type.mID.size))
+
+
+class PublishRate:
+    """Measure mmap data publish interval from update version
+
+    Attributes:
+        interval: Smoothed publish interval (seconds).
+        last_time: Estimated last publish time (monotonic seconds).
+        repeats: Number of polls since last version change.
+    """
+
+    __slots__ = (
+        "_last_version",
+        "_last_poll",
+        "interval",
+        "last_time",
+        "repeats",
+    )
+
+    def __init__(self, interval: float = 0.01) -> None:
+        self._last_version = 0
+        self._last_poll = 0.0
+        self.interval = interval
+        self.last_time = 0.0
+        self.repeats = 0
+
+    @property
+    def rate(self) -> float:
+        """Publish rate (Hz)"""
+        return 1 / self.interval if self.interval else 0.0
+
+    def update(self, version: int, now: float) -> bool:
+        """Update publish interval
+
+        Args:
+            version: Current mVersionUpdateEnd.
+            now: Current monotonic time.
+
+        Returns:
+            True if version changed.
+        """
+        last_poll = self._last_poll
+        self._last_poll = now
+        if version == self._last_version:
+            self.repeats += 1
+            return False
+        published = version - self._last_version
+        # Publish happened between last poll & now, clamp expected time into it.
+        # Expected time is biased early, so poll phase keeps probing just before
+        # publish, instead of locking on to a late phase.
+        expected = self.last_time + self.interval * published - POLL_OFFSET
+        publish_time = min(max(expected, last_poll), now)
+        # Ignore version reset & long gaps (paused or loading)
+        if 0 < published < 100 and 0 < publish_time - self.last_time < 1:
+            interval = (publish_time - self.last_time) / published
+            self.interval += (interval - self.interval) * PUBLISH_EMA_FACTOR
+        self._last_version = version
+        self.last_time = publish_time
+        self.repeats = 0
+        return True
+
+    def next_poll(self, now: float) -> float:
+        """Delay until just after next expected publish
+
+        Poll at min delay shortly past expected publish time to narrow down
+        publish phase, back off exponentially if version keeps repeating.
+        """
+        expected = self.last_time + self.interval
+        delay = expected - now + POLL_OFFSET
+        if delay < POLL_MIN_DELAY:
+            if now - expected < self.interval:
+                delay = POLL_MIN_DELAY
+            else:
+                delay = POLL_MIN_DELAY * (1 << min(self.repeats, 5))
+        return min(delay, POLL_MAX_DELAY)
+
+
 class MMapDataSet:
-    """Create mmap data set"""
+    """Create mmap data set
+
+    Attributes:
+        read_retries: Number of extra copy attempts caused by torn read.
+        torn_frames: Number of updates still torn after max retries.
+    """
 
     __slots__ = (
         "scor",
         "tele",
         "ext",
         "ffb",
+        "read_retries",
+        "torn_frames",
     )
 
     def __init__(self) -> None:
@@ -88,6 +265,8 @@ class MMapDataSet:
         self.tele = MMapControl(rFactor2Constants.MM_TELEMETRY_FILE_NAME, rF2data.rF2Telemetry)
         self.ext = MMapControl(rFactor2Constants.MM_EXTENDED_FILE_NAME, rF2data.rF2Extended)
         self.ffb = MMapControl(rFactor2Constants.MM_FORCE_FEEDBACK_FILE_NAME, rF2data.rF2ForceFeedback)
+        self.read_retries = 0
+        self.torn_frames = 0
 
     def __del__(self):
         logger.info("sharedmemory: GC: MMapDataSet")
@@ -113,8 +292,35 @@ class MMapDataSet:
 
     def update_mmap(self) -> None:
         """Update mmap data"""
-        self.scor.update()
-        self.tele.update()
+        self.__update_consistent(self.scor)
+        self.__update_consistent(self.tele)
+
+    def __update_consistent(self, mmap_control: MMapControl) -> None:
+        """Update mmap data, retry while version begin & end not match
+
+        rF2 increases mVersionUpdateBegin before writing,
+        and mVersionUpdateEnd after writing. Mismatched versions
+        means data was copied while being written (torn read).
+
+        Args:
+            mmap_control: mmap control instance.
+        """
+        for retry in range(MAX_READ_RETRIES + 1):
+            mmap_control.update()
+            data = mmap_control.data
+            if data.mVersionUpdateBegin == data.mVersionUpdateEnd:
+                return
+            if retry < MAX_READ_RETRIES:
+                self.read_retries += 1
+        self.torn_frames += 1
+
+    def snapshot(self, key: str) -> MMapSnapshot:
+        """Create snapshot consumer for mmap data
+
+        Args:
+            key: mmap data name, "scor", "tele", "ext", "ffb".
+        """
+        return MMapSnapshot(getattr(self, key))
 
 
 class SyncData:
@@ -122,6 +328,11 @@ class SyncData:
 
     Attributes:
         dataset: mmap data set.
+        tele_indexes: Scoring index to telemetry index reference list.
+        scor_rate: Scoring publish rate.
+        tele_rate: Telemetry publish rate.
+        vehicle_snapshot: Optional per-tick vehicle snapshot.
+        tick_callback: Optional callback on new scoring or telemetry data version.
         paused: Data update state (boolean).
         override_player_index: Player index override state (boolean).
         player_scor_index: Local player scoring index.
@@ -133,20 +344,26 @@ class SyncData:
         "_updating",
         "_update_thread",
         "_event",
-        "_tele_indexes",
+        "_tele_signature",
+        "tele_indexes",
         "paused",
         "override_player_index",
         "player_scor_index",
         "player_scor",
         "player_tele",
         "dataset",
+        "scor_rate",
+        "tele_rate",
+        "vehicle_snapshot",
+        "tick_callback",
     )
 
     def __init__(self) -> None:
         self._updating = False
         self._update_thread = None
         self._event = threading.Event()
-        self._tele_indexes = {_index: _index for _index in range(128)}
+        self._tele_signature = b""
+        self.tele_indexes = list(range(MAX_VEHICLES))
 
         self.paused = False
         self.override_player_index = False
@@ -154,6 +371,10 @@ class SyncData:
         self.player_scor = None
         self.player_tele = None
         self.dataset = MMapDataSet()
+        self.scor_rate = PublishRate(0.2)
+        self.tele_rate = PublishRate(0.01)
+        self.vehicle_snapshot: VehicleSnapshot | None = None
+        self.tick_callback: Callable[[], None] | None = None
 
     def __del__(self):
         logger.info("sharedmemory: GC: SyncData")
@@ -176,26 +397,40 @@ class SyncData:
         self.player_tele = self.dataset.tele.data.mVehicles[self.sync_tele_index(self.player_scor_index)]
         return True  # found index, synced
 
-    @staticmethod
-    def __update_tele_indexes(tele_data: rF2data.rF2Telemetry, tele_indexes: dict) -> None:
-        """Update telemetry player index dictionary for quick reference
+    def __update_tele_indexes(self, scor_data: rF2data.rF2Scoring, tele_data: rF2data.rF2Telemetry) -> None:
+        """Update scoring index to telemetry index list for quick reference
 
         Telemetry index can be different from scoring index.
         Use mID matching to match telemetry index.
+        Only rebuild if number of vehicles or vehicle mID changed.
 
         Args:
+            scor_data: Scoring data.
             tele_data: Telemetry data.
-            tele_indexes: Telemetry mID:index reference dictionary.
         """
-        for tele_idx, veh_info in zip(range(tele_data.mNumVehicles), tele_data.mVehicles):
-            tele_indexes[veh_info.mID] = tele_idx
+        scor_veh_total = scor_data.mScoringInfo.mNumVehicles
+        tele_veh_total = tele_data.mNumVehicles
+        signature = (
+            vehicle_id_signature(scor_data, scor_veh_total)
+            + vehicle_id_signature(tele_data, tele_veh_total)
+        )
+        if self._tele_signature == signature:
+            return
+        self._tele_signature = signature
+        tele_ids = {
+            veh_info.mID: tele_idx
+            for tele_idx, veh_info in zip(range(tele_veh_total), tele_data.mVehicles)
+        }
+        tele_indexes = self.tele_indexes
+        tele_indexes[:] = [INVALID_INDEX] * len(tele_indexes)
+        for scor_idx, veh_info in zip(range(scor_veh_total), scor_data.mVehicles):
+            tele_indexes[scor_idx] = tele_ids.get(veh_info.mID, INVALID_INDEX)
 
     def sync_tele_index(self, scor_idx: int) -> int:
         """Sync telemetry index
 
-        Use scoring index to find scoring mID,
-        then match with telemetry mID in reference dictionary
-        to find telemetry index.
+        Use scoring index to find telemetry index
+        from precomputed reference list.
 
         Args:
             scor_idx: Player scoring index.
@@ -203,8 +438,7 @@ class SyncData:
         Returns:
             Player telemetry index.
         """
-        return self._tele_indexes.get(
-            self.dataset.scor.data.mVehicles[scor_idx].mID, INVALID_INDEX)
+        return self.tele_indexes[scor_idx]
 
     def start(self, access_mode: int, rf2_pid: str) -> None:
         """Update & sync mmap data copy in separate thread
@@ -219,7 +453,7 @@ class SyncData:
             self._updating = True
             # Initialize mmap data
             self.dataset.create_mmap(access_mode, rf2_pid)
-            self.__update_tele_indexes(self.dataset.tele.data, self._tele_indexes)
+            self.__update_tele_indexes(self.dataset.scor.data, self.dataset.tele.data)
             if not self.__sync_player_data():
                 self.player_scor = self.dataset.scor.data.mVehicles[INVALID_INDEX]
                 self.player_tele = self.dataset.tele.data.mVehicles[INVALID_INDEX]
@@ -241,6 +475,11 @@ class SyncData:
             self.player_scor = copy(self.player_scor)
             self.player_tele = copy(self.player_tele)
             self.dataset.close_mmap()
+            logger.info(
+                "sharedmemory: torn read: %s retries, %s frames",
+                self.dataset.read_retries,
+                self.dataset.torn_frames,
+            )
         else:
             logger.warning("sharedmemory: UPDATING: already stopped")
 
@@ -248,16 +487,22 @@ class SyncData:
         """Update synced player data"""
         self.paused = False  # make sure initial pause state is false
         _event_wait = self._event.wait
+        scor_rate = self.scor_rate
+        tele_rate = self.tele_rate
         freezed_version = 0  # store freezed update version number
         last_version_update = 0  # store last update version number
         last_update_time = 0.0
+        last_tick_version = (0, 0)  # store last scoring & telemetry version for tick callback
         data_freezed = True  # whether data is freezed
         reset_counter = 0
         update_delay = 0.5  # longer delay while inactive
 
         while not _event_wait(update_delay):
             self.dataset.update_mmap()
-            self.__update_tele_indexes(self.dataset.tele.data, self._tele_indexes)
+            now = monotonic()
+            scor_rate.update(self.dataset.scor.data.mVersionUpdateEnd, now)
+            tele_rate.update(self.dataset.tele.data.mVersionUpdateEnd, now)
+            self.__update_tele_indexes(self.dataset.scor.data, self.dataset.tele.data)
             # Update player data & index
             if not data_freezed:
                 # Get player data
@@ -271,16 +516,33 @@ class SyncData:
                     if reset_counter == 5:
                         self.paused = True
                         logger.info("sharedmemory: UPDATING: player data paused")
+                # Extract vehicle data once per tick
+                if self.vehicle_snapshot is not None:
+                    self.vehicle_snapshot.update(
+                        self.dataset.scor.data,
+                        self.dataset.tele.data,
+                        self.tele_indexes,
+                        self.player_scor_index,
+                    )
+                # Notify new data version
+                tick_version = (
+                    self.dataset.scor.data.mVersionUpdateEnd,
+                    self.dataset.tele.data.mVersionUpdateEnd,
+                )
+                if last_tick_version != tick_version:
+                    last_tick_version = tick_version
+                    if self.tick_callback is not None:
+                        self.tick_callback()
 
             version_update = self.dataset.scor.data.mVersionUpdateEnd
             if last_version_update != version_update:
                 last_version_update = version_update
-                last_update_time = monotonic()
+                last_update_time = now
 
             if data_freezed:
                 # Check while IN freeze state
                 if freezed_version != last_version_update:
-                    update_delay = 0.01
+                    update_delay = POLL_MIN_DELAY
                     self.paused = data_freezed = False
                     logger.info(
                         "sharedmemory: UPDATING: resumed, data version %s",
@@ -288,7 +550,7 @@ class SyncData:
                     )
             # Check while NOT IN freeze state
             # Set freeze state if data stopped updating after 2s
-            elif monotonic() - last_update_time > 2:
+            elif now - last_update_time > 2:
                 update_delay = 0.5
                 self.paused = data_freezed = True
                 freezed_version = last_version_update
@@ -297,6 +559,10 @@ class SyncData:
                     freezed_version,
                 )
 
+            # Align next poll to expected scoring or telemetry publish
+            if not data_freezed:
+                update_delay = min(scor_rate.next_poll(now), tele_rate.next_poll(now))
+
         logger.info("sharedmemory: UPDATING: thread stopped")
 
 
@@ -25,6 +25,8 @@ Notes:
 
 from __future__ import annotations
 
+from typing import Any
+
 from ..calculation import (
     lap_progress_distance,
     mean,
@@ -492,6 +494,18 @@ class Timing(DataAdapter):
         """Estimated time into lap (seconds)"""
         return rmnan(self.info.rf2ScorVeh(index).mTimeIntoLap)
 
+    def estimated_time_into_column(self) -> Any:
+        """Estimated time into lap (seconds) column of all vehicles"""
+        return self.info.vehicleArrays("scor").finite_column("mTimeIntoLap")
+
+    def best_laptime_column(self) -> Any:
+        """Best lap time (seconds) column of all vehicles"""
+        return self.info.vehicleArrays("scor").finite_column("mBestLapTime")
+
+    def last_laptime_column(self) -> Any:
+        """Last lap time (seconds) column of all vehicles"""
+        return self.info.vehicleArrays("scor").finite_column("mLastLapTime")
+
     def current_sector1(self, index: int | None = None) -> float:
         """Current lap sector 1 time (seconds)"""
         return rmnan(self.info.rf2ScorVeh(index).mCurSector1)
@@ -556,6 +570,11 @@ class Tyre(DataAdapter):
         tele_veh = self.info.rf2TeleVeh(index)
         return tostr(tele_veh.mFrontTireCompoundName), tostr(tele_veh.mRearTireCompoundName)
 
+    def compound_name_bytes(self, index: int | None = None) -> tuple[bytes, bytes]:
+        """Tyre compound name set (front, rear) raw bytes, for change detection"""
+        tele_veh = self.info.rf2TeleVeh(index)
+        return tele_veh.mFrontTireCompoundName, tele_veh.mRearTireCompoundName
+
     def surface_temperature_avg(self, index: int | None = None) -> tuple[float, ...]:
         """Tyre surface temperature set (Celsius) average"""
         wheel_data = self.info.rf2TeleVeh(index).mWheels
@@ -686,6 +705,11 @@ class Vehicle(DataAdapter):
         """Vehicle class name"""
         return tostr(self.info.rf2ScorVeh(index).mVehicleClass)
 
+    def name_bytes(self, index: int | None = None) -> tuple[bytes, bytes, bytes]:
+        """Driver, vehicle, class name raw bytes, for change detection"""
+        scor_veh = self.info.rf2ScorVeh(index)
+        return scor_veh.mDriverName, scor_veh.mVehicleName, scor_veh.mVehicleClass
+
     def same_class(self, index: int | None = None) -> bool:
         """Is same vehicle class"""
         return self.info.rf2ScorVeh(index).mVehicleClass == self.info.rf2ScorVeh().mVehicleClass
@@ -715,6 +739,22 @@ class Vehicle(DataAdapter):
         state = self.info.rf2ScorVeh(index)
         return 2 if state.mInGarageStall else state.mInPits
 
+    def class_name_column(self) -> list[str]:
+        """Vehicle class name column of all vehicles"""
+        return self.info.vehicleArrays("scor").text_column("mVehicleClass")
+
+    def place_column(self) -> Any:
+        """Vehicle overall place column of all vehicles"""
+        return self.info.vehicleArrays("scor").column("mPlace")
+
+    def in_pits_column(self) -> Any:
+        """Is in pits column of all vehicles"""
+        return self.info.vehicleArrays("scor").column("mInPits")
+
+    def in_garage_column(self) -> Any:
+        """Is in garage column of all vehicles"""
+        return self.info.vehicleArrays("scor").column("mInGarageStall")
+
     def number_pitstops(self, index: int | None = None, penalty: int = 0) -> int:
         """Number of pit stops"""
         return -penalty if penalty else self.info.rf2ScorVeh(index).mNumPitstops
@@ -984,3 +1024,162 @@ class Wheel(DataAdapter):
         """Whether all wheels are complete offroad"""
         wheel_data = self.info.rf2TeleVeh(index).mWheels
         return all(2 <= data.mSurfaceType <= 4 for data in wheel_data)
+
+
+class SnapshotLap(Lap):
+    """Lap, read per-vehicle data from vehicle snapshot"""
+
+    __slots__ = ()
+
+    def completed_laps(self, index: int | None = None) -> int:
+        """Total completed laps"""
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.total_laps[snapshot.index(index)]
+
+    def distance(self, index: int | None = None) -> float:
+        """Distance into lap (meters)"""
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.lap_distance[snapshot.index(index)]
+
+    def progress(self, index: int | None = None) -> float:
+        """Lap progress (fraction), distance into lap"""
+        snapshot = self.info.vehicleSnapshot
+        return rmnan(lap_progress_distance(
+            snapshot.lap_distance[snapshot.index(index)],
+            self.info.rf2ScorInfo.mLapDist))
+
+    def behind_leader(self, index: int | None = None) -> int:
+        """Laps behind leader"""
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.laps_behind_leader[snapshot.index(index)]
+
+    def behind_next(self, index: int | None = None) -> int:
+        """Laps behind next place"""
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.laps_behind_next[snapshot.index(index)]
+
+
+class SnapshotTiming(Timing):
+    """Timing, read per-vehicle data from vehicle snapshot"""
+
+    __slots__ = ()
+
+    def last_laptime(self, index: int | None = None) -> float:
+        """Last lap time (seconds)"""
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.last_laptime[snapshot.index(index)]
+
+    def best_laptime(self, index: int | None = None) -> float:
+        """Best lap time (seconds)"""
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.best_laptime[snapshot.index(index)]
+
+    def estimated_laptime(self, index: int | None = None) -> float:
+        """Estimated lap time (seconds)"""
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.estimated_laptime[snapshot.index(index)]
+
+    def estimated_time_into(self, index: int | None = None) -> float:
+        """Estimated time into lap (seconds)"""
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.time_into_lap[snapshot.index(index)]
+
+    def behind_leader(self, index: int | None = None) -> float:
+        """Time behind leader (seconds)"""
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.time_behind_leader[snapshot.index(index)]
+
+    def behind_next(self, index: int | None = None) -> float:
+        """Time behind next place (seconds)"""
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.time_behind_next[snapshot.index(index)]
+
+
+class SnapshotVehicle(Vehicle):
+    """Vehicle, read per-vehicle data from vehicle snapshot"""
+
+    __slots__ = ()
+
+    def slot_id(self, index: int | None = None) -> int:
+        """Vehicle slot id"""
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.slot_id[snapshot.index(index)]
+
+    def place(self, index: int | None = None) -> int:
+        """Vehicle overall place"""
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.place[snapshot.index(index)]
+
+    def in_pits(self, index: int | None = None) -> bool:
+        """Is in pits"""
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.in_pits[snapshot.index(index)]
+
+    def in_garage(self, index: int | None = None) -> bool:
+        """Is in garage"""
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.in_garage[snapshot.index(index)]
+
+    def in_paddock(self, index: int | None = None) -> int:
+        """Is in paddock (either pit lane or garage), 0 = on track, 1 = pit lane, 2 = garage"""
+        snapshot = self.info.vehicleSnapshot
+        index = snapshot.index(index)
+        return 2 if snapshot.in_garage[index] else snapshot.in_pits[index]
+
+    def number_pitstops(self, index: int | None = None, penalty: int = 0) -> int:
+        """Number of pit stops"""
+        if penalty:
+            return -penalty
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.num_pitstops[snapshot.index(index)]
+
+    def pit_request(self, index: int | None = None) -> bool:
+        """Is requested pit, 0 = none, 1 = request, 2 = entering, 3 = stopped, 4 = exiting"""
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.pit_state[snapshot.index(index)] == 1
+
+    def orientation_yaw_radians(self, index: int | None = None) -> float:
+        """Orientation yaw (radians)"""
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.yaw_radians[snapshot.index(index)]
+
+    def position_xyz(self, index: int | None = None) -> tuple[float, float, float]:
+        """Raw x,y,z position (meters)"""
+        snapshot = self.info.vehicleSnapshot
+        index = snapshot.index(index)
+        return snapshot.pos_x[index], snapshot.pos_y[index], snapshot.pos_z[index]
+
+    def position_longitudinal(self, index: int | None = None) -> float:
+        """Longitudinal axis position (meters) related to world plane"""
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.pos_x[snapshot.index(index)]  # in RF2 coord system
+
+    def position_lateral(self, index: int | None = None) -> float:
+        """Lateral axis position (meters) related to world plane"""
+        snapshot = self.info.vehicleSnapshot
+        return -snapshot.pos_z[snapshot.index(index)]  # in RF2 coord system
+
+    def position_vertical(self, index: int | None = None) -> float:
+        """Vertical axis position (meters) related to world plane"""
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.pos_y[snapshot.index(index)]  # in RF2 coord system
+
+    def velocity_lateral(self, index: int | None = None) -> float:
+        """Lateral velocity (m/s) x"""
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.vel_x[snapshot.index(index)]  # X in RF2 coord system
+
+    def velocity_longitudinal(self, index: int | None = None) -> float:
+        """Longitudinal velocity (m/s) y"""
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.vel_z[snapshot.index(index)]  # Z in RF2 coord system
+
+    def velocity_vertical(self, index: int | None = None) -> float:
+        """Vertical velocity (m/s) z"""
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.vel_y[snapshot.index(index)]  # Y in RF2 coord system
+
+    def speed(self, index: int | None = None) -> float:
+        """Speed (m/s)"""
+        snapshot = self.info.vehicleSnapshot
+        return snapshot.speed[snapshot.index(index)]
@@ -1,12 +1,15 @@
 import threading
 import logging
 from copy import copy
+from typing import Callable
 from pyRfactor2SharedMemory.rF2MMap import (
     INVALID_INDEX,
     MAX_VEHICLES,
     rF2data,
 )
-from .rf2_connector import SyncData
+from .rf2_connector import MMapSnapshot, SyncData
+from .rf2_numpy import VehicleArrays
+from .rf2_snapshot import VehicleFrame, VehicleSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +24,7 @@ class RF2Info:
         "_tele",
         "_ext",
         "_ffb",
+        "_vehicle_arrays",
     )
 
     def __init__(self) -> None:
@@ -31,6 +35,7 @@ class RF2Info:
         self._tele = self._sync.dataset.tele
         self._ext = self._sync.dataset.ext
         self._ffb = self._sync.dataset.ffb
+        self._vehicle_arrays = {}
 
     def __del__(self):
         logger.info("sharedmemory: GC: RF2SM")
@@ -53,6 +58,29 @@ class RF2Info:
     def setPlayerIndex(self, index: int = INVALID_INDEX) -> None:
         self._sync.player_scor_index = min(max(index, INVALID_INDEX), MAX_VEHICLES - 1)
 
+    def snapshot(self, key: str) -> MMapSnapshot:
+        return self._sync.dataset.snapshot(key)
+
+    def setVehicleSnapshot(self, snapshot: VehicleSnapshot | None = None) -> None:
+        self._sync.vehicle_snapshot = snapshot
+
+    def setTickCallback(self, callback: Callable[[], None] | None = None) -> None:
+        """Set callback on new scoring or telemetry data version (called from sync thread)"""
+        self._sync.tick_callback = callback
+
+    def vehicleArrays(self, key: str) -> VehicleArrays:
+        """All-vehicle columns over live scoring ("scor") or telemetry ("tele") data"""
+        arrays = self._vehicle_arrays.get(key)
+        if arrays is None:
+            arrays = self._vehicle_arrays[key] = VehicleArrays(getattr(self, f"_{key}"))
+        return arrays
+
+    @property
+    def vehicleSnapshot(self) -> VehicleFrame | None:
+        """Latest published vehicle snapshot frame, None if disabled"""
+        snapshot = self._sync.vehicle_snapshot
+        return None if snapshot is None else snapshot.frame
+
     @property
     def rf2ScorInfo(self) -> rF2data.rF2ScoringInfo:
         return self._scor.data.mScoringInfo
@@ -61,7 +89,7 @@ class RF2Info:
         return self._sync.player_scor if index is None else self._scor.data.mVehicles[index]
 
     def rf2TeleVeh(self, index: int | None = None) -> rF2data.rF2VehicleTelemetry:
-        return self._sync.player_tele if index is None else self._tele.data.mVehicles[self._sync.sync_tele_index(index)]
+        return self._sync.player_tele if index is None else self._tele.data.mVehicles[self._sync.tele_indexes[index]]
 
     @property
     def rf2Ext(self) -> rF2data.rF2Extended:
@@ -85,4 +113,20 @@ class RF2Info:
 
     @property
     def isPaused(self) -> bool:
-        return self._sync.paused
\ No newline at end of file
+        return self._sync.paused
+
+    @property
+    def scorPublishRate(self) -> float:
+        return self._sync.scor_rate.rate
+
+    @property
+    def telePublishRate(self) -> float:
+        return self._sync.tele_rate.rate
+
+    @property
+    def readRetries(self) -> int:
+        return self._sync.dataset.read_retries
+
+    @property
+    def tornFrames(self) -> int:
+        return self._sync.dataset.torn_frames
\ No newline at end of file
@@ -0,0 +1,170 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+rF2 vehicle array view
+
+Map scoring & telemetry mVehicles arrays as NumPy structured arrays,
+so all-vehicle columns (mLapDist, mPos.x, mPlace, ...) are zero-copy vectors.
+Used as column source for relative array engine.
+
+NumPy is optional. Without NumPy, columns are plain lists read from ctypes.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import logging
+from math import isfinite
+from operator import attrgetter
+from typing import Any, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ..validator import bytes_to_str as tostr
+
+logger = logging.getLogger(__name__)
+
+
+def numpy_available() -> bool:
+    """Check if NumPy is available"""
+    return np is not None
+
+
+def vehicle_dtype(vehicle_type: type[ctypes.Structure]) -> Any:
+    """NumPy structured dtype from ctypes vehicle structure, None if not compatible"""
+    if np is None:
+        return None
+    try:
+        dtype = np.dtype(vehicle_type)
+    except (TypeError, ValueError, NotImplementedError) as error:
+        logger.warning("vehicle array: unsupported ctypes type %s: %s", vehicle_type.__name__, error)
+        return None
+    if dtype.itemsize != ctypes.sizeof(vehicle_type):
+        logger.warning("vehicle array: dtype size mismatch for %s", vehicle_type.__name__)
+        return None
+    return dtype
+
+
+class VehicleArrays:
+    """All-vehicle column access over scoring or telemetry mVehicles array
+
+    Source can be any object with a `data` attribute holding
+    rF2Scoring or rF2Telemetry structure, such as MMapControl or MMapSnapshot.
+    Columns are zero-copy NumPy vectors if NumPy is available,
+    otherwise lists read from ctypes.
+
+    Attributes:
+        use_numpy: Whether columns are NumPy arrays.
+    """
+
+    __slots__ = (
+        "_source",
+        "_dtype",
+        "_views",
+        "_getters",
+        "use_numpy",
+    )
+
+    def __init__(self, source: Any) -> None:
+        self._source = source
+        self._dtype = vehicle_dtype(type(source.data.mVehicles)._type_)
+        self._views: dict[int, tuple[ctypes.Structure, Any]] = {}
+        self._getters: dict[str, attrgetter] = {}
+        self.use_numpy = self._dtype is not None
+
+    def total(self) -> int:
+        """Number of populated vehicles"""
+        data = self._source.data
+        info = getattr(data, "mScoringInfo", None)
+        if info is not None:
+            return info.mNumVehicles
+        return data.mNumVehicles
+
+    def array(self) -> Any:
+        """Structured array view over full mVehicles array (NumPy only)
+
+        View is cached per source buffer, source may swap buffers (double-buffered snapshot).
+        """
+        data = self._source.data
+        cached = self._views.get(id(data))
+        if cached is not None and cached[0] is data:
+            return cached[1]
+        vehicles = data.mVehicles
+        view = np.frombuffer(vehicles, dtype=self._dtype, count=len(vehicles))
+        if len(self._views) > 2:
+            self._views.clear()
+        self._views[id(data)] = (data, view)  # hold data reference, keep id valid
+        return view
+
+    def column(self, name: str, indexes: Sequence[int] | None = None) -> Any:
+        """Vehicle column of populated vehicles
+
+        Args:
+            name: Vehicle field name, nested field separated by dot, ex. "mPos.x".
+            indexes: Optional vehicle order, ex. scoring to telemetry index list.
+
+        Returns:
+            NumPy vector (zero-copy if no indexes), or list if NumPy not available.
+        """
+        total = min(max(self.total(), 0), len(self._source.data.mVehicles))
+        if self.use_numpy:
+            column = self.array()
+            for field in name.split("."):
+                column = column[field]
+            if indexes is None:
+                return column[:total]
+            return column[np.asarray(indexes[:total], dtype=np.intp)]
+        getter = self._getters.get(name)
+        if getter is None:
+            getter = self._getters[name] = attrgetter(name)
+        vehicles = self._source.data.mVehicles
+        if indexes is None:
+            return [getter(veh_info) for veh_info in vehicles[:total]]
+        return [getter(vehicles[index]) for index in indexes[:total]]
+
+    def finite_column(self, name: str, indexes: Sequence[int] | None = None) -> Any:
+        """Float vehicle column of populated vehicles, invalid value (inf or nan) converted to zero
+
+        Returns:
+            NumPy vector (copy), or list if NumPy not available.
+        """
+        column = self.column(name, indexes)
+        if self.use_numpy:
+            return np.nan_to_num(column, nan=0.0, posinf=0.0, neginf=0.0)
+        return [value if isfinite(value) else 0.0 for value in column]
+
+    def text_column(self, name: str, indexes: Sequence[int] | None = None) -> list[str]:
+        """Text vehicle column of populated vehicles, each unique raw value decoded once"""
+        column = self.column(name, indexes)
+        if self.use_numpy:
+            if column.ndim > 1:  # char array mapped as sub-array of single bytes
+                column = np.ascontiguousarray(column).view(f"S{column.shape[1]}")[:, 0]
+            column = column.tolist()
+        decoded: dict[bytes, str] = {}
+        output = []
+        for raw in column:
+            text = decoded.get(raw)
+            if text is None:
+                # NumPy keeps bytes after null terminator, ctypes does not
+                text = decoded[raw] = tostr(raw.split(b"\0", 1)[0])
+            output.append(text)
+        return output
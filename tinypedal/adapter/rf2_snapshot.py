@@ -0,0 +1,195 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+rF2 vehicle snapshot
+
+Extract commonly used per-vehicle fields into compact columns once per sync tick,
+so data adapters read plain arrays instead of walking ctypes structures on every call.
+Columns are published as immutable frames by reference swap.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Sequence
+
+from pyRfactor2SharedMemory.rF2MMap import MAX_VEHICLES
+
+from ..calculation import oriyaw2rad, vel2speed
+from ..validator import infnan_to_zero as rmnan
+
+if TYPE_CHECKING:  # for type checker only
+    from pyRfactor2SharedMemory import rF2Type as rF2data
+
+
+class VehicleFrame:
+    """Vehicle data columns of a single sync tick, indexed by scoring index
+
+    Float values are converted with infnan_to_zero on extraction.
+    Frame is not modified after published, readers can hold on to it
+    without seeing values from different ticks.
+
+    Attributes:
+        total: Number of vehicles in frame.
+        player_index: Local player scoring index.
+        version: Frame update counter.
+    """
+
+    __slots__ = (
+        "total",
+        "player_index",
+        "version",
+        # Scoring
+        "slot_id",
+        "place",
+        "total_laps",
+        "lap_distance",
+        "time_into_lap",
+        "last_laptime",
+        "best_laptime",
+        "estimated_laptime",
+        "time_behind_leader",
+        "time_behind_next",
+        "laps_behind_leader",
+        "laps_behind_next",
+        "in_pits",
+        "in_garage",
+        "num_pitstops",
+        "pit_state",
+        # Telemetry
+        "pos_x",
+        "pos_y",
+        "pos_z",
+        "vel_x",
+        "vel_y",
+        "vel_z",
+        "speed",
+        "yaw_radians",
+    )
+
+    def __init__(self, int_column: array, float_column: array) -> None:
+        self.total = 0
+        self.player_index = 0
+        self.version = 0
+        self.slot_id = array("i", int_column)
+        self.place = array("i", int_column)
+        self.total_laps = array("i", int_column)
+        self.lap_distance = array("d", float_column)
+        self.time_into_lap = array("d", float_column)
+        self.last_laptime = array("d", float_column)
+        self.best_laptime = array("d", float_column)
+        self.estimated_laptime = array("d", float_column)
+        self.time_behind_leader = array("d", float_column)
+        self.time_behind_next = array("d", float_column)
+        self.laps_behind_leader = array("i", int_column)
+        self.laps_behind_next = array("i", int_column)
+        self.in_pits = array("i", int_column)
+        self.in_garage = array("i", int_column)
+        self.num_pitstops = array("i", int_column)
+        self.pit_state = array("i", int_column)
+        self.pos_x = array("d", float_column)
+        self.pos_y = array("d", float_column)
+        self.pos_z = array("d", float_column)
+        self.vel_x = array("d", float_column)
+        self.vel_y = array("d", float_column)
+        self.vel_z = array("d", float_column)
+        self.speed = array("d", float_column)
+        self.yaw_radians = array("d", float_column)
+
+    def index(self, index: int | None) -> int:
+        """Scoring index, None for local player"""
+        return self.player_index if index is None else index
+
+
+class VehicleSnapshot:
+    """Per-tick vehicle snapshot
+
+    Each update extracts vehicle fields into a new frame off to the side,
+    then publishes it with a single reference swap, so readers on other
+    threads never see a partially updated frame.
+
+    Attributes:
+        frame: Latest published frame.
+    """
+
+    __slots__ = (
+        "_int_column",
+        "_float_column",
+        "frame",
+    )
+
+    def __init__(self, size: int = MAX_VEHICLES) -> None:
+        self._int_column = array("i", [0]) * size
+        self._float_column = array("d", [0.0]) * size
+        self.frame = VehicleFrame(self._int_column, self._float_column)
+
+    def update(
+        self,
+        scor_data: rF2data.rF2Scoring,
+        tele_data: rF2data.rF2Telemetry,
+        tele_indexes: Sequence[int],
+        player_index: int,
+    ) -> None:
+        """Extract vehicle fields from scoring & telemetry data, then publish new frame
+
+        Args:
+            scor_data: Scoring data.
+            tele_data: Telemetry data.
+            tele_indexes: Scoring index to telemetry index reference list.
+            player_index: Local player scoring index.
+        """
+        frame = VehicleFrame(self._int_column, self._float_column)
+        total = min(max(scor_data.mScoringInfo.mNumVehicles, 0), len(self._int_column))
+        tele_vehicles = tele_data.mVehicles
+
+        for index, scor_veh in zip(range(total), scor_data.mVehicles):
+            frame.slot_id[index] = scor_veh.mID
+            frame.place[index] = scor_veh.mPlace
+            frame.total_laps[index] = scor_veh.mTotalLaps
+            frame.lap_distance[index] = rmnan(scor_veh.mLapDist)
+            frame.time_into_lap[index] = rmnan(scor_veh.mTimeIntoLap)
+            frame.last_laptime[index] = rmnan(scor_veh.mLastLapTime)
+            frame.best_laptime[index] = rmnan(scor_veh.mBestLapTime)
+            frame.estimated_laptime[index] = rmnan(scor_veh.mEstimatedLapTime)
+            frame.time_behind_leader[index] = rmnan(scor_veh.mTimeBehindLeader)
+            frame.time_behind_next[index] = rmnan(scor_veh.mTimeBehindNext)
+            frame.laps_behind_leader[index] = scor_veh.mLapsBehindLeader
+            frame.laps_behind_next[index] = scor_veh.mLapsBehindNext
+            frame.in_pits[index] = scor_veh.mInPits
+            frame.in_garage[index] = scor_veh.mInGarageStall
+            frame.num_pitstops[index] = scor_veh.mNumPitstops
+            frame.pit_state[index] = scor_veh.mPitState
+
+            tele_veh = tele_vehicles[tele_indexes[index]]
+            pos = tele_veh.mPos
+            frame.pos_x[index] = rmnan(pos.x)
+            frame.pos_y[index] = rmnan(pos.y)
+            frame.pos_z[index] = rmnan(pos.z)
+            vel = tele_veh.mLocalVel
+            frame.vel_x[index] = rmnan(vel.x)
+            frame.vel_y[index] = rmnan(vel.y)
+            frame.vel_z[index] = rmnan(vel.z)
+            frame.speed[index] = rmnan(vel2speed(vel.x, vel.y, vel.z))
+            ori = tele_veh.mOri[2]
+            frame.yaw_radians[index] = rmnan(oriyaw2rad(ori.x, ori.z))
+
+        frame.total = total
+        frame.player_index = player_index
+        frame.version = self.frame.version + 1
+        self.frame = frame  # publish
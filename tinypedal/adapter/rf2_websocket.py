@@ -1,14 +1,28 @@
 import asyncio
 import json
-import zlib
-import struct
 import threading
 import logging
 import contextlib
+import ctypes
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 import httpx
 import websockets
 from typing import Callable
 from ..setting import cfg
+from .rf2_connector import MMapSnapshot
+from .relay_protocol import (
+    FLAG_SPARSE,
+    RELAY_VERSION,
+    SegmentDecoder,
+    SegmentEncoder,
+    SegmentScheduler,
+    available_codecs,
+    is_relay_message,
+    pack_sparse,
+    unpack_legacy_message,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +33,18 @@ TYPE_IDS = {
     "ffb":  0x04,
 }
 
+TYPE_KEYS = {type_id: key for key, type_id in TYPE_IDS.items()}
+
+# Number of populated mVehicles entries, for sparse frames
+ACTIVE_VEHICLES = {
+    "scor": attrgetter("mScoringInfo.mNumVehicles"),
+    "tele": attrgetter("mNumVehicles"),
+}
+
 GET_PIT_MENU_URL = "http://localhost:6397/rest/garage/PitMenu/receivePitMenu"
 POST_PIT_MENU_URL = "http://localhost:6397/rest/garage/PitMenu/loadPitMenu"
+KEYFRAME_REQUEST_INTERVAL = 1.0  # seconds between receiver keyframe requests
+FRAME_QUEUE_SIZE = 4  # pending relay messages before dropping oldest
 
 
 class RF2WebSocket:
@@ -42,7 +66,21 @@ class RF2WebSocket:
         self._thread = threading.Thread(target=self._start_loop, daemon=True)
         self._callbacks: dict[str, Callable[[dict], None]] = {}
         self._pending_requests: dict[str, Callable[[dict], None]] = {}
-        
+        self._encoder = SegmentEncoder(
+            cfg.websocket_keyframe_interval,
+            cfg.websocket_compression,
+            cfg.websocket_compression_level,
+        )
+        self._scheduler = SegmentScheduler({
+            TYPE_IDS[key]: interval for key, interval in cfg.websocket_segment_intervals.items()
+        })
+        self._decoder = SegmentDecoder()
+        self._last_keyframe_request = 0.0
+        self._keyframe_pending = False
+        self._codec_pending = ""
+        self._snapshots: dict[str, MMapSnapshot] = {}
+        # Snapshot, compression & decompression run off the event loop
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="relay")
 
     def start(self):
         self._thread.start()
@@ -89,6 +127,7 @@ class RF2WebSocket:
             with contextlib.suppress(Exception):
                 self._loop.run_until_complete(self._loop.shutdown_asyncgens())
             self._loop.close()
+            self._executor.shutdown(wait=False, cancel_futures=True)
 
     async def _run(self, max_retries=5):
         retry_count = 0
@@ -105,18 +144,36 @@ class RF2WebSocket:
                     handshake = json.dumps({
                                                 "session": self._session_name,
                                                 "role": self._role,
-                                                "activation_key": cfg.auth_key  # <- uses the updated config value
+                                                "activation_key": cfg.auth_key,  # <- uses the updated config value
+                                                "protocol": RELAY_VERSION,
+                                                "codecs": available_codecs(),
                                             })
                     await ws.send(handshake)
 
+                    # New connection always starts from keyframe
+                    self._force_keyframe()
+                    self._decoder.reset()
+
                     retry_count = 0
                     backoff = 1
 
-                    tasks = [self._recv_loop(ws)]
+                    recv_queue = asyncio.Queue(FRAME_QUEUE_SIZE)
+                    tasks = [
+                        asyncio.create_task(self._recv_loop(ws, recv_queue)),
+                        asyncio.create_task(self._decode_loop(recv_queue)),
+                    ]
                     if self._role == "sender":
-                        tasks.append(self._send_loop(ws))
+                        send_queue = asyncio.Queue(FRAME_QUEUE_SIZE)
+                        tasks.append(asyncio.create_task(self._send_loop(send_queue)))
+                        tasks.append(asyncio.create_task(self._transmit_loop(ws, send_queue)))
 
-                    await asyncio.gather(*tasks)
+                    # Any loop exit ends connection, cancel the rest before reconnecting
+                    try:
+                        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                    finally:
+                        for task in tasks:
+                            task.cancel()
+                        await asyncio.gather(*tasks, return_exceptions=True)
 
             except Exception as e:
                 retry_count += 1
@@ -129,29 +186,71 @@ class RF2WebSocket:
             finally:
                 self._ws = None
 
-    async def _send_loop(self, ws):
+    async def _send_loop(self, queue: asyncio.Queue):
         ws_interval = cfg.websocket_interval
-        
+        scheduler = self._scheduler
+        loop = asyncio.get_running_loop()
+
         while self._running:
             try:
                 if self._data_provider and self._data_provider.isPaused:
                     await asyncio.sleep(ws_interval)
                     continue
 
-                frames = []
-                for key in TYPE_IDS:
-                    raw_bytes = bytes(getattr(self._data_provider, f"_{key}").data)
-                    compressed = zlib.compress(raw_bytes)
-                    frame = struct.pack("!BI", TYPE_IDS[key], len(compressed)) + compressed
-                    frames.append(frame)
+                msg = await loop.run_in_executor(self._executor, self._encode_tick, time.monotonic())
+                if msg and put_drop_oldest(queue, msg):
+                    # Dropped frame breaks delta chain on receiver side
+                    logger.debug("Send queue full, dropped oldest frame")
+                    self._force_keyframe()
+                await asyncio.sleep(max(scheduler.next_due() - time.monotonic(), 0.001))
+            except Exception as e:
+                logger.error(f"Send loop error: {e}")
+                break
 
-                await ws.send(b"".join(frames))
-                await asyncio.sleep(ws_interval)
+    async def _transmit_loop(self, ws, queue: asyncio.Queue):
+        while self._running:
+            try:
+                await ws.send(await queue.get())
             except Exception as e:
                 logger.error(f"Send loop error: {e}")
                 break
 
-    async def _recv_loop(self, ws):
+    def _encode_tick(self, now: float) -> bytes | None:
+        # Run in executor, capture & compress due segments into one message
+        if self._codec_pending:
+            self._encoder.set_codec(self._codec_pending, cfg.websocket_compression_level)
+            self._codec_pending = ""
+        if self._keyframe_pending:
+            self._keyframe_pending = False
+            self._encoder.request_keyframe()
+            self._scheduler.reset()
+
+        scheduler = self._scheduler
+        sparse_frames = cfg.websocket_sparse_frames
+        frames = []
+        for type_id in scheduler.due(now):
+            key = TYPE_KEYS[type_id]
+            snapshot = self._snapshots.get(key)
+            if snapshot is None:
+                snapshot = self._snapshots[key] = self._data_provider.snapshot(key)
+            version = snapshot.source_version()
+            if not scheduler.changed(type_id, version):
+                continue
+            if not snapshot.capture():
+                continue  # torn read, version not recorded, retry when due again
+            scheduler.record(type_id, version)
+            data = snapshot.data
+            if sparse_frames and key in ACTIVE_VEHICLES:
+                frames.append(self._encoder.encode(
+                    type_id, sparse_vehicle_bytes(data, ACTIVE_VEHICLES[key](data)), FLAG_SPARSE))
+            else:
+                frames.append(self._encoder.encode(type_id, snapshot.view))
+
+        if frames:
+            return self._encoder.pack(frames)
+        return None
+
+    async def _recv_loop(self, ws, queue: asyncio.Queue):
         while self._running:
             try:
                 msg = await ws.recv()
@@ -161,25 +260,39 @@ class RF2WebSocket:
                     await self._handle_json_message(msg)
                     continue
 
-                offset = 0
-                parts = []
-                while offset < len(msg):
-                    if offset + 5 > len(msg):
-                        raise ValueError("Invalid header")
-                    type_id = msg[offset]
-                    length = struct.unpack("!I", msg[offset + 1:offset + 5])[0]
-                    offset += 5
-                    compressed = msg[offset:offset + length]
-                    decompressed = zlib.decompress(compressed)
-                    parts.append((type_id, decompressed))
-                    offset += length
-
-                self._apply_data(parts)
+                # Dropped frame is detected as sequence gap by decoder
+                if put_drop_oldest(queue, msg):
+                    logger.debug("Receive queue full, dropped oldest frame")
 
             except Exception as e:
                 logger.warning(f"Receive loop error: {e}")
                 break
 
+    async def _decode_loop(self, queue: asyncio.Queue):
+        loop = asyncio.get_running_loop()
+
+        while self._running:
+            try:
+                msg = await queue.get()
+                await loop.run_in_executor(self._executor, self._decode_message, msg)
+
+                if self._decoder.unsupported_codec >= 0:
+                    await self._report_unsupported_codec()
+                elif self._decoder.keyframe_needed:
+                    await self._request_keyframe()
+
+            except Exception as e:
+                logger.warning(f"Receive loop error: {e}")
+                break
+
+    def _decode_message(self, msg: bytes):
+        # Run in executor, decompress & apply message to receiver
+        if is_relay_message(msg):
+            parts = self._decoder.decode(msg)
+        else:
+            parts = [(type_id, 0, data) for type_id, data in unpack_legacy_message(msg)]
+        self._apply_data(parts)
+
     async def _handle_json_message(self, msg: str):
         try:
             data = json.loads(msg)
@@ -209,6 +322,18 @@ class RF2WebSocket:
 
                 return
 
+            if msg_type == "request_keyframe" and self._role == "sender":
+                logger.debug("Keyframe requested by receiver")
+                self._force_keyframe()
+                return
+
+            if msg_type == "unsupported_codec" and self._role == "sender":
+                logger.warning(f"Receiver cannot decode codec {self._encoder.codec_id}, supports: {data.get('codecs')}")
+                # Applied by encoder worker before next frame, see _encode_tick
+                self._codec_pending = "zlib"
+                self._force_keyframe()
+                return
+
             if msg_type == "fetch_pit_menu" and self._role == "sender":
                 logger.info("Fetching pit menu from local API...")
                 async with httpx.AsyncClient() as client:
@@ -253,9 +378,34 @@ class RF2WebSocket:
             logger.error(f"Invalid JSON message received: {e}")
 
     def _apply_data(self, parts):
-        for type_id, data in parts:
+        for type_id, flags, data in parts:
             if self._data_receiver:
-                self._data_receiver.apply_segment_data(type_id, data)
+                self._data_receiver.apply_segment_data(type_id, data, bool(flags & FLAG_SPARSE))
+
+    def _force_keyframe(self):
+        # Send all segments as keyframe on next tick, including unchanged segments
+        # Applied by encoder worker, avoid touching encoder state from event loop
+        self._keyframe_pending = True
+
+    async def _request_keyframe(self):
+        # Ask sender for keyframe after missing base frame, limited rate
+        now = time.monotonic()
+        if now - self._last_keyframe_request < KEYFRAME_REQUEST_INTERVAL:
+            return
+        self._last_keyframe_request = now
+        self._decoder.keyframe_needed = False
+        await self._send_json({"type": "request_keyframe"})
+
+    async def _report_unsupported_codec(self):
+        # Ask sender to fall back to zlib, which is always available, limited rate
+        now = time.monotonic()
+        if now - self._last_keyframe_request < KEYFRAME_REQUEST_INTERVAL:
+            return
+        self._last_keyframe_request = now
+        logger.warning(f"Unsupported relay codec {self._decoder.unsupported_codec}")
+        self._decoder.unsupported_codec = -1
+        self._decoder.keyframe_needed = False
+        await self._send_json({"type": "unsupported_codec", "codecs": available_codecs()})
 
     async def _send_json(self, payload: dict):
         try:
@@ -267,3 +417,30 @@ class RF2WebSocket:
                 logger.warning("❌ Cannot send JSON: self._ws is None")
         except Exception as e:
             logger.error(f"Failed to send JSON message: {e}")
+
+
+def put_drop_oldest(queue: asyncio.Queue, item) -> bool:
+    """Put item into bounded queue, drop oldest items if full
+
+    Returns:
+        True if any item dropped.
+    """
+    dropped = False
+    while queue.full():
+        queue.get_nowait()
+        dropped = True
+    queue.put_nowait(item)
+    return dropped
+
+
+def sparse_vehicle_bytes(data: ctypes.Structure, num_vehicles: int) -> bytes:
+    """Pack struct with only populated mVehicles entries"""
+    vehicles = data.mVehicles
+    array_length = len(vehicles)
+    return pack_sparse(
+        memoryview(data).cast("B"),
+        type(data).mVehicles.offset,
+        ctypes.sizeof(vehicles) // array_length,
+        array_length,
+        range(min(max(num_vehicles, 0), array_length)),
+    )
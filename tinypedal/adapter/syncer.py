@@ -2,6 +2,7 @@ import threading
 from typing import Literal, Callable
 from .rf2_info import RF2Info
 from .remote_rf2_info import RemoteRF2Info
+from .rf2_snapshot import VehicleSnapshot
 from .rf2_websocket import RF2WebSocket
 import time
 import logging
@@ -21,13 +22,18 @@ class RF2Syncer:
                  websocket_uri: str | None = None,
                  session_name: str | None = None,
                  connect_to_remote: bool = False,
+                 vehicle_snapshot: bool = False,
                  on_role_change: Callable[[], None] | None = None):
         self._lock = threading.Lock()
         self._uri = websocket_uri
         self._session_name = session_name
+        self._vehicle_snapshot = vehicle_snapshot
+        self._tick_callback = None
 
         self._local = RF2Info()
         self._local.setMode(0)
+        if vehicle_snapshot:
+            self._local.setVehicleSnapshot(VehicleSnapshot())
         self._local.start()
 
         self._remote = None
@@ -60,7 +66,7 @@ class RF2Syncer:
                 self._ws_sender.start()
             else:
                 logger.info(f"Connecting as receiver, driving:{driving}")
-                self._remote = RemoteRF2Info(websocket_uri, session_name)
+                self._remote = RemoteRF2Info(websocket_uri, session_name, vehicle_snapshot)
 
             self._monitor_running = True
             self._monitor_thread = threading.Thread(target=self._monitor_role_switch, daemon=True)
@@ -100,7 +106,8 @@ class RF2Syncer:
                         self._ws_sender.stop()
                         self._ws_sender = None
                     if not self._remote:
-                        self._remote = RemoteRF2Info(self._uri, self._session_name)
+                        self._remote = RemoteRF2Info(self._uri, self._session_name, self._vehicle_snapshot)
+                        self._remote.setTickCallback(self._tick_callback)
 
                 if self._on_role_change:
                     logger.info("Triggering API restart due to role switch")
@@ -124,6 +131,13 @@ class RF2Syncer:
             "ffb": self._local.rf2Ffb,
         }
 
+    def setTickCallback(self, callback: Callable[[], None] | None = None):
+        """Set callback on new data version, for both local and remote source"""
+        self._tick_callback = callback
+        self._local.setTickCallback(callback)
+        if self._remote:
+            self._remote.setTickCallback(callback)
+
     def rf2ScorVeh(self, index: int | None = None):
         return self._remote.rf2ScorVeh(index) if self._remote else self._local.rf2ScorVeh(index)
 
@@ -146,6 +160,13 @@ class RF2Syncer:
     def playerIndex(self):
         return 0 if self._remote else self._local.playerIndex
 
+    def vehicleArrays(self, key: str):
+        return self._remote.vehicleArrays(key) if self._remote else self._local.vehicleArrays(key)
+
+    @property
+    def vehicleSnapshot(self):
+        return self._remote.vehicleSnapshot if self._remote else self._local.vehicleSnapshot
+
     def isPlayer(self, index: int):
         return self._remote.isPlayer(index) if self._remote else self._local.isPlayer(index)
 
@@ -173,5 +194,6 @@ def get_rf2_info(cfg) -> RF2Syncer:
         websocket_uri=api_cfg.get("websocket_uri"),
         session_name=api_cfg.get("websocket_session"),
         connect_to_remote=api_cfg.get("connect_to_remote", False),
+        vehicle_snapshot=api_cfg.get("enable_vehicle_snapshot", False),
         on_role_change=on_role_change_hook
     )
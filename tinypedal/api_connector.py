@@ -50,19 +50,26 @@ class APIDataSet(NamedTuple):
 
 
 def set_dataset_rf2(info) -> APIDataSet:
-    """Set API data set - RF2 or Remote"""
+    """Set API data set - RF2 or Remote
+
+    Read per-vehicle data from vehicle snapshot if enabled.
+    """
+    if info.vehicleSnapshot is not None:
+        lap, timing, vehicle = rf2_data.SnapshotLap, rf2_data.SnapshotTiming, rf2_data.SnapshotVehicle
+    else:
+        lap, timing, vehicle = rf2_data.Lap, rf2_data.Timing, rf2_data.Vehicle
     return APIDataSet(
         rf2_data.Check(info),
         rf2_data.Brake(info),
         rf2_data.ElectricMotor(info),
         rf2_data.Engine(info),
         rf2_data.Inputs(info),
-        rf2_data.Lap(info),
+        lap(info),
         rf2_data.Session(info),
         rf2_data.Switch(info),
-        rf2_data.Timing(info),
+        timing(info),
         rf2_data.Tyre(info),
-        rf2_data.Vehicle(info),
+        vehicle(info),
         rf2_data.Wheel(info),
     )
 
@@ -23,11 +23,19 @@ API control
 import logging
 
 from .api_connector import API_PACK
+from .module_monitor import monitor
+from .module_scheduler import scheduler
 from .setting import cfg
 
 logger = logging.getLogger(__name__)
 
 
+def notify_data_update():
+    """Notify new data version, called from API sync thread"""
+    monitor.data_updated()
+    scheduler.notify()
+
+
 class APIControl:
     """API Control"""
 
@@ -66,6 +74,9 @@ class APIControl:
         self.setup()
         self._api.start()
 
+        # Notify module tick scheduler & monitor on new data version
+        self._api.info.setTickCallback(notify_data_update)
+
         # Register role change hook after API starts
         try:
             import tinypedal.hook
@@ -57,6 +57,7 @@ class FileExt:
     ALL = ".*"
     LOG = ".log"
     CSV = ".csv"
+    DB = ".db"
     TXT = ".txt"
     INI = ".ini"
     BAK = ".bak"
@@ -66,8 +67,11 @@ class FileExt:
     PNG = ".png"
     # Specific
     CONSUMPTION = ".consumption"
+    DELTA = ".delta"
     ENERGY = ".energy"
+    ENERGY_DELTA = ".energydelta"
     FUEL = ".fuel"
+    FUEL_DELTA = ".fueldelta"
     SECTOR = ".sector"
     TPPN = ".tppn"
     TPTN = ".tptn"
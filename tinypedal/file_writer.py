@@ -0,0 +1,167 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+File writer
+
+Write-behind userfile saving, so module update loops don't wait on disk.
+Save tasks are queued and run in order by a single background thread,
+which exits after idle for a while, and restarts on next submit.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import threading
+from collections import deque
+from contextlib import contextmanager
+from time import monotonic
+from typing import Any, Callable, Iterator
+
+MAX_PENDING = 64  # max queued tasks, submit waits for free slot if full
+IDLE_TIMEOUT = 5.0  # seconds, writer thread exits after idle timeout
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def atomic_open(filename_full: str, mode: str = "w", **kwargs: Any) -> Iterator[Any]:
+    """Open temporary file for writing, then replace target file after writing finished
+
+    Target file is left untouched if writing failed.
+
+    Args:
+        filename_full: Target file full path.
+        mode: File open mode, "w" or "wb".
+        kwargs: Other file open arguments, such as encoding, newline.
+    """
+    filepath, filename = os.path.split(filename_full)
+    temp_file = tempfile.NamedTemporaryFile(
+        mode, dir=filepath or None, prefix=f".{filename}.", suffix=".tmp", delete=False, **kwargs)
+    try:
+        with temp_file:
+            yield temp_file
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(temp_file.name, filename_full)
+    except BaseException:
+        try:
+            os.remove(temp_file.name)
+        except OSError:
+            pass
+        raise
+
+
+class FileWriter:
+    """Write-behind file writer
+
+    Tasks are identified by key (usually target file full path).
+    Pending task of same key is replaced by newer task (coalesced),
+    unless task is submitted with coalesce disabled,
+    such as incremental update that reads back file content.
+    """
+
+    __slots__ = (
+        "_condition",
+        "_pending",
+        "_running",
+        "_thread",
+    )
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._pending: deque[list] = deque()  # [key, task, coalesce]
+        self._running = ""  # key of running task
+        self._thread: threading.Thread | None = None
+
+    def submit(self, key: str, task: Callable[[], Any], coalesce: bool = True):
+        """Submit save task
+
+        Args:
+            key: Task key, usually target file full path.
+            task: Save task, should only use data that won't be modified after submit.
+            coalesce: Whether to replace pending task of same key.
+        """
+        with self._condition:
+            if coalesce:
+                for entry in self._pending:
+                    if entry[0] == key and entry[2]:
+                        entry[1] = task  # keep queue order
+                        return
+            while len(self._pending) >= MAX_PENDING:
+                self._condition.wait()
+            self._pending.append([key, task, coalesce])
+            if self._thread is None:
+                self._thread = threading.Thread(target=self.__writing, daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def pending(self) -> int:
+        """Number of pending & running tasks"""
+        with self._condition:
+            return len(self._pending) + bool(self._running)
+
+    def wait(self, key: str, timeout: float | None = None) -> bool:
+        """Wait for pending & running tasks of key to finish, returns false if timeout"""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._running != key and all(entry[0] != key for entry in self._pending),
+                timeout,
+            )
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait for all pending & running tasks to finish, returns false if timeout"""
+        timer_start = monotonic()
+        with self._condition:
+            pending = len(self._pending) + bool(self._running)
+            flushed = self._condition.wait_for(
+                lambda: not self._pending and not self._running, timeout)
+        if not pending:
+            return True
+        if flushed:
+            logger.info(
+                "USERDATA: flushed %s task(s) (took %sms)",
+                pending, round((monotonic() - timer_start) * 1000))
+        else:
+            logger.warning("USERDATA: flush timeout, %s task(s) pending", self.pending())
+        return flushed
+
+    def __writing(self):
+        """Writing tasks"""
+        condition = self._condition
+        while True:
+            with condition:
+                if not self._pending and not condition.wait_for(lambda: self._pending, IDLE_TIMEOUT):
+                    self._thread = None
+                    return
+                key, task, _ = self._pending.popleft()
+                self._running = key
+                condition.notify_all()
+            try:
+                task()
+            except Exception:
+                logger.exception("USERDATA: failed saving %s", key)
+            finally:
+                with condition:
+                    self._running = ""
+                    condition.notify_all()
+
+
+file_writer = FileWriter()
@@ -27,6 +27,7 @@ import sys
 
 from .api_control import api
 from .const_file import FileExt
+from .file_writer import file_writer
 from .module_control import mctrl, wctrl
 from .overlay_control import octrl
 from .setting import cfg
@@ -75,6 +76,8 @@ def close():
     unload_modules()
     # 2 stop api
     api.stop()
+    # 3 flush pending userfile saves
+    file_writer.flush()
 
 
 def restart():
@@ -82,6 +85,8 @@ def restart():
     logger.info("RESTARTING............")
     # Set restart env for skipping single instance check
     os.environ["TINYPEDAL_RESTART"] = "TRUE"
+    # Flush pending userfile saves
+    file_writer.flush()
     if "tinypedal.exe" in sys.executable:  # if run as exe
         os.execl(sys.executable, *sys.argv)
     else:  # if run as script
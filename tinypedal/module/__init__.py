@@ -27,6 +27,7 @@ in template/setting_module.py dictionary.
 __all__ = [
     "module_delta",
     "module_energy",
+    "module_export",
     "module_force",
     "module_fuel",
     "module_hybrid",
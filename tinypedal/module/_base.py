@@ -24,6 +24,8 @@ import logging
 import threading
 from functools import partial
 
+from ..module_monitor import monitor
+from ..module_scheduler import ModuleEvent
 from ..overlay_control import octrl
 from ..setting import Setting
 
@@ -34,7 +36,23 @@ round6 = partial(round, ndigits=6)
 
 
 class DataModule:
-    """Data module base"""
+    """Data module base
+
+    Set TICK_SCHEDULED to False in child class if update loop blocks
+    (such as running own async tasks), to exclude from module tick scheduler.
+
+    Declare minfo fields in child class, see module_graph:
+        PRODUCES: output fields.
+        CONSUMES: required input fields, producer modules are auto-enabled
+            (and auto-disabled when no longer required by running modules),
+            and updated before this module in same tick.
+        CONSUMES_OPTIONAL: optional input fields, read latest available value.
+    """
+
+    TICK_SCHEDULED = True
+    PRODUCES = ()
+    CONSUMES = ()
+    CONSUMES_OPTIONAL = ()
 
     __slots__ = (
         "module_name",
@@ -59,7 +77,7 @@ class DataModule:
         self.mcfg: dict = self.cfg.user.setting[module_name]
 
         # Module update interval
-        self._event = threading.Event()
+        self._event = ModuleEvent()
         self.active_interval = max(
             self.mcfg["update_interval"],
             self.cfg.application["minimum_update_interval"]) / 1000
@@ -73,6 +91,7 @@ class DataModule:
         if self.closed:
             self.closed = False
             self._event.clear()
+            self._event.timing = monitor.register(self.module_name)
             threading.Thread(target=self.__tasks, daemon=True).start()
             logger.info("ENABLED: %s", self.module_name.replace("_", " "))
 
@@ -87,5 +106,6 @@ class DataModule:
         """Run tasks in separated thread"""
         self.update_data()
         # Wait update_data exit
+        monitor.unregister(self.module_name)
         self.closed = True
         logger.info("DISABLED: %s", self.module_name.replace("_", " "))
@@ -31,8 +31,12 @@ from ..const_common import (
     MAX_SECONDS,
     POS_XYZ_ZERO,
 )
+from ..const_file import FileExt
+from ..file_writer import file_writer
 from ..module_info import minfo
+from ..process.delta import DeltaEngine
 from ..userfile.delta_best import load_delta_best_file, save_delta_best_file
+from ..userfile.delta_binary import delta_filename_full
 from ..validator import is_same_session, valid_delta_raw, vehicle_position_sync
 from ._base import DataModule, round6
 
@@ -40,6 +44,8 @@ from ._base import DataModule, round6
 class Realtime(DataModule):
     """Delta time data"""
 
+    PRODUCES = ("delta",)
+
     __slots__ = ()
 
     def __init__(self, config, module_name):
@@ -55,16 +61,21 @@ class Realtime(DataModule):
         output = minfo.delta
 
         last_session_id = ("",-1,-1,-1)
-        delta_array_session = DELTA_DEFAULT
-        delta_array_stint = DELTA_DEFAULT
         laptime_session_best = MAX_SECONDS
         laptime_stint_best = MAX_SECONDS
         min_delta_distance = self.mcfg["minimum_delta_distance"]
+        export_csv = self.mcfg["enable_csv_export"]
 
-        calc_ema_delta = partial(
-            calc.exp_mov_avg,
-            calc.ema_factor(min(max(self.mcfg["delta_smoothing_samples"], 1), 100))
-        )
+        # Delta references, extra references can be registered to engine
+        delta_engine = DeltaEngine(
+            calc.ema_factor(min(max(self.mcfg["delta_smoothing_samples"], 1), 100)))
+        delta_ref_best = delta_engine.register("best")
+        delta_ref_last = delta_engine.register("last")
+        delta_ref_session = delta_engine.register("session")
+        delta_ref_stint = delta_engine.register("stint")
+        reference_file_suffix = self.mcfg["reference_lap_file_suffix"]
+        if reference_file_suffix:
+            delta_ref_file = delta_engine.register("file")
         calc_ema_laptime = partial(
             calc.exp_mov_avg,
             calc.ema_factor(min(max(self.mcfg["laptime_pace_samples"], 1), 20))
@@ -89,7 +100,7 @@ class Realtime(DataModule):
 
                     # Reset delta session best if not same session
                     if not is_same_session(combo_id, session_id, last_session_id):
-                        delta_array_session = DELTA_DEFAULT
+                        delta_ref_session.load(DELTA_DEFAULT)
                         laptime_session_best = MAX_SECONDS
                         last_session_id = (combo_id, *session_id)
 
@@ -99,13 +110,22 @@ class Realtime(DataModule):
                         defaults=(DELTA_DEFAULT, MAX_SECONDS)
                     )
                     output.deltaBestData = delta_array_best
+                    delta_ref_best.load(delta_array_best)
+                    delta_ref_last.load(DELTA_DEFAULT)  # last lap
+                    if reference_file_suffix:  # such as teammate lap
+                        delta_ref_file.load(load_delta_best_file(
+                            filepath=userpath_delta_best,
+                            filename=f"{combo_id}{reference_file_suffix}",
+                            defaults=(DELTA_DEFAULT, MAX_SECONDS)
+                        )[0])
+                    delta_engine.reset()
                     delta_array_raw = [DELTA_ZERO]  # distance, laptime
-                    delta_array_last = DELTA_DEFAULT  # last lap
 
                     delta_ema_best = 0.0
                     delta_ema_last = 0.0
                     delta_ema_session = 0.0
                     delta_ema_stint = 0.0
+                    output.deltaReferences = delta_engine.deltas()
 
                     laptime_curr = 0.0  # current laptime
                     laptime_last = 0.0  # last laptime
@@ -131,7 +151,7 @@ class Realtime(DataModule):
 
                 # Reset delta stint best if in pit and stopped
                 if in_pits and laptime_stint_best != MAX_SECONDS and api.read.vehicle.speed() < 0.1:
-                    delta_array_stint = DELTA_DEFAULT
+                    delta_ref_stint.load(DELTA_DEFAULT)
                     laptime_stint_best = MAX_SECONDS
 
                 # Lap start & finish detection
@@ -139,7 +159,7 @@ class Realtime(DataModule):
                     laptime_last = lap_stime - last_lap_stime
                     if valid_delta_raw(delta_array_raw, laptime_last, 1):  # set end value
                         delta_array_raw.append((round6(pos_last + 10), round6(laptime_last)))
-                        delta_array_last = tuple(delta_array_raw)
+                        delta_ref_last.load(delta_array_raw)
                         validating = api.read.timing.elapsed()
                     delta_array_raw[:] = DELTA_DEFAULT
                     pos_last = pos_recorded = pos_curr
@@ -181,20 +201,26 @@ class Realtime(DataModule):
                         # Update delta best list
                         if laptime_best > laptime_last:
                             laptime_best = laptime_last
-                            output.deltaBestData = delta_array_best = delta_array_last
-                            save_delta_best_file(
-                                filepath=userpath_delta_best,
-                                filename=combo_id,
-                                dataset=delta_array_best,
+                            delta_ref_best.assign(delta_ref_last)
+                            output.deltaBestData = delta_array_best = delta_ref_last.rows()
+                            file_writer.submit(
+                                delta_filename_full(userpath_delta_best, combo_id, FileExt.CSV),
+                                partial(
+                                    save_delta_best_file,
+                                    filepath=userpath_delta_best,
+                                    filename=combo_id,
+                                    dataset=delta_array_best,
+                                    export_csv=export_csv,
+                                ),
                             )
                         # Update delta session best list
                         if laptime_session_best > laptime_last:
                             laptime_session_best = laptime_last
-                            delta_array_session = delta_array_last
+                            delta_ref_session.assign(delta_ref_last)
                         # Update delta stint best list
                         if laptime_stint_best > laptime_last:
                             laptime_stint_best = laptime_last
-                            delta_array_stint = delta_array_last
+                            delta_ref_stint.assign(delta_ref_last)
                         validating = 0
 
                 # Calc distance
@@ -213,43 +239,13 @@ class Realtime(DataModule):
                 if pos_synced_last != pos_synced:
                     pos_synced_last = pos_synced
                     delay_update = laptime_curr > 0.3
-                    # Smooth delta
-                    delta_ema_best = calc_ema_delta(
-                        delta_ema_best,
-                        calc.delta_telemetry(
-                            delta_array_best,
-                            pos_synced,
-                            laptime_curr,
-                            delay_update,
-                        ),
-                    )
-                    delta_ema_last = calc_ema_delta(
-                        delta_ema_last,
-                        calc.delta_telemetry(
-                            delta_array_last,
-                            pos_synced,
-                            laptime_curr,
-                            delay_update,
-                        ),
-                    )
-                    delta_ema_session = calc_ema_delta(
-                        delta_ema_session,
-                        calc.delta_telemetry(
-                            delta_array_session,
-                            pos_synced,
-                            laptime_curr,
-                            delay_update,
-                        ),
-                    )
-                    delta_ema_stint = calc_ema_delta(
-                        delta_ema_stint,
-                        calc.delta_telemetry(
-                            delta_array_stint,
-                            pos_synced,
-                            laptime_curr,
-                            delay_update,
-                        ),
-                    )
+                    # Smooth delta, all references in one pass
+                    delta_engine.update(pos_synced, laptime_curr, delay_update)
+                    delta_ema_best = delta_engine.delta("best")
+                    delta_ema_last = delta_engine.delta("last")
+                    delta_ema_session = delta_engine.delta("session")
+                    delta_ema_stint = delta_engine.delta("stint")
+                    output.deltaReferences = delta_engine.deltas()
 
                 # Output delta time data
                 output.deltaBest = delta_ema_best
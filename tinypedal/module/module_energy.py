@@ -33,6 +33,17 @@ from .module_fuel import calc_consumption
 class Realtime(DataModule):
     """Energy usage data"""
 
+    PRODUCES = ("energy", "hybrid.fuelEnergyRatio", "hybrid.fuelEnergyBias")
+    CONSUMES = (
+        "delta.lapTimePace",
+        "fuel.estimatedConsumption",
+        "fuel.estimatedLaps",
+    )
+    CONSUMES_OPTIONAL = (
+        "restapi.maxVirtualEnergy",
+        "restapi.currentVirtualEnergy",
+    )
+
     __slots__ = ()
 
     def __init__(self, config, module_name):
@@ -61,6 +72,7 @@ class Realtime(DataModule):
                         filename=combo_id,
                         extension=FileExt.ENERGY,
                         min_delta_distance=self.mcfg["minimum_delta_distance"],
+                        export_csv=self.mcfg["enable_csv_export"],
                     )
                     # Reset module output
                     minfo.energy.reset()
@@ -0,0 +1,261 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Export module
+
+Publish selected minfo fields as fixed binary layout to named shared memory block
+(see shared_block), for external processes. Layout is described by schema JSON file.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import struct
+import zlib
+from operator import attrgetter
+from typing import Any, Callable, NamedTuple
+
+from ..const_common import MAX_VEHICLES
+from ..const_file import FileExt
+from ..module_info import minfo
+from ..shared_block import SharedBlock, header_schema
+from ._base import DataModule
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_SUFFIX = "_schema"
+
+
+class ExportField(NamedTuple):
+    """Export field
+
+    name: Field name, "group.field".
+    fmt: Struct format character.
+    count: Number of values, padded with default value if shorter.
+    getter: Value getter from minfo.
+    default: Padding value.
+    """
+
+    name: str
+    fmt: str
+    count: int
+    getter: Callable[[Any], Any]
+    default: Any = 0
+
+
+def scalar_fields(group: str, names: tuple[str, ...], fmt: str = "d") -> tuple[ExportField, ...]:
+    """Create single value export fields of minfo group"""
+    return tuple(
+        ExportField(f"{group}.{name}", fmt, 1, attrgetter(f"{group}.{name}"))
+        for name in names
+    )
+
+
+def relative_count(info: Any) -> int:
+    """Number of relative entries"""
+    return len(info.relative.relative)
+
+
+def relative_times(info: Any) -> list[float]:
+    """Relative time gaps"""
+    return [entry[0] for entry in info.relative.relative]
+
+
+def relative_indexes(info: Any) -> list[int]:
+    """Relative vehicle indexes"""
+    return [entry[1] for entry in info.relative.relative]
+
+
+def standings_count(info: Any) -> int:
+    """Number of standings entries"""
+    return len(info.relative.standings)
+
+
+FUEL_FIELDS = (
+    "capacity",
+    "amountStart",
+    "amountCurrent",
+    "amountUsedCurrent",
+    "amountEndStint",
+    "neededRelative",
+    "neededAbsolute",
+    "lastLapConsumption",
+    "estimatedConsumption",
+    "estimatedValidConsumption",
+    "estimatedLaps",
+    "estimatedMinutes",
+    "estimatedNumPitStopsEnd",
+    "estimatedNumPitStopsEarly",
+    "expectedConsumption",
+    "deltaConsumption",
+    "oneLessPitConsumption",
+)
+
+EXPORT_GROUPS = {
+    "delta": scalar_fields("delta", ("isValidLap",), "?") + scalar_fields("delta", (
+        "deltaBest",
+        "deltaLast",
+        "deltaSession",
+        "deltaStint",
+        "lapTimeCurrent",
+        "lapTimeLast",
+        "lapTimeBest",
+        "lapTimeEstimated",
+        "lapTimeSession",
+        "lapTimeStint",
+        "lapTimePace",
+        "lapDistance",
+    )),
+    "energy": scalar_fields("energy", FUEL_FIELDS),
+    "fuel": scalar_fields("fuel", FUEL_FIELDS),
+    "relative": (
+        ExportField("relative.relativeCount", "i", 1, relative_count),
+        ExportField("relative.relativeTime", "d", MAX_VEHICLES, relative_times, 0.0),
+        ExportField("relative.relativeIndex", "h", MAX_VEHICLES, relative_indexes, -1),
+        ExportField("relative.standingsCount", "i", 1, standings_count),
+        ExportField("relative.standings", "h", MAX_VEHICLES, attrgetter("relative.standings"), -1),
+    ),
+}
+
+
+class ExportLayout:
+    """Export binary layout
+
+    Args:
+        fields: Export fields, packed in order without padding (little-endian).
+
+    Attributes:
+        fields: Export fields.
+        packer: Payload struct.
+        schema: Layout description dict.
+        layout_id: Checksum of layout description.
+    """
+
+    __slots__ = (
+        "fields",
+        "packer",
+        "schema",
+        "layout_id",
+    )
+
+    def __init__(self, fields: tuple[ExportField, ...]):
+        self.fields = fields
+        self.packer = struct.Struct("<" + "".join(f"{field.count}{field.fmt}" for field in fields))
+        offset = 0
+        field_schema = []
+        for field in fields:
+            field_schema.append({
+                "name": field.name,
+                "type": field.fmt,
+                "count": field.count,
+                "offset": offset,
+            })
+            offset += struct.calcsize(f"<{field.count}{field.fmt}")
+        self.layout_id = zlib.crc32(json.dumps(field_schema).encode())
+        self.schema = {
+            "header": header_schema(),
+            "layout_id": self.layout_id,
+            "payload_size": self.packer.size,
+            "fields": field_schema,
+        }
+
+    def values(self, info: Any) -> list:
+        """Flatten field values from minfo"""
+        output = []
+        for field in self.fields:
+            value = field.getter(info)
+            if field.count == 1:
+                output.append(value)
+                continue
+            value = value[:field.count]
+            output.extend(value)
+            if len(value) < field.count:
+                output.extend([field.default] * (field.count - len(value)))
+        return output
+
+    def pack(self, info: Any) -> bytes:
+        """Pack payload from minfo"""
+        return self.packer.pack(*self.values(info))
+
+
+def create_layout(mcfg: dict) -> ExportLayout:
+    """Create export layout from enabled export groups"""
+    fields = ()
+    for group, group_fields in EXPORT_GROUPS.items():
+        if mcfg[f"enable_{group}_export"]:
+            fields += group_fields
+    return ExportLayout(fields)
+
+
+def save_schema_file(layout: ExportLayout, name: str, filepath: str):
+    """Save layout schema JSON file"""
+    schema = {"name": name, **layout.schema}
+    filename = f"{filepath}{name}{SCHEMA_SUFFIX}{FileExt.JSON}"
+    try:
+        with open(filename, "w", encoding="utf-8") as jsonfile:
+            json.dump(schema, jsonfile, indent=4)
+    except (OSError, TypeError, ValueError):
+        logger.error("export: failed saving schema file %s", filename)
+
+
+class Realtime(DataModule):
+    """Export data"""
+
+    CONSUMES_OPTIONAL = ("delta", "energy", "fuel", "relative")
+
+    __slots__ = ()
+
+    def __init__(self, config, module_name):
+        super().__init__(config, module_name)
+
+    def update_data(self):
+        """Update module data"""
+        _event_wait = self._event.wait
+        reset = False
+        update_interval = self.active_interval
+
+        name = self.mcfg["shared_memory_name"]
+        layout = create_layout(self.mcfg)
+        try:
+            block = SharedBlock(name, layout.packer.size, create=True, layout_id=layout.layout_id)
+        except (OSError, ValueError):
+            logger.error("export: failed creating shared memory %s", name)
+            return
+        save_schema_file(layout, name, self.cfg.path.config)
+        last_payload = b""
+
+        while not _event_wait(update_interval):
+            if self.state.active:
+
+                if not reset:
+                    reset = True
+                    update_interval = self.active_interval
+
+                payload = layout.pack(minfo)
+                if last_payload != payload:
+                    last_payload = payload
+                    block.write(payload)
+
+            else:
+                if reset:
+                    reset = False
+                    update_interval = self.idle_interval
+
+        block.close()
@@ -31,6 +31,8 @@ from ._base import DataModule
 class Realtime(DataModule):
     """Force data"""
 
+    PRODUCES = ("force",)
+
     __slots__ = ()
 
     def __init__(self, config, module_name):
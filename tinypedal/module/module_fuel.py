@@ -22,6 +22,7 @@ Fuel module
 
 from __future__ import annotations
 
+from functools import partial
 from math import ceil
 from typing import Callable
 
@@ -29,11 +30,13 @@ from .. import calculation as calc
 from ..api_control import api
 from ..const_common import DELTA_DEFAULT, DELTA_ZERO, FLOAT_INF, POS_XYZ_ZERO
 from ..const_file import FileExt
+from ..file_writer import file_writer
 from ..module_info import ConsumptionDataSet, FuelInfo, minfo
 from ..userfile.consumption_history import (
     load_consumption_history_file,
     save_consumption_history_file,
 )
+from ..userfile.delta_binary import delta_filename_full
 from ..userfile.fuel_delta import (
     load_fuel_delta_file,
     save_fuel_delta_file,
@@ -45,6 +48,20 @@ from ._base import DataModule, round6
 class Realtime(DataModule):
     """Fuel usage data"""
 
+    PRODUCES = ("fuel", "history")
+    CONSUMES = (
+        "delta.lapTimePace",
+        "delta.lapTimeLast",
+        "delta.lapTimeCurrent",
+        "delta.isValidLap",
+    )
+    CONSUMES_OPTIONAL = (
+        "energy.lastLapConsumption",
+        "hybrid.batteryDrainLast",
+        "hybrid.batteryRegenLast",
+        "wheels.lastLapTreadWear",
+    )
+
     __slots__ = ()
 
     def __init__(self, config, module_name):
@@ -73,6 +90,7 @@ class Realtime(DataModule):
                         filename=combo_id,
                         extension=FileExt.FUEL,
                         min_delta_distance=self.mcfg["minimum_delta_distance"],
+                        export_csv=self.mcfg["enable_csv_export"],
                     )
                     # Reset module output
                     minfo.fuel.reset()
@@ -130,10 +148,14 @@ def load_consumption_history(filepath: str, combo_id: str):
 def save_consumption_history(filepath: str, combo_id: str):
     """Save consumption history"""
     if minfo.history.consumptionDataVersion != hash(combo_id):
-        save_consumption_history_file(
-            dataset=minfo.history.consumptionDataSet,
-            filepath=filepath,
-            filename=combo_id,
+        file_writer.submit(
+            f"{filepath}{combo_id}{FileExt.CONSUMPTION}",
+            partial(
+                save_consumption_history_file,
+                dataset=tuple(minfo.history.consumptionDataSet),
+                filepath=filepath,
+                filename=combo_id,
+            ),
         )
         minfo.history.consumptionDataVersion = hash(combo_id)  # reset
 
@@ -164,7 +186,7 @@ def telemetry_battery() -> tuple[float, float]:
 @generator_init
 def calc_consumption(
     output: FuelInfo, telemetry_func: Callable, filepath: str, filename: str, extension: str,
-    min_delta_distance: float):
+    min_delta_distance: float, export_csv: bool = False):
     """Calculate consumption data"""
     recording = False
     delayed_save = False
@@ -211,11 +233,16 @@ def calc_consumption(
         # Save check
         if not updating:
             if delayed_save:
-                save_fuel_delta_file(
-                    filepath=filepath,
-                    filename=filename,
-                    extension=extension,
-                    dataset=delta_array_last,
+                file_writer.submit(
+                    delta_filename_full(filepath, filename, extension),
+                    partial(
+                        save_fuel_delta_file,
+                        filepath=filepath,
+                        filename=filename,
+                        extension=extension,
+                        dataset=delta_array_last,
+                        export_csv=export_csv,
+                    ),
                 )
             continue
 
@@ -30,6 +30,8 @@ from ._base import DataModule
 class Realtime(DataModule):
     """Hybrid data"""
 
+    PRODUCES = ("hybrid",)
+
     __slots__ = ()
 
     def __init__(self, config, module_name):
@@ -20,9 +20,12 @@
 Mapping module
 """
 
+from functools import partial
+
 from .. import calculation as calc
 from ..api_control import api
 from ..const_file import FileExt
+from ..file_writer import file_writer
 from ..module_info import minfo
 from ..userfile.track_info import load_track_info, save_track_info
 from ..userfile.track_map import load_track_map_file, save_track_map_file
@@ -33,6 +36,8 @@ from ._base import DataModule, round4
 class Realtime(DataModule):
     """Mapping data"""
 
+    PRODUCES = ("mapping",)
+
     __slots__ = ()
 
     def __init__(self, config, module_name):
@@ -309,12 +314,16 @@ class MapRecorder:
         self.output.dists = self._temp_data.dists
         self.output.sectors = self._temp_data.sectors
         # Save to svg file
-        save_track_map_file(
-            filepath=self._filepath,
-            filename=self._filename,
-            view_box=calc.svg_view_box(self._temp_data.coords, 20),
-            raw_coords=self._temp_data.coords,
-            raw_dists=self._temp_data.dists,
-            sector_index=self._temp_data.sectors,
+        file_writer.submit(
+            f"{self._filepath}{self._filename}{FileExt.SVG}",
+            partial(
+                save_track_map_file,
+                filepath=self._filepath,
+                filename=self._filename,
+                view_box=calc.svg_view_box(self._temp_data.coords, 20),
+                raw_coords=self._temp_data.coords,
+                raw_dists=self._temp_data.dists,
+                sector_index=self._temp_data.sectors,
+            ),
         )
         #logger.info("map saved, stopped map recording")
@@ -42,6 +42,9 @@ from ._base import DataModule
 class Realtime(DataModule):
     """Notes data"""
 
+    PRODUCES = ("pacenotes", "tracknotes")
+    CONSUMES = ("delta.lapDistance",)
+
     __slots__ = ()
 
     def __init__(self, config, module_name):
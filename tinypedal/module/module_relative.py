@@ -22,8 +22,15 @@ Relative module
 
 from __future__ import annotations
 
+import logging
 from itertools import chain
 from operator import itemgetter
+from typing import Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 from ..api_control import api
 from ..calculation import asym_max, zero_max
@@ -31,6 +38,8 @@ from ..const_common import MAX_SECONDS, MAX_VEHICLES, REL_TIME_DEFAULT
 from ..module_info import minfo
 from ._base import DataModule
 
+logger = logging.getLogger(__name__)
+
 REF_PLACES = tuple(range(1, MAX_VEHICLES + 1))
 TEMP_RELATIVE_AHEAD = [[0, -1] for _ in range(MAX_VEHICLES)]
 TEMP_RELATIVE_BEHIND = [[0, -1] for _ in range(MAX_VEHICLES)]
@@ -42,6 +51,8 @@ TEMP_DRAW_ORDER = list(range(MAX_VEHICLES))
 class Realtime(DataModule):
     """Relative & standings data"""
 
+    PRODUCES = ("relative",)
+
     __slots__ = ()
 
     def __init__(self, config, module_name):
@@ -82,24 +93,34 @@ class Realtime(DataModule):
                         setting_standings["max_vehicles_per_split_others"], min_top_veh, 0)
                     veh_limit_player = max_vehicles_in_class(
                         setting_standings["max_vehicles_per_split_player"], min_top_veh, 2)
+                    use_array_engine = self.mcfg["enable_vectorized_engine"]
+                    if use_array_engine and np is None:
+                        use_array_engine = False
+                        logger.warning("relative: NumPy not available, use default engine")
 
                 # Base info
                 veh_total = max(api.read.vehicle.total_vehicles(), 1)
                 plr_index = api.read.vehicle.player_index()
                 plr_place = api.read.vehicle.place()
 
-                # Get vehicles info
-                (relative_ahead, relative_behind, classes_list, draw_order_list, is_multi_class,
-                 ) = get_vehicles_info(veh_total, plr_index, show_in_garage)
+                if use_array_engine:
+                    (relative_ahead, relative_behind, classes_list, draw_order_list, is_multi_class,
+                     class_pos_list, plr_class_name, plr_class_place,
+                     ) = compute_vehicles_info_array(
+                        plr_index, show_in_garage, *gather_vehicles_data())
+                else:
+                    # Get vehicles info
+                    (relative_ahead, relative_behind, classes_list, draw_order_list, is_multi_class,
+                     ) = get_vehicles_info(veh_total, plr_index, show_in_garage)
+
+                    # Create vehicle class position list (initially ordered by class name)
+                    class_pos_list, plr_class_name, plr_class_place = create_position_in_class(
+                        classes_list, plr_index)
 
                 # Create relative index list
                 relative_index_list = create_relative_index(
                     relative_ahead, relative_behind, plr_index, max_veh_front, max_veh_behind)
 
-                # Create vehicle class position list (initially ordered by class name)
-                class_pos_list, plr_class_name, plr_class_place = create_position_in_class(
-                    classes_list, plr_index)
-
                 # Create standings index list
                 if is_split_mode and is_multi_class:
                     standings_index_list = list(chain(*list(create_class_standings_index(
@@ -196,13 +217,7 @@ def get_vehicles_info(veh_total: int, plr_index: int, show_in_garage: bool):
             last_class_name = class_name
             classes_count += 1
 
-    # Finalize draw order list
-    if 0 <= leader_index < veh_total and leader_index != draw_order[-1]:  # move leader to end
-        leader_pos = draw_order.index(leader_index)
-        draw_order[leader_pos], draw_order[-1] = draw_order[-1], draw_order[leader_pos]
-    if 0 <= plr_index < veh_total and plr_index != leader_index:   # move player to 2nd end if not leader
-        player_pos = draw_order.index(plr_index)
-        draw_order[player_pos], draw_order[-2] = draw_order[-2], draw_order[player_pos]
+    finalize_draw_order(draw_order, veh_total, leader_index, plr_index)
 
     # Sort output in-place
     relative_ahead = TEMP_RELATIVE_AHEAD[:recorded_index]
@@ -223,6 +238,157 @@ def get_vehicles_info(veh_total: int, plr_index: int, show_in_garage: bool):
     )
 
 
+def finalize_draw_order(draw_order: list, veh_total: int, leader_index: int, plr_index: int):
+    """Finalize draw order list, move leader to end, then player to 2nd end"""
+    if 0 <= leader_index < veh_total and leader_index != draw_order[-1]:  # move leader to end
+        leader_pos = draw_order.index(leader_index)
+        draw_order[leader_pos], draw_order[-1] = draw_order[-1], draw_order[leader_pos]
+    if 0 <= plr_index < veh_total and plr_index != leader_index:   # move player to 2nd end if not leader
+        player_pos = draw_order.index(plr_index)
+        draw_order[player_pos], draw_order[-2] = draw_order[-2], draw_order[player_pos]
+
+
+def gather_vehicles_data():
+    """Gather vehicles data columns for array engine, read from all-vehicle columns"""
+    read_vehicle = api.read.vehicle
+    read_timing = api.read.timing
+    return (
+        read_timing.estimated_laptime(),
+        read_timing.estimated_time_into(),
+        read_vehicle.in_garage_column(),
+        read_vehicle.in_pits_column(),
+        read_timing.estimated_time_into_column(),
+        read_vehicle.class_name_column(),
+        read_vehicle.place_column(),
+        read_timing.best_laptime_column(),
+        read_timing.last_laptime_column(),
+    )
+
+
+def compute_vehicles_info_array(
+    plr_index: int, show_in_garage: bool, laptime_est: float, plr_time: float,
+    in_garage: Sequence, in_pits: Sequence, time_into: Sequence, class_names: list,
+    places: Sequence, laptime_best: Sequence, laptime_last: Sequence):
+    """Compute vehicles info with array operations (requires NumPy)
+
+    Produce same output as get_vehicles_info & create_position_in_class combined.
+    Same as default engine, at least 1 vehicle (zeroed vehicle data if no vehicle).
+    """
+    if not len(places):
+        in_garage, in_pits, time_into, class_names, places, laptime_best, laptime_last = (
+            (False,), (False,), (0.0,), [""], (0,), (0.0,), (0.0,))
+    veh_total = len(places)
+    indexes = np.arange(veh_total)
+    garage = np.asarray(in_garage, dtype=bool)
+    pitlane = np.asarray(in_pits, dtype=bool) | garage
+    place_overall = np.array(places, dtype=np.int64)
+
+    # Relative time gap, sort by reversed time gap then reversed index
+    if laptime_est:
+        relative_mask = indexes != plr_index
+        if not show_in_garage:
+            relative_mask &= ~garage
+        relative_index = indexes[relative_mask]
+        diff_time = np.asarray(time_into, dtype=np.float64)[relative_mask] - plr_time
+        diff_time = diff_time - diff_time // laptime_est * laptime_est
+        diff_time_ahead = np.where(diff_time < 0, diff_time + laptime_est, diff_time)
+        diff_time_behind = np.where(diff_time > 0, diff_time - laptime_est, diff_time)
+        order = np.lexsort((relative_index, diff_time_ahead))[::-1]
+        relative_ahead = list(map(list, zip(
+            diff_time_ahead[order].tolist(), relative_index[order].tolist())))
+        order = np.lexsort((relative_index, diff_time_behind))[::-1]
+        relative_behind = list(map(list, zip(
+            diff_time_behind[order].tolist(), relative_index[order].tolist())))
+    else:
+        relative_ahead = []
+        relative_behind = []
+
+    # Classes, sort by class name, place, index
+    class_codes = {name: code for code, name in enumerate(sorted(set(class_names)))}
+    codes = np.array([class_codes[name] for name in class_names], dtype=np.int64)
+    best = np.asarray(laptime_best, dtype=np.float64)
+    best = np.where(best > 0, best, MAX_SECONDS)
+    last = np.asarray(laptime_last, dtype=np.float64)
+    last = np.where((last > 0) & ~pitlane, last, MAX_SECONDS)
+    order = np.lexsort((indexes, place_overall, codes))
+
+    sorted_codes = codes[order]
+    sorted_index = indexes[order]
+    sorted_best = best[order]
+    sorted_last = last[order]
+    class_start = np.empty(veh_total, dtype=bool)
+    class_start[:1] = True
+    np.not_equal(sorted_codes[1:], sorted_codes[:-1], out=class_start[1:])
+    class_end = np.empty(veh_total, dtype=bool)
+    class_end[-1:] = True
+    class_end[:-1] = class_start[1:]
+    class_id = np.cumsum(class_start) - 1
+    start_pos = np.flatnonzero(class_start)
+    place_in_class = np.arange(veh_total) - start_pos[class_id] + 1
+    index_ahead = np.full(veh_total, -1, dtype=np.int64)
+    index_ahead[1:] = sorted_index[:-1]
+    index_ahead[class_start] = -1
+    index_behind = np.full(veh_total, -1, dtype=np.int64)
+    index_behind[:-1] = sorted_index[1:]
+    index_behind[class_end] = -1
+    index_leader = sorted_index[start_pos][class_id]
+    class_best = sorted_best[start_pos][class_id]
+    # Fastest last laptime, first vehicle with class minimum that is valid
+    fastest = np.zeros(veh_total, dtype=bool)
+    if veh_total:
+        class_min = np.minimum.reduceat(sorted_last, start_pos)[class_id]
+        candidate = np.flatnonzero((sorted_last == class_min) & (class_min < MAX_SECONDS))
+        candidate_class = class_id[candidate]
+        first_in_class = np.ones(len(candidate), dtype=bool)
+        np.not_equal(candidate_class[1:], candidate_class[:-1], out=first_in_class[1:])
+        fastest[candidate[first_in_class]] = True
+
+    sorted_names = [class_names[index] for index in sorted_index.tolist()]
+    sorted_place = place_overall[order].tolist()
+    sorted_index_list = sorted_index.tolist()
+    sorted_best_list = sorted_best.tolist()
+    classes_list = list(map(list, zip(
+        sorted_names, sorted_place, sorted_index_list, sorted_best_list, sorted_last.tolist())))
+    place_in_class_list = place_in_class.tolist()
+    class_pos_list = list(map(list, zip(
+        sorted_index_list,
+        place_in_class_list,
+        sorted_names,
+        class_best.tolist(),
+        index_ahead.tolist(),
+        index_behind.tolist(),
+        index_leader.tolist(),
+        fastest.tolist(),
+    )))
+    plr_class_name = ""
+    plr_class_place = 0
+    if 0 <= plr_index < veh_total:
+        plr_pos = sorted_index_list.index(plr_index)
+        plr_class_name = sorted_names[plr_pos]
+        plr_class_place = place_in_class_list[plr_pos]
+
+    # Draw order, leader (last place 1) to end, opponent in pit/garage to start
+    draw_order = list(range(veh_total))
+    leader = np.flatnonzero(place_overall == 1)
+    leader_index = int(leader[-1]) if leader.size else 0
+    pitter_index = 0
+    for index in np.flatnonzero(pitlane & (place_overall != 1)).tolist():
+        draw_order[index], draw_order[pitter_index] = draw_order[pitter_index], draw_order[index]
+        pitter_index += 1
+    finalize_draw_order(draw_order, veh_total, leader_index, plr_index)
+
+    return (
+        relative_ahead,
+        relative_behind,
+        classes_list,
+        draw_order,
+        len(class_codes) > 1,  # is_multi_class
+        class_pos_list,
+        plr_class_name,
+        plr_class_place,
+    )
+
+
 def create_relative_index(
     relative_ahead: list, relative_behind: list, plr_index: int, max_veh_ahead: int, max_veh_behind: int):
     """Create player-centered relative (time, index) list"""
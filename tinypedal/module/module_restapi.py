@@ -41,6 +41,9 @@ json_decoder = json.JSONDecoder()
 class Realtime(DataModule):
     """Rest API data"""
 
+    TICK_SCHEDULED = False
+    PRODUCES = ("restapi", "fuel.expectedConsumption", "energy.expectedConsumption")
+
     __slots__ = (
         "task_cancel",
     )
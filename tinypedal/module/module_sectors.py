@@ -33,6 +33,8 @@ from ._base import DataModule, round6
 class Realtime(DataModule):
     """Sectors data"""
 
+    PRODUCES = ("sectors",)
+
     __slots__ = ()
 
     def __init__(self, config, module_name):
@@ -22,17 +22,27 @@ Stats module
 
 from __future__ import annotations
 
+from functools import partial
+
 from .. import calculation as calc
 from ..api_control import api
 from ..const_common import FLOAT_INF, POS_XYZ_INF
+from ..file_writer import file_writer
 from ..module_info import minfo
-from ..userfile.driver_stats import DriverStats, load_driver_stats, save_driver_stats
+from ..userfile.driver_stats import (
+    DriverStats,
+    load_driver_stats,
+    save_driver_stats,
+    stats_db_filename_full,
+)
 from ._base import DataModule
 
 
 class Realtime(DataModule):
     """Delta time data"""
 
+    PRODUCES = ("stats",)
+
     __slots__ = ()
 
     def __init__(self, config, module_name):
@@ -160,10 +170,15 @@ class Realtime(DataModule):
                 if reset:
                     reset = False
                     update_interval = self.idle_interval
-                    save_driver_stats(
-                        key_list=self.stats_keys(vehicle_class),
-                        stats_update=driver_stats,
-                        filepath=self.cfg.path.config,
+                    file_writer.submit(  # incremental update, don't coalesce
+                        stats_db_filename_full(self.cfg.path.config),
+                        partial(
+                            save_driver_stats,
+                            key_list=self.stats_keys(vehicle_class),
+                            stats_update=driver_stats,
+                            filepath=self.cfg.path.config,
+                        ),
+                        coalesce=False,
                     )
 
     def stats_keys(self, vehicle_class: str) -> tuple[str, str]:
@@ -22,17 +22,33 @@ Vehicles module
 
 from __future__ import annotations
 
+import logging
+from math import cos, hypot, sin
+from sys import intern
+from typing import Callable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from .. import calculation as calc
 from ..api_control import api
-from ..const_common import MAX_METERS, MAX_SECONDS
+from ..const_common import MAX_METERS, MAX_SECONDS, MAX_VEHICLES
 from ..module_info import VehiclesInfo, minfo
 from ..validator import state_timer
 from ._base import DataModule
 
+logger = logging.getLogger(__name__)
+
 
 class Realtime(DataModule):
     """Vehicles info"""
 
+    PRODUCES = ("vehicles",)
+    CONSUMES = ("relative.classes",)
+    CONSUMES_OPTIONAL = ("restapi.stintVirtualEnergy", "energy.expectedConsumption")
+
     __slots__ = ()
 
     def __init__(self, config, module_name):
@@ -49,6 +65,7 @@ class Realtime(DataModule):
         max_lap_diff_behind = self.mcfg["lap_difference_behind_threshold"]
 
         gen_low_priority_timer = state_timer(0.2)
+        row_cache = VehicleRowCache()
 
         while not _event_wait(update_interval):
             if self.state.active:
@@ -58,6 +75,13 @@ class Realtime(DataModule):
                     update_interval = self.active_interval
                     output.dataSetVersion = -1
                     last_veh_total = 0
+                    row_cache.reset()
+                    if self.mcfg["enable_vectorized_engine"] and np is not None:
+                        calc_kinematics = calc_vehicles_kinematics_array
+                    else:
+                        if self.mcfg["enable_vectorized_engine"]:
+                            logger.warning("vehicles: NumPy not available, use default engine")
+                        calc_kinematics = calc_vehicles_kinematics
 
                 veh_total = output.totalVehicles = api.read.vehicle.total_vehicles()
                 if veh_total > 0:
@@ -67,6 +91,8 @@ class Realtime(DataModule):
                         max_lap_diff_ahead,
                         max_lap_diff_behind,
                         next(gen_low_priority_timer),
+                        calc_kinematics,
+                        row_cache,
                     )
 
                 if last_veh_total != veh_total:
@@ -80,12 +106,62 @@ class Realtime(DataModule):
                     update_interval = self.idle_interval
 
 
+class VehicleRowCache:
+    """Vehicle low priority info change detection
+
+    Row key is built from vehicle slot id and rarely changed raw input values
+    (names, place, laptimes, pit stops, completed laps), row is only recomputed if key changed.
+    Time gaps change every tick, and are compared separately outside of row key. Name strings are decoded and interned
+    once per vehicle (slot id), and only decoded again if raw name bytes changed.
+
+    State key holds high priority info shown in text widgets (pit state, lap difference, etc.),
+    used together with low priority dirty flag for per-row change feed.
+    """
+
+    __slots__ = (
+        "row_keys",
+        "state_keys",
+        "_names",
+    )
+
+    def __init__(self) -> None:
+        self.row_keys: list[tuple | None] = [None] * MAX_VEHICLES
+        self.state_keys: list[tuple | None] = [None] * MAX_VEHICLES
+        self._names: dict[int, tuple[tuple[bytes, ...], tuple[str, ...]]] = {}
+
+    def reset(self) -> None:
+        """Reset cache"""
+        self.row_keys[:] = [None] * MAX_VEHICLES
+        self.state_keys[:] = [None] * MAX_VEHICLES
+        self._names.clear()
+
+    def names(self, index: int, slot_id: int, raw_names: tuple[bytes, ...]) -> tuple[str, ...]:
+        """Decoded names (driver, vehicle, class, compound front, compound rear)"""
+        cached = self._names.get(slot_id)
+        if cached is not None and cached[0] == raw_names:
+            return cached[1]
+        if len(self._names) >= MAX_VEHICLES * 2:  # drop names of left vehicles
+            self._names.clear()
+        class_name = intern(api.read.vehicle.class_name(index))
+        names = (
+            intern(api.read.vehicle.driver_name(index)),
+            intern(api.read.vehicle.vehicle_name(index)),
+            class_name,
+            intern(f"{class_name} - {api.read.tyre.compound_name_front(index)}"),
+            intern(f"{class_name} - {api.read.tyre.compound_name_rear(index)}"),
+        )
+        self._names[slot_id] = (raw_names, names)
+        return names
+
+
 def update_vehicle_data(
     output: VehiclesInfo,
     class_pos_list: list,
     max_lap_diff_ahead: float,
     max_lap_diff_behind: float,
     update_low_priority: bool,
+    calc_kinematics: Callable,
+    row_cache: VehicleRowCache,
 ) -> None:
     """Update vehicle data"""
     # General data
@@ -93,119 +169,320 @@ def update_vehicle_data(
     in_race = api.read.session.in_race()
     elapsed_time = api.read.timing.elapsed()
 
-    nearest_line = MAX_METERS
-    nearest_time_behind = -MAX_SECONDS
-    nearest_yellow = MAX_METERS
-
     # Local player data
     plr_lap_distance = api.read.lap.distance()
     plr_lap_progress_total = api.read.lap.completed_laps() + calc.lap_progress_distance(plr_lap_distance, track_length)
     plr_laptime_est = api.read.timing.estimated_laptime()
     plr_timeinto_est = api.read.timing.estimated_time_into()
+    plr_pos_x = api.read.vehicle.position_longitudinal()
+    plr_pos_y = api.read.vehicle.position_lateral()
+    plr_ori_yaw = api.read.vehicle.orientation_yaw_radians()
+
+    # Read all vehicles in current session
+    (is_player, laps_completed, lap_distance, lap_progress, lap_progress_total, time_into,
+     speed, in_pit, pos_x, pos_y, ori_yaw) = gather_vehicles_kinematics(output.totalVehicles, track_length)
+
+    # Calculate relative kinematics for all vehicles in one pass
+    (rel_ori, rel_pos_x, rel_pos_y, rel_distance, is_lapped, is_yellow,
+     nearest_line, nearest_time_behind, nearest_yellow) = calc_kinematics(
+        is_player, lap_distance, lap_progress_total, time_into, speed, in_pit,
+        pos_x, pos_y, ori_yaw,
+        plr_pos_x, plr_pos_y, plr_ori_yaw,
+        plr_lap_distance, plr_lap_progress_total, plr_laptime_est, plr_timeinto_est,
+        track_length, in_race, max_lap_diff_ahead, max_lap_diff_behind,
+    )
+
+    changed_indexes = []
+    change_version = output.changeVersion + 1
 
     # Update dataset from all vehicles in current session
     for index, data, class_pos in zip(range(output.totalVehicles), output.dataSet, class_pos_list):
-        # Temp var only
-        laps_completed = api.read.lap.completed_laps(index)
-        lap_distance = api.read.lap.distance(index)
-
         # Update high priority info
-        data.isPlayer = api.read.vehicle.is_player(index)
-        data.currentLapProgress = calc.lap_progress_distance(lap_distance, track_length)
-        data.totalLapProgress = laps_completed + data.currentLapProgress
-        data.isYellow = api.read.vehicle.speed(index) < 8
-        data.inPit = api.read.vehicle.in_paddock(index)
-        data.pitTimer.update(api.read.vehicle.slot_id(index), data.inPit, elapsed_time, laps_completed)
-        data.worldPositionX = api.read.vehicle.position_longitudinal(index)
-        data.worldPositionY = api.read.vehicle.position_lateral(index)
+        data.isPlayer = is_player[index]
+        data.currentLapProgress = lap_progress[index]
+        data.totalLapProgress = lap_progress_total[index]
+        data.isYellow = is_yellow[index]
+        data.inPit = in_pit[index]
+        slot_id = api.read.vehicle.slot_id(index)
+        data.pitTimer.update(slot_id, data.inPit, elapsed_time, laps_completed[index])
+        data.worldPositionX = pos_x[index]
+        data.worldPositionY = pos_y[index]
 
         if data.isPlayer:
             output.playerIndex = index
-            if data.isYellow:
-                nearest_yellow = 0.0
         else:
-            # Relative position & orientation
-            plr_pos_x = api.read.vehicle.position_longitudinal()
-            plr_pos_y = api.read.vehicle.position_lateral()
-            plr_ori_yaw = api.read.vehicle.orientation_yaw_radians()
-            opt_ori_yaw = api.read.vehicle.orientation_yaw_radians(index)
-
-            data.relativeOrientationRadians = opt_ori_yaw - plr_ori_yaw
-            data.relativeRotatedPositionX, data.relativeRotatedPositionY = calc.rotate_coordinate(
-                plr_ori_yaw - 3.14159265,  # plr_ori_rad, rotate view
-                data.worldPositionX - plr_pos_x,     # x position related to player
-                data.worldPositionY - plr_pos_y,     # y position related to player
-            )
-
-            # Relative distance & time gap
-            data.relativeStraightDistance = calc.distance(
-                (plr_pos_x, plr_pos_y),
-                (data.worldPositionX, data.worldPositionY)
-            )
-            data.isLapped = calc.lap_difference(
-                data.totalLapProgress, plr_lap_progress_total,
-                max_lap_diff_ahead, max_lap_diff_behind
-            ) if in_race else 0
-
-            # Nearest straight line distance (non local players)
-            if nearest_line > data.relativeStraightDistance:
-                nearest_line = data.relativeStraightDistance
-            # Nearest traffic time gap (opponents behind local players)
-            if not data.inPit:
-                opt_time_behind = calc.circular_relative_distance(
-                    plr_laptime_est,
-                    plr_timeinto_est,
-                    api.read.timing.estimated_time_into(index),
-                )
-                if 0 > opt_time_behind > nearest_time_behind:
-                    nearest_time_behind = opt_time_behind
-            # Nearest yellow flag distance
-            if data.isYellow and nearest_yellow > 0:
-                opt_rel_distance = abs(calc.circular_relative_distance(
-                    track_length, plr_lap_distance, lap_distance))
-                if nearest_yellow > opt_rel_distance:
-                    nearest_yellow = opt_rel_distance
+            data.relativeOrientationRadians = rel_ori[index]
+            data.relativeRotatedPositionX = rel_pos_x[index]
+            data.relativeRotatedPositionY = rel_pos_y[index]
+            data.relativeStraightDistance = rel_distance[index]
+            data.isLapped = is_lapped[index]
 
         # Update low priority info
         if update_low_priority:
             opt_index_ahead = class_pos[4]
             opt_index_leader = class_pos[6]
-            data.positionInClass = class_pos[1]
-            data.classBestLapTime = class_pos[3]
-            data.isClassFastestLastLap = class_pos[7]
-
-            data.positionOverall = api.read.vehicle.place(index)
-            data.lastLapTime = api.read.timing.last_laptime(index)
-            data.bestLapTime = api.read.timing.best_laptime(index)
-            data.numPitStops = api.read.vehicle.number_pitstops(index, api.read.vehicle.number_penalties(index))
-            data.pitState = api.read.vehicle.pit_request(index)
-            data.driverName = api.read.vehicle.driver_name(index)
-            data.vehicleName = api.read.vehicle.vehicle_name(index)
-            data.vehicleClass = api.read.vehicle.class_name(index)
-            data.tireCompoundFront = f"{data.vehicleClass} - {api.read.tyre.compound_name_front(index)}"
-            data.tireCompoundRear = f"{data.vehicleClass} - {api.read.tyre.compound_name_rear(index)}"
-
-            data.gapBehindNext = calc_gap_behind_next(index)
-            data.gapBehindLeader = calc_gap_behind_leader(index)
-            data.gapBehindNextInClass = calc_time_gap_behind(opt_index_ahead, index, track_length, data.totalLapProgress)
-            data.gapBehindLeaderInClass = calc_time_gap_behind(opt_index_leader, index, track_length, data.totalLapProgress)
-
-            data.energyRemaining = calc_stint_energy(data.driverName, data.vehicleClass, data.totalLapProgress, data.pitTimer.pitting and not data.inPit)
-
+            # Row key only from rarely changed inputs, per-tick gaps are compared separately
+            row_key = (
+                slot_id,
+                api.read.vehicle.name_bytes(index) + api.read.tyre.compound_name_bytes(index),
+                class_pos[1],  # position in class
+                class_pos[3],  # class best laptime
+                class_pos[7],  # is class fastest last lap
+                api.read.vehicle.place(index),
+                api.read.timing.last_laptime(index),
+                api.read.timing.best_laptime(index),
+                api.read.vehicle.number_pitstops(index, api.read.vehicle.number_penalties(index)),
+                api.read.vehicle.pit_request(index),
+                laps_completed[index],
+            )
+            is_dirty = row_cache.row_keys[index] != row_key
+            if is_dirty:
+                row_cache.row_keys[index] = row_key
+                (data.driverName, data.vehicleName, data.vehicleClass,
+                 data.tireCompoundFront, data.tireCompoundRear,
+                 ) = row_cache.names(index, slot_id, row_key[1])
+                (data.positionInClass, data.classBestLapTime, data.isClassFastestLastLap,
+                 data.positionOverall, data.lastLapTime, data.bestLapTime,
+                 data.numPitStops, data.pitState,
+                 ) = row_key[2:10]
+
+            gaps = (
+                calc_gap_behind_next(index),
+                calc_gap_behind_leader(index),
+                calc_time_gap_behind(opt_index_ahead, index, lap_progress_total, time_into),
+                calc_time_gap_behind(opt_index_leader, index, lap_progress_total, time_into),
+            )
+            if gaps != (data.gapBehindNext, data.gapBehindLeader,
+                        data.gapBehindNextInClass, data.gapBehindLeaderInClass):
+                (data.gapBehindNext, data.gapBehindLeader,
+                 data.gapBehindNextInClass, data.gapBehindLeaderInClass) = gaps
+                is_dirty = True
+
+            energy_remaining = calc_stint_energy(data.driverName, data.vehicleClass, data.totalLapProgress, data.pitTimer.pitting and not data.inPit)
+            if data.energyRemaining != energy_remaining:
+                data.energyRemaining = energy_remaining
+                is_dirty = True
+
+            last_lap_start = data.lapTimeHistory[5]
             data.lapTimeHistory.update(api.read.timing.start(index), elapsed_time, data.lastLapTime)
+            if last_lap_start != data.lapTimeHistory[5]:
+                is_dirty = True
+
+            data.isDirty = is_dirty
 
             # Save leader info
             if data.positionOverall == 1:
                 output.leaderIndex = index
                 output.leaderBestLapTime = data.bestLapTime
 
+        # Change feed, row changed if low priority info or displayed state changed
+        lap_diff = data.isLapped
+        state_key = (
+            data.isPlayer,
+            data.inPit,
+            data.pitTimer.pitting,
+            data.pitTimer.elapsed,
+            (lap_diff > 0) - (lap_diff < 0),
+            data.qualifyOverall,
+            data.qualifyInClass,
+        )
+        if row_cache.state_keys[index] != state_key or (update_low_priority and data.isDirty):
+            row_cache.state_keys[index] = state_key
+            data.rowVersion = change_version
+            changed_indexes.append(index)
+
     # Output extra info
     output.nearestLine = nearest_line
     output.nearestTraffic = -nearest_time_behind
     output.nearestYellow = nearest_yellow
+    if changed_indexes:
+        output.changeVersion = change_version
+    output.changedIndexes = changed_indexes
     output.dataSetVersion += 1
 
 
+def gather_vehicles_kinematics(veh_total: int, track_length: float) -> tuple[list, ...]:
+    """Read kinematics related data columns of all vehicles"""
+    read_vehicle = api.read.vehicle
+    read_lap = api.read.lap
+    indexes = range(veh_total)
+    laps_completed = [read_lap.completed_laps(index) for index in indexes]
+    lap_distance = [read_lap.distance(index) for index in indexes]
+    lap_progress = [calc.lap_progress_distance(dist, track_length) for dist in lap_distance]
+    return (
+        [read_vehicle.is_player(index) for index in indexes],
+        laps_completed,
+        lap_distance,
+        lap_progress,
+        [laps + progress for laps, progress in zip(laps_completed, lap_progress)],
+        [api.read.timing.estimated_time_into(index) for index in indexes],
+        [read_vehicle.speed(index) for index in indexes],
+        [read_vehicle.in_paddock(index) for index in indexes],
+        [read_vehicle.position_longitudinal(index) for index in indexes],
+        [read_vehicle.position_lateral(index) for index in indexes],
+        [read_vehicle.orientation_yaw_radians(index) for index in indexes],
+    )
+
+
+def calc_vehicles_kinematics(
+    is_player: list, lap_distance: list, lap_progress_total: list, time_into: list,
+    speed: list, in_pit: list, pos_x: list, pos_y: list, ori_yaw: list,
+    plr_pos_x: float, plr_pos_y: float, plr_ori_yaw: float,
+    plr_lap_distance: float, plr_lap_progress_total: float,
+    plr_laptime_est: float, plr_timeinto_est: float,
+    track_length: float, in_race: bool,
+    max_lap_diff_ahead: float, max_lap_diff_behind: float,
+) -> tuple:
+    """Calculate relative kinematics of all vehicles against local player
+
+    Returns:
+        Per-vehicle lists (player row not used): relative orientation,
+        rotated position x, rotated position y, straight distance, lapped state, yellow state.
+        Nearest straight line distance, nearest traffic time gap (negative), nearest yellow distance.
+    """
+    # Rotate view by player orientation, sin & cos only calculated once
+    plr_ori_rad = plr_ori_yaw - 3.14159265
+    sin_rad = sin(plr_ori_rad)
+    cos_rad = cos(plr_ori_rad)
+    half_laptime = plr_laptime_est * 0.5
+    half_length = track_length * 0.5
+
+    veh_total = len(is_player)
+    rel_ori = [0.0] * veh_total
+    rel_pos_x = [0.0] * veh_total
+    rel_pos_y = [0.0] * veh_total
+    rel_distance = [0.0] * veh_total
+    is_lapped = [0] * veh_total
+    is_yellow = [opt_speed < 8 for opt_speed in speed]
+
+    nearest_line = MAX_METERS
+    nearest_time_behind = -MAX_SECONDS
+    nearest_yellow = MAX_METERS
+
+    for index in range(veh_total):
+        if is_player[index]:
+            if is_yellow[index]:
+                nearest_yellow = 0.0
+            continue
+
+        diff_x = pos_x[index] - plr_pos_x
+        diff_y = pos_y[index] - plr_pos_y
+        rel_ori[index] = ori_yaw[index] - plr_ori_yaw
+        rel_pos_x[index] = cos_rad * diff_x - sin_rad * diff_y
+        rel_pos_y[index] = cos_rad * diff_y + sin_rad * diff_x
+        opt_distance = rel_distance[index] = hypot(diff_x, diff_y)
+
+        if in_race:
+            lap_diff = lap_progress_total[index] - plr_lap_progress_total
+            if lap_diff > max_lap_diff_ahead or lap_diff < -max_lap_diff_behind:
+                is_lapped[index] = lap_diff
+
+        # Nearest straight line distance (non local players)
+        if nearest_line > opt_distance:
+            nearest_line = opt_distance
+        # Nearest traffic time gap (opponents behind local players)
+        if not in_pit[index]:
+            opt_time_into = time_into[index]
+            opt_time_behind = opt_time_into - plr_timeinto_est
+            if abs(opt_time_behind) > half_laptime:
+                if opt_time_into > plr_timeinto_est:
+                    opt_time_behind -= plr_laptime_est
+                elif opt_time_into < plr_timeinto_est:
+                    opt_time_behind += plr_laptime_est
+            if 0 > opt_time_behind > nearest_time_behind:
+                nearest_time_behind = opt_time_behind
+        # Nearest yellow flag distance
+        if is_yellow[index]:
+            opt_lap_distance = lap_distance[index]
+            opt_rel_distance = opt_lap_distance - plr_lap_distance
+            if abs(opt_rel_distance) > half_length:
+                if opt_lap_distance > plr_lap_distance:
+                    opt_rel_distance -= track_length
+                elif opt_lap_distance < plr_lap_distance:
+                    opt_rel_distance += track_length
+            opt_rel_distance = abs(opt_rel_distance)
+            if nearest_yellow > opt_rel_distance:
+                nearest_yellow = opt_rel_distance
+
+    return (
+        rel_ori, rel_pos_x, rel_pos_y, rel_distance, is_lapped, is_yellow,
+        nearest_line, nearest_time_behind, nearest_yellow,
+    )
+
+
+def calc_vehicles_kinematics_array(
+    is_player: list, lap_distance: list, lap_progress_total: list, time_into: list,
+    speed: list, in_pit: list, pos_x: list, pos_y: list, ori_yaw: list,
+    plr_pos_x: float, plr_pos_y: float, plr_ori_yaw: float,
+    plr_lap_distance: float, plr_lap_progress_total: float,
+    plr_laptime_est: float, plr_timeinto_est: float,
+    track_length: float, in_race: bool,
+    max_lap_diff_ahead: float, max_lap_diff_behind: float,
+) -> tuple:
+    """Calculate relative kinematics of all vehicles against local player (NumPy)
+
+    Same output as calc_vehicles_kinematics.
+    """
+    plr_ori_rad = plr_ori_yaw - 3.14159265
+    sin_rad = sin(plr_ori_rad)
+    cos_rad = cos(plr_ori_rad)
+
+    opponent = ~np.array(is_player, dtype=bool)
+    diff_x = np.array(pos_x, dtype=np.float64) - plr_pos_x
+    diff_y = np.array(pos_y, dtype=np.float64) - plr_pos_y
+    rel_ori = np.array(ori_yaw, dtype=np.float64) - plr_ori_yaw
+    rel_pos_x = cos_rad * diff_x - sin_rad * diff_y
+    rel_pos_y = cos_rad * diff_y + sin_rad * diff_x
+    rel_distance = np.hypot(diff_x, diff_y)
+    is_yellow = np.array(speed, dtype=np.float64) < 8
+
+    if in_race:
+        lap_diff = np.array(lap_progress_total, dtype=np.float64) - plr_lap_progress_total
+        is_lapped = np.where(
+            (lap_diff > max_lap_diff_ahead) | (lap_diff < -max_lap_diff_behind), lap_diff, 0).tolist()
+    else:
+        is_lapped = [0] * len(is_player)
+
+    # Nearest straight line distance (non local players)
+    nearest_line = MAX_METERS
+    if opponent.any():
+        nearest_line = min(nearest_line, float(rel_distance[opponent].min()))
+
+    # Nearest traffic time gap (opponents behind local players)
+    nearest_time_behind = -MAX_SECONDS
+    time_behind = circular_relative_array(
+        plr_laptime_est, plr_timeinto_est, np.array(time_into, dtype=np.float64))
+    time_behind = time_behind[opponent & ~np.array(in_pit, dtype=bool) & (time_behind < 0)]
+    if time_behind.size:
+        nearest_time_behind = max(nearest_time_behind, float(time_behind.max()))
+
+    # Nearest yellow flag distance
+    nearest_yellow = MAX_METERS
+    if (is_yellow & ~opponent).any():
+        nearest_yellow = 0.0
+    else:
+        yellow = opponent & is_yellow
+        if yellow.any():
+            rel_lap_distance = np.abs(circular_relative_array(
+                track_length, plr_lap_distance, np.array(lap_distance, dtype=np.float64)[yellow]))
+            nearest_yellow = min(nearest_yellow, float(rel_lap_distance.min()))
+
+    return (
+        rel_ori.tolist(), rel_pos_x.tolist(), rel_pos_y.tolist(), rel_distance.tolist(),
+        is_lapped, is_yellow.tolist(),
+        nearest_line, nearest_time_behind, nearest_yellow,
+    )
+
+
+def circular_relative_array(circle_length: float, plr_dist: float, opt_dist):
+    """Relative distance between opponents & player in a circle (NumPy)"""
+    rel_dist = opt_dist - plr_dist
+    over_half = np.abs(rel_dist) > circle_length * 0.5
+    rel_dist[over_half & (opt_dist > plr_dist)] -= circle_length
+    rel_dist[over_half & (opt_dist < plr_dist)] += circle_length
+    return rel_dist
+
+
 def update_qualify_position(output: VehiclesInfo) -> None:
     """Update qualify position"""
     temp_class = sorted((
@@ -229,19 +506,17 @@ def update_qualify_position(output: VehiclesInfo) -> None:
 def calc_time_gap_behind(
     ahead_index: int,
     behind_index: int,
-    track_length: float,
-    lap_progress_total: float,
+    lap_progress_total: list,
+    time_into: list,
 ) -> float | int:
     """Calculate interval behind next in class"""
-    if ahead_index < 0:
+    if not 0 <= ahead_index < len(lap_progress_total):
         return 0.0
-    opt_lap_progress = calc.lap_progress_distance(api.read.lap.distance(ahead_index), track_length)
-    opt_lap_progress_total = api.read.lap.completed_laps(ahead_index) + opt_lap_progress
-    lap_diff = opt_lap_progress_total - lap_progress_total
+    lap_diff = lap_progress_total[ahead_index] - lap_progress_total[behind_index]
     if lap_diff >= 1 or lap_diff <= -1:  # laps
         return int(abs(lap_diff))
     # Time gap between driver ahead and behind
-    time_gap = api.read.timing.estimated_time_into(ahead_index) - api.read.timing.estimated_time_into(behind_index)
+    time_gap = time_into[ahead_index] - time_into[behind_index]
     # Check lap diff (positive) for position correction
     # in case the ahead driver is momentarily behind (such as during double-file formation lap)
     if time_gap < 0 < lap_diff:
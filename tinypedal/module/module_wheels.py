@@ -34,6 +34,9 @@ from ._base import DataModule
 class Realtime(DataModule):
     """Wheels data"""
 
+    PRODUCES = ("wheels",)
+    CONSUMES_OPTIONAL = ("restapi.brakeWear",)
+
     __slots__ = ()
 
     def __init__(self, config, module_name):
@@ -29,6 +29,10 @@ from typing import Any, KeysView
 
 from . import module, widget
 from .const_file import ConfigType
+from .module_graph import ModuleGraph
+from .module_host import ModuleHost
+from .module_info import minfo
+from .module_scheduler import scheduler
 from .setting import cfg
 
 logger = logging.getLogger(__name__)
@@ -55,20 +59,34 @@ class ModuleControl:
     Attributes:
         type_id: module type indentifier, either "module" or "widget".
         active_modules: active module reference dict (read-only).
+        graph: module dependency graph, data module only.
+        host: module process host, data module only.
     """
 
     __slots__ = (
         "_imported_modules",
         "_active_modules",
+        "_auto_enabled",
         "type_id",
         "active_modules",
+        "graph",
+        "host",
     )
 
     def __init__(self, target: Any, type_id: str):
         self._imported_modules = create_module_pack(target)
         self._active_modules: dict = {}
+        self._auto_enabled: set[str] = set()  # producers started only for required consumers
         self.type_id = type_id
         self.active_modules: MappingProxyType = MappingProxyType(self._active_modules)
+        self.graph: ModuleGraph | None = None
+        self.host: ModuleHost | None = None
+        if type_id == ConfigType.MODULE:
+            self.host = ModuleHost()
+            self.graph = ModuleGraph(self._imported_modules, minfo)
+            for error in self.graph.errors:
+                logger.error("MODULE GRAPH: %s", error)
+            scheduler.set_order(self.graph.order)
 
     def start(self, name: str = ""):
         """Start module, specify name for selected module"""
@@ -86,6 +104,10 @@ class ModuleControl:
 
     def reload(self, name: str = ""):
         """Reload module"""
+        if name in self._active_modules:  # restart in place, keep required producers
+            self.__stop_module(name)
+            self.__start_module(name)
+            return
         self.close(name)
         self.start(name)
 
@@ -117,30 +139,130 @@ class ModuleControl:
 
     def __start_enabled(self):
         """Start all enabled module"""
-        for _name in self._imported_modules.keys():
+        if self.type_id == ConfigType.MODULE:
+            scheduler.setup(
+                cfg.application["enable_module_tick_scheduler"],
+                cfg.application["module_tick_fallback_timeout"] / 1000,
+            )
+        if self.__host_mode():
+            self.__start_host()
+            return
+        if self.graph is not None:  # start producers first
+            names = self.graph.order
+        else:
+            names = self._imported_modules.keys()
+        for _name in names:
             self.__start_selected(_name)
 
-    def __start_selected(self, name: str):
-        """Start selected module"""
-        if cfg.user.setting[name]["enable"] and name not in self._active_modules:
-            # Create module instance and add to dict
-            self._active_modules[name] = self._imported_modules[name].Realtime(cfg, name)
-            self._active_modules[name].start()
+    def __start_selected(self, name: str, required_by: str = ""):
+        """Start selected module, and required producer modules"""
+        if self.__host_mode():
+            self.__restart_host()
+            return
+        if name in self._active_modules:
+            if not required_by and cfg.user.setting[name]["enable"]:
+                self._auto_enabled.discard(name)  # enabled by user
+            return
+        if not required_by and not cfg.user.setting[name]["enable"]:
+            return
+        if self.graph is not None:
+            for _producer in self.graph.dependencies.get(name, ()):
+                self.__start_selected(_producer, name)
+        if required_by and not cfg.user.setting[name]["enable"]:
+            self._auto_enabled.add(name)
+            logger.info("AUTO-ENABLED: %s, required by %s",
+                name.replace("_", " "), required_by.replace("_", " "))
+        self.__start_module(name)
+
+    def __start_module(self, name: str):
+        """Create module instance, add to active modules and start"""
+        self._active_modules[name] = self._imported_modules[name].Realtime(cfg, name)
+        _module = self._active_modules[name]
+        if self.type_id == ConfigType.MODULE and _module.TICK_SCHEDULED:
+            scheduler.register(name, _module._event, _module.active_interval)
+        _module.start()
+
+    def __host_mode(self) -> bool:
+        """Whether to run data modules in host process"""
+        return self.host is not None and cfg.application["enable_module_process_host"]
+
+    def __start_host(self):
+        """Start enabled modules (and required producers) in host process"""
+        names = self.graph.required(
+            _name for _name in self._imported_modules if cfg.user.setting[_name]["enable"])
+        if not names:
+            return
+        self.host.start(
+            setting_filename=cfg.filename.setting,
+            setting=cfg.user.setting,
+            module_names=names,
+            groups=self.graph.groups(names),
+            update_interval=max(
+                cfg.application["module_host_update_interval"],
+                cfg.application["minimum_update_interval"]) / 1000,
+        )
+
+    def __restart_host(self):
+        """Restart host process with current enabled modules"""
+        self.host.stop()
+        self.__start_host()
 
     def __close_enabled(self):
         """Close all enabled module"""
-        for _name in tuple(self._active_modules):
-            self.__close_selected(_name)
+        if self.host is not None and self.host.running:
+            self.host.stop()
+        for _name in reversed(tuple(self._active_modules)):  # consumers first
+            self.__stop_module(_name)
+        self._auto_enabled.clear()
+        if self.type_id == ConfigType.MODULE:
+            scheduler.stop()
 
     def __close_selected(self, name: str):
-        """Close selected module"""
-        if name in self._active_modules:
-            _module = self._active_modules[name]  # get instance
-            self._active_modules.pop(name)  # remove active reference
-            _module.stop()  # close module
-            while not _module.closed:  # wait finish
-                sleep(0.01)
-            _module = None  # remove final reference
+        """Close selected module, and auto-enabled producers no longer required
+
+        Module required by running consumers is kept running (as auto-enabled),
+        and closed after all its consumers are closed.
+        """
+        if name not in self._active_modules and self.host is not None and self.host.running:
+            self.__restart_host()
+            return
+        if name not in self._active_modules:
+            return
+        consumers = self.__running_consumers(name)
+        if consumers:
+            self._auto_enabled.add(name)
+            logger.info("KEPT ENABLED: %s, required by %s",
+                name.replace("_", " "), ", ".join(consumers).replace("_", " "))
+            return
+        self.__stop_module(name)
+        self._auto_enabled.discard(name)
+        if self.graph is None:
+            return
+        for _producer in self.graph.dependencies.get(name, ()):
+            if (_producer in self._auto_enabled
+                and _producer in self._active_modules
+                and not self.__running_consumers(_producer)):
+                logger.info("AUTO-DISABLED: %s, no longer required", _producer.replace("_", " "))
+                self.__close_selected(_producer)
+
+    def __running_consumers(self, name: str) -> list[str]:
+        """Running modules that require selected module"""
+        if self.graph is None:
+            return []
+        return [
+            _name for _name in self._active_modules
+            if _name != name and name in self.graph.dependencies.get(_name, ())
+        ]
+
+    def __stop_module(self, name: str):
+        """Stop module, remove from active modules and wait finish"""
+        _module = self._active_modules.pop(name)  # remove active reference
+        if self.type_id == ConfigType.MODULE:
+            scheduler.unregister(name)
+        _module.stop()  # close module
+        while not _module.closed:  # wait finish
+            sleep(0.01)
+        _module = None  # remove final reference
 
     @property
     def number_active(self) -> int:
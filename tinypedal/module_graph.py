@@ -0,0 +1,157 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module dependency graph
+
+Build producer & consumer graph from minfo fields declared by data modules.
+
+Field name is either a minfo group ("delta"), or a single field in group ("delta.lapDistance").
+Single field producer takes priority over group producer.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Iterable
+
+logger = logging.getLogger(__name__)
+
+
+def declared_fields(target: Any, attr_name: str) -> tuple[str, ...]:
+    """Declared minfo fields from module Realtime class"""
+    return tuple(getattr(target.Realtime, attr_name, ()))
+
+
+class ModuleGraph:
+    """Module dependency graph (DAG)
+
+    Edges only come from required consumed fields (CONSUMES),
+    optional consumed fields (CONSUMES_OPTIONAL) read latest available value,
+    and are only used for validation.
+
+    Args:
+        modules: Module reference dict, key = module name, value = imported module.
+        info: Module output info (minfo), for validating field names.
+
+    Attributes:
+        producers: Field producer dict, key = field name, value = module name.
+        dependencies: Required producer modules dict, key = module name, value = producer module names.
+        order: Module names in dependency order (producers first).
+        errors: Validation errors.
+    """
+
+    __slots__ = (
+        "producers",
+        "dependencies",
+        "order",
+        "errors",
+    )
+
+    def __init__(self, modules: dict[str, Any], info: Any = None) -> None:
+        self.producers: dict[str, str] = {}
+        self.dependencies: dict[str, tuple[str, ...]] = {}
+        self.order: tuple[str, ...] = ()
+        self.errors: list[str] = []
+        self.__build(modules, info)
+
+    def producer(self, field: str) -> str | None:
+        """Producer module name of field, None if not produced by any module"""
+        name = self.producers.get(field)
+        if name is None:
+            name = self.producers.get(field.split(".", 1)[0])
+        return name
+
+    def required(self, names: Iterable[str]) -> tuple[str, ...]:
+        """Selected modules and all required producer modules, in dependency order"""
+        selected = set()
+        pending = list(names)
+        while pending:
+            name = pending.pop()
+            if name not in selected:
+                selected.add(name)
+                pending.extend(self.dependencies.get(name, ()))
+        return tuple(name for name in self.order if name in selected)
+
+    def groups(self, names: Iterable[str]) -> tuple[str, ...]:
+        """Minfo group names produced (fully or partially) by modules"""
+        names = set(names)
+        return tuple(sorted({
+            field.partition(".")[0]
+            for field, producer in self.producers.items()
+            if producer in names
+        }))
+
+    def __build(self, modules: dict[str, Any], info: Any) -> None:
+        """Build graph and validate"""
+        # Producers
+        for name, target in modules.items():
+            for field in declared_fields(target, "PRODUCES"):
+                self.__check_field(name, field, info)
+                if field in self.producers:
+                    self.errors.append(
+                        f"{name}: {field} already produced by {self.producers[field]}")
+                    continue
+                self.producers[field] = name
+        # Consumers
+        for name, target in modules.items():
+            dependencies = []
+            for field in declared_fields(target, "CONSUMES"):
+                self.__check_field(name, field, info)
+                producer = self.producer(field)
+                if producer is None:
+                    self.errors.append(f"{name}: no producer for {field}")
+                elif producer != name and producer not in dependencies:
+                    dependencies.append(producer)
+            for field in declared_fields(target, "CONSUMES_OPTIONAL"):
+                self.__check_field(name, field, info)
+                if self.producer(field) is None:
+                    self.errors.append(f"{name}: no producer for {field}")
+            self.dependencies[name] = tuple(dependencies)
+        self.order = self.__sort(sorted(modules))
+
+    def __check_field(self, name: str, field: str, info: Any) -> None:
+        """Check whether field exists in minfo"""
+        if info is None:
+            return
+        group_name, _, field_name = field.partition(".")
+        group = getattr(info, group_name, None)
+        if group is None:
+            self.errors.append(f"{name}: unknown minfo group {group_name}")
+        elif field_name and not hasattr(group, field_name):
+            self.errors.append(f"{name}: unknown minfo field {field}")
+
+    def __sort(self, names: list[str]) -> tuple[str, ...]:
+        """Topological sort (Kahn), ties sorted by name, cyclic modules appended last"""
+        remaining = {name: set(self.dependencies.get(name, ())) & set(names) for name in names}
+        ordered = []
+        while remaining:
+            ready = sorted(name for name, deps in remaining.items() if not deps)
+            if not ready:
+                cyclic = sorted(remaining)
+                self.errors.append(f"dependency cycle: {', '.join(cyclic)}")
+                for name in cyclic:  # break cycle, drop dependencies
+                    self.dependencies[name] = ()
+                ordered.extend(cyclic)
+                break
+            for name in ready:
+                ordered.append(name)
+                remaining.pop(name)
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return tuple(ordered)
@@ -0,0 +1,251 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module process host
+
+Run data modules in a separated worker process (own interpreter & GIL),
+which reads game shared memory directly, and publishes minfo groups
+to shared memory blocks (one block per group, see shared_block),
+encoded in fixed group layout (see module_layout).
+
+GUI process reads changed blocks, and decodes changed fields into local minfo groups,
+so widgets read minfo the same way as in-process modules.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+from typing import Any, Iterable
+
+from .module_layout import GroupLayout, GroupReader, GroupWriter
+from .shared_block import SharedBlock
+
+logger = logging.getLogger(__name__)
+
+BLOCK_PREFIX = "tinypedal_host"
+STOP_TIMEOUT = 5  # seconds
+
+
+def create_group_layout(group_name: str, info: Any) -> GroupLayout:
+    """Create minfo group layout from default values of group class"""
+    return GroupLayout(group_name, type(getattr(info, group_name))())
+
+
+def run_host(
+    setting_filename: str,
+    setting: dict,
+    module_names: tuple[str, ...],
+    block_names: dict[str, str],
+    stop_event: Any,
+    update_interval: float,
+):
+    """Module host worker process entry
+
+    Args:
+        setting_filename: Loaded preset filename in GUI process.
+        setting: Preset setting dict in GUI process (may not be saved yet).
+        module_names: Module names to run, in dependency order.
+        block_names: Shared block name dict, key = minfo group name, value = block name.
+        stop_event: Stop event (multiprocessing).
+        update_interval: Publish interval (seconds).
+    """
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s (host) %(message)s")
+    from . import module
+    from .api_control import api
+    from .file_writer import file_writer
+    from .module_info import minfo
+    from .module_scheduler import scheduler
+    from .overlay_control import octrl
+    from .setting import cfg
+
+    # Load setting
+    cfg.load_global()
+    cfg.set_next_to_load(setting_filename)
+    cfg.load()
+    cfg.user.setting = setting
+    cfg.overlay = setting["overlay"]
+    cfg.shared_memory_api = setting["shared_memory_api"]
+    cfg.units = setting["units"]
+
+    # Start API & modules
+    api.connect()
+    api.start()
+    scheduler.setup(
+        cfg.application["enable_module_tick_scheduler"],
+        cfg.application["module_tick_fallback_timeout"] / 1000,
+    )
+    scheduler.set_order(module_names)
+    active_modules = []
+    for name in module_names:
+        _module = getattr(module, name).Realtime(cfg, name)
+        if _module.TICK_SCHEDULED:
+            scheduler.register(name, _module._event, _module.active_interval)
+        _module.start()
+        active_modules.append(_module)
+
+    # Publish minfo groups
+    writers = []
+    for group, name in block_names.items():
+        writer = GroupWriter(create_group_layout(group, minfo))
+        block = SharedBlock(name, layout_id=writer.layout.layout_id)
+        writers.append((block, writer, getattr(minfo, group)))
+    try:
+        while not stop_event.wait(update_interval):
+            octrl.state.active = api.state  # no overlay control thread in host
+            for block, writer, source in writers:
+                payload = writer.update(source)
+                if payload is not None:
+                    block.write(payload)
+    finally:
+        for _module in active_modules:
+            scheduler.unregister(_module.module_name)
+            _module.stop()
+        for _module in active_modules:
+            while not _module.closed:
+                stop_event.wait(0.01)
+        scheduler.stop()
+        api.stop()
+        file_writer.flush()
+        for block, _, _ in writers:
+            block.close()
+
+
+class ModuleHost:
+    """Module process host control (GUI process side)
+
+    Attributes:
+        module_names: Module names running in host process.
+        update_interval: Read interval (seconds).
+    """
+
+    __slots__ = (
+        "_process",
+        "_stop_event",
+        "_blocks",
+        "_reader",
+        "_reader_event",
+        "module_names",
+        "update_interval",
+    )
+
+    def __init__(self):
+        self._process = None
+        self._stop_event = None
+        self._blocks: dict[str, tuple[SharedBlock, GroupReader]] = {}
+        self._reader = None
+        self._reader_event = threading.Event()
+        self.module_names: tuple[str, ...] = ()
+        self.update_interval = 0.01
+
+    @property
+    def running(self) -> bool:
+        """Whether host process is running"""
+        return self._process is not None
+
+    def start(
+        self,
+        setting_filename: str,
+        setting: dict,
+        module_names: Iterable[str],
+        groups: Iterable[str],
+        update_interval: float,
+    ):
+        """Start host process
+
+        Args:
+            setting_filename: Loaded preset filename.
+            setting: Preset setting dict.
+            module_names: Module names to run, in dependency order.
+            groups: Published minfo group names.
+            update_interval: Publish & read interval (seconds).
+        """
+        if self.running:
+            return
+        from .module_info import minfo
+
+        self.module_names = tuple(module_names)
+        self.update_interval = max(update_interval, 0.001)
+        block_names = {}
+        for group in groups:
+            block_name = f"{BLOCK_PREFIX}_{os.getpid()}_{group}"
+            layout = create_group_layout(group, minfo)
+            self._blocks[group] = (
+                SharedBlock(block_name, layout.size, create=True, layout_id=layout.layout_id),
+                GroupReader(layout),
+            )
+            block_names[group] = block_name
+
+        context = multiprocessing.get_context("spawn")
+        self._stop_event = context.Event()
+        self._process = context.Process(
+            target=run_host,
+            args=(
+                setting_filename,
+                setting,
+                self.module_names,
+                block_names,
+                self._stop_event,
+                self.update_interval,
+            ),
+            name="tinypedal_module_host",
+            daemon=True,
+        )
+        self._process.start()
+        self._reader_event.clear()
+        self._reader = threading.Thread(target=self.__reading, daemon=True)
+        self._reader.start()
+        logger.info("ENABLED: module host process (%s)", ", ".join(self.module_names))
+
+    def stop(self):
+        """Stop host process"""
+        if not self.running:
+            return
+        self._stop_event.set()
+        self._process.join(STOP_TIMEOUT)
+        if self._process.is_alive():
+            logger.warning("MODULE HOST: process not responding, terminating")
+            self._process.terminate()
+            self._process.join()
+        self._reader_event.set()
+        self._reader.join()
+        for block, _ in self._blocks.values():
+            block.close()
+        self._blocks.clear()
+        self._process = None
+        self._stop_event = None
+        self._reader = None
+        logger.info("DISABLED: module host process")
+
+    def __reading(self):
+        """Read changed blocks, decode changed fields into local minfo"""
+        from .module_info import minfo
+
+        targets = tuple(
+            (block, reader, getattr(minfo, group))
+            for group, (block, reader) in self._blocks.items()
+        )
+        _event_wait = self._reader_event.wait
+        while not _event_wait(self.update_interval):
+            for block, reader, target in targets:
+                payload = block.read(block.sequence)
+                if payload is not None:
+                    reader.update(target, payload)
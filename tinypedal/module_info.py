@@ -185,6 +185,8 @@ class VehicleDataSet:
         "energyRemaining",
         "pitTimer",
         "lapTimeHistory",
+        "isDirty",
+        "rowVersion",
     )
 
     def __init__(self):
@@ -222,6 +224,8 @@ class VehicleDataSet:
         self.energyRemaining: float = 0.0
         self.pitTimer: VehiclePitTimer = VehiclePitTimer()
         self.lapTimeHistory: DeltaLapTime = DeltaLapTime("d", [0.0] * 6)
+        self.isDirty: bool = True  # low priority info changed in last update
+        self.rowVersion: int = -1  # VehiclesInfo.changeVersion when row info last changed
 
 
 class DeltaInfo:
@@ -233,6 +237,7 @@ class DeltaInfo:
         "deltaLast",
         "deltaSession",
         "deltaStint",
+        "deltaReferences",
         "isValidLap",
         "lapTimeCurrent",
         "lapTimeLast",
@@ -250,6 +255,7 @@ class DeltaInfo:
         self.deltaLast: float = 0.0
         self.deltaSession: float = 0.0
         self.deltaStint: float = 0.0
+        self.deltaReferences: dict[str, float] = {}
         self.isValidLap: bool = False
         self.lapTimeCurrent: float = 0.0
         self.lapTimeLast: float = 0.0
@@ -547,6 +553,8 @@ class VehiclesInfo:
         "nearestTraffic",
         "nearestYellow",
         "leaderBestLapTime",
+        "changedIndexes",
+        "changeVersion",
     )
 
     def __init__(self):
@@ -561,6 +569,8 @@ class VehiclesInfo:
         self.nearestTraffic: float = MAX_SECONDS
         self.nearestYellow: float = MAX_METERS
         self.leaderBestLapTime: float = MAX_SECONDS
+        self.changedIndexes: list[int] = []  # vehicle indexes changed in last dataSetVersion
+        self.changeVersion: int = 0  # incremented on any row change, never reset
 
 
 class WheelsInfo:
@@ -0,0 +1,607 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module info layout
+
+Fixed binary layout of minfo group, for publishing module output
+from module host process through shared block (see module_host).
+
+Group payload layout (little-endian):
+    I x (number of units)   unit versions, incremented when unit data changed
+    I x (number of units)   unit data sizes
+    unit data in fixed order:
+        record: scalar, string & fixed array fields of group or vehicle row (struct)
+            B x (number of scalars)   scalar type tags (float, int, bool, None)
+            d or q x (number of scalars)   scalar values, d for float tag, q for others
+            H, s x (number of strings)   string length & UTF-8 bytes (max STRING_SIZE)
+            fixed size arrays
+        json: other container fields, I length, UTF-8 JSON text (max JSON_SIZE)
+        table: float rows field, I length, I rows, I columns, d values (max TABLE_SIZE)
+
+Layout is built from default values of minfo group class, layout id is checksum
+of layout schema. Reader only decodes units with changed version.
+
+Payload is decoded by struct & json only, malformed payload produces
+invalid values or decoding errors, but never runs code.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import struct
+import sys
+import zlib
+from array import array
+from collections import deque
+from itertools import chain, compress
+from operator import attrgetter, gt, ne
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
+
+from .const_common import EMPTY_DICT
+from .module_info import WeatherNode
+
+STRING_SIZE = 128  # max bytes per string field
+JSON_SIZE = 1 << 16  # 64 KiB, max bytes per JSON field
+TABLE_SIZE = 1 << 20  # 1 MiB, max bytes per table field
+TABLE_NONE = 0xFFFFFFFF  # row count of None table
+LENGTH = struct.Struct("<I")
+TABLE_HEADER = struct.Struct("<II")
+
+TAG_FLOAT = 0
+TAG_INT = 1
+TAG_BOOL = 2
+TAG_NONE = 3
+SCALAR_TAGS = {float: TAG_FLOAT, int: TAG_INT, bool: TAG_BOOL}
+MAX_PACKERS = 64  # max cached record packers (scalar tag combinations) per unit
+
+# Float rows fields, tuple of float tuples, or None
+TABLE_FIELDS = frozenset((
+    "delta.deltaBestData",
+    "mapping.coordinates",
+    "mapping.elevations",
+))
+# Errors from encoding unexpected value, or decoding malformed payload
+CODEC_ERRORS = (
+    AttributeError,
+    IndexError,
+    KeyError,
+    OverflowError,
+    RecursionError,
+    TypeError,
+    ValueError,
+    struct.error,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def is_record_object(value: Any) -> bool:
+    """Whether value is slots object (not container), such as vehicle pit timer"""
+    return (
+        hasattr(type(value), "__slots__")
+        and not isinstance(value, (array, tuple, list, deque, Mapping))
+    )
+
+
+def encode_scalar(value: Any) -> tuple[int, float | int]:
+    """Encode scalar value to type tag & packed value (float for float tag, int for others)"""
+    if value is None:
+        return TAG_NONE, 0
+    if value is True or value is False:
+        return TAG_BOOL, int(value)
+    if isinstance(value, int):
+        return TAG_INT, int(value)
+    return TAG_FLOAT, float(value)
+
+
+def decode_scalar(tag: int, value: float | int) -> Any:
+    """Decode scalar value from type tag & packed value"""
+    if tag == TAG_FLOAT or tag == TAG_INT:
+        return value
+    if tag == TAG_BOOL:
+        return value != 0
+    return None
+
+
+def scalar_format(tags: tuple[int, ...]) -> str:
+    """Struct format of scalar values from type tags, 64-bit int keeps int value exact"""
+    return "".join("d" if tag == TAG_FLOAT else "q" for tag in tags)
+
+
+def split_path(path: str) -> tuple[Callable | None, str]:
+    """Split field path into parent object getter (None if not nested) & attribute name"""
+    parent, _, attr = path.rpartition(".")
+    return (attrgetter(parent) if parent else None), attr
+
+
+def json_default(value: Any) -> Any:
+    """Convert non-JSON container (mapping, deque, array) to JSON type"""
+    if isinstance(value, Mapping):
+        return dict(value)
+    return list(value)
+
+
+def optional_tuple(value: Any) -> tuple | None:
+    """Restore optional tuple"""
+    return None if value is None else tuple(value)
+
+
+def weather_nodes(value: Any) -> list[WeatherNode] | None:
+    """Restore optional weather forecast node list"""
+    return None if value is None else list(map(WeatherNode._make, value))
+
+
+def tuple_mapping(value: Any) -> Mapping[str, tuple]:
+    """Restore mapping of tuple values, empty mapping as read-only default"""
+    if not value:
+        return EMPTY_DICT
+    return {key: tuple(data) for key, data in value.items()}
+
+
+# Restore function of container fields without default value to infer from
+FIELD_RESTORE: dict[str, Callable[[Any], Any]] = {
+    "mapping.sectors": optional_tuple,
+    "restapi.forecastPractice": weather_nodes,
+    "restapi.forecastQualify": weather_nodes,
+    "restapi.forecastRace": weather_nodes,
+    "restapi.stintVirtualEnergy": tuple_mapping,
+}
+
+
+def json_restore(path: str, template: Any) -> Callable[[Any], Any]:
+    """Restore function of decoded JSON value, from field default value"""
+    restore = FIELD_RESTORE.get(path)
+    if restore is not None:
+        return restore
+    if hasattr(template, "_fields"):  # named tuple
+        return type(template)._make
+    if isinstance(template, deque):
+        maxlen = template.maxlen
+        if template and hasattr(template[0], "_fields"):
+            element_type = type(template[0])
+            return lambda value: deque(map(element_type._make, value), maxlen)
+        return lambda value: deque(value, maxlen)
+    if isinstance(template, MappingProxyType):
+        return MappingProxyType
+    if isinstance(template, tuple):
+        return tuple
+    return lambda value: value
+
+
+class RecordUnit:
+    """Scalar, string & fixed array fields of slots object, packed by struct
+
+    Struct layout: scalar type tags, scalar values, strings, arrays.
+    Scalar value format depends on type tags, struct is cached per tags.
+    Reader only sets fields with changed value.
+
+    Args:
+        name: Unit name.
+        template: Template object with default values.
+        paths: Field paths (nested field separated by dot).
+        source: Get source object from group, None for group itself.
+    """
+
+    __slots__ = (
+        "name",
+        "size",
+        "schema",
+        "_tags",
+        "_format",
+        "_packers",
+        "_source",
+        "_getter",
+        "_fields",
+        "_item_fields",
+        "_num_scalars",
+        "_num_strings",
+        "_strings",
+        "_last_values",
+    )
+
+    def __init__(
+        self, name: str, template: Any, paths: list[str], source: Callable | None = None
+    ) -> None:
+        scalars = []
+        strings = []
+        arrays = []
+        for path in paths:
+            value = attrgetter(path)(template)
+            if isinstance(value, str):
+                strings.append(path)
+            elif isinstance(value, array):
+                arrays.append((path, value.typecode, len(value)))
+            else:
+                scalars.append(path)
+        num_scalars = len(scalars)
+        formats = [f"H{STRING_SIZE}s" * len(strings)]
+        fields = []  # parent getter, attribute name, kind, item index, item count
+        item_fields = [index for index in range(num_scalars)] * 2
+        for index, path in enumerate(scalars):
+            fields.append((*split_path(path), "", index, 1))
+        for path in strings:
+            item_fields += [len(fields)] * 2
+            fields.append((*split_path(path), "s", len(item_fields) - 2, 2))
+        for path, typecode, length in arrays:
+            formats.append(f"{length}{typecode}")
+            item_fields += [len(fields)] * length
+            fields.append((*split_path(path), typecode, len(item_fields) - length, length))
+        paths = scalars + strings + [path for path, _, _ in arrays]
+        self._tags = struct.Struct(f"<{num_scalars}B")
+        self._format = "".join(formats)  # strings & arrays
+        self._packers: dict[tuple[int, ...], struct.Struct] = {}
+        self._source = source
+        if len(paths) > 1:
+            self._getter = attrgetter(*paths)
+        elif paths:
+            getter = attrgetter(paths[0])
+            self._getter = lambda source: (getter(source),)
+        else:
+            self._getter = lambda source: ()
+        self._fields = tuple(fields)
+        self._item_fields = tuple(item_fields)
+        self._num_scalars = num_scalars
+        self._num_strings = len(strings)
+        self._strings: dict[bytes, str] = {}
+        self._last_values: tuple | None = None
+        self.name = name
+        self.size = struct.calcsize(f"<{num_scalars}B{num_scalars}d{self._format}")
+        self.schema = f"{name}:record:<{num_scalars}B{num_scalars}(d|q){self._format}:{','.join(paths)}"
+
+    def packer(self, tags: tuple[int, ...]) -> struct.Struct:
+        """Get record struct of scalar type tags"""
+        packer = self._packers.get(tags)
+        if packer is None:
+            if len(self._packers) >= MAX_PACKERS:
+                self._packers.clear()
+            packer = self._packers[tags] = struct.Struct(
+                f"<{len(tags)}B{scalar_format(tags)}{self._format}")
+        return packer
+
+    def encode(self, group: Any) -> bytes:
+        """Encode fields from group"""
+        values = self._getter(group if self._source is None else self._source(group))
+        num_scalars = self._num_scalars
+        scalars = values[:num_scalars]
+        tags = tuple(map(SCALAR_TAGS.get, map(type, scalars)))
+        if None in tags:  # None or other number type
+            tags, scalars = zip(*map(encode_scalar, scalars))
+        items = [*tags, *scalars]
+        string_end = num_scalars + self._num_strings
+        for text in values[num_scalars:string_end]:
+            raw = text.encode()[:STRING_SIZE]
+            items.append(len(raw))
+            items.append(raw)
+        for array_values in values[string_end:]:
+            items.extend(array_values)
+        return self.packer(tags).pack(*items)
+
+    def decode(self, group: Any, data: memoryview) -> None:
+        """Decode changed fields into group"""
+        values = self.packer(self._tags.unpack_from(data)).unpack_from(data)
+        last_values = self._last_values
+        if last_values is None:
+            changed = range(len(self._fields))
+        else:
+            changed = sorted(set(compress(self._item_fields, map(ne, values, last_values))))
+        source = group if self._source is None else self._source(group)
+        num_scalars = self._num_scalars
+        fields = self._fields
+        for field_index in changed:
+            parent_getter, attr, kind, index, count = fields[field_index]
+            target = source if parent_getter is None else parent_getter(source)
+            if kind == "":
+                setattr(target, attr, decode_scalar(values[index], values[index + num_scalars]))
+            elif kind == "s":
+                raw = values[index + 1][:values[index]]
+                text = self._strings.get(raw)
+                if text is None:
+                    if len(self._strings) > 1024:
+                        self._strings.clear()
+                    text = self._strings[raw] = raw.decode(errors="ignore")
+                setattr(target, attr, text)
+            else:
+                getattr(target, attr)[:] = array(kind, values[index:index + count])
+        self._last_values = values
+
+
+class JsonUnit:
+    """Container field encoded as JSON text
+
+    Args:
+        name: Field name.
+        path: Field path with group name, for element type lookup.
+        template: Field default value.
+    """
+
+    __slots__ = (
+        "name",
+        "size",
+        "schema",
+        "_restore",
+    )
+
+    def __init__(self, name: str, path: str, template: Any) -> None:
+        self._restore = json_restore(path, template)
+        self.name = name
+        self.size = LENGTH.size + JSON_SIZE
+        self.schema = f"{name}:json:{JSON_SIZE}"
+
+    def encode(self, group: Any) -> bytes:
+        """Encode field from group"""
+        data = json.dumps(
+            getattr(group, self.name), separators=(",", ":"), default=json_default).encode()
+        if len(data) > JSON_SIZE:
+            raise ValueError(f"{self.name} exceeds {JSON_SIZE} bytes")
+        return LENGTH.pack(len(data)) + data
+
+    def decode(self, group: Any, data: memoryview) -> None:
+        """Decode field into group"""
+        length = LENGTH.unpack_from(data)[0]
+        if length > JSON_SIZE or LENGTH.size + length > len(data):
+            raise ValueError("invalid length")
+        value = json.loads(bytes(data[LENGTH.size:LENGTH.size + length]))
+        setattr(group, self.name, self._restore(value))
+
+
+class TableUnit:
+    """Float rows field (tuple of float tuples, or None) packed as doubles
+
+    Encoded data is cached while field holds same (immutable) tuple.
+
+    Args:
+        name: Field name.
+    """
+
+    __slots__ = (
+        "name",
+        "size",
+        "schema",
+        "_last_value",
+        "_last_data",
+    )
+
+    def __init__(self, name: str) -> None:
+        self._last_value: Any = None
+        self._last_data = b""
+        self.name = name
+        self.size = LENGTH.size + TABLE_HEADER.size + TABLE_SIZE
+        self.schema = f"{name}:table:{TABLE_SIZE}"
+
+    def encode(self, group: Any) -> bytes:
+        """Encode field from group"""
+        value = getattr(group, self.name)
+        if self._last_data and value is self._last_value:
+            return self._last_data
+        if value is None:
+            data = TABLE_HEADER.pack(TABLE_NONE, 0)
+        else:
+            rows = len(value)
+            columns = len(value[0]) if rows else 0
+            values = array("d", chain.from_iterable(value))
+            if len(values) != rows * columns:
+                raise ValueError(f"{self.name} row length mismatch")
+            if len(values) * values.itemsize > TABLE_SIZE:
+                raise ValueError(f"{self.name} exceeds {TABLE_SIZE} bytes")
+            if sys.byteorder == "big":
+                values.byteswap()
+            data = TABLE_HEADER.pack(rows, columns) + values.tobytes()
+        self._last_value = value
+        self._last_data = LENGTH.pack(len(data)) + data
+        return self._last_data
+
+    def decode(self, group: Any, data: memoryview) -> None:
+        """Decode field into group"""
+        length = LENGTH.unpack_from(data)[0]
+        rows, columns = TABLE_HEADER.unpack_from(data, LENGTH.size)
+        if rows == TABLE_NONE:
+            setattr(group, self.name, None)
+            return
+        offset = LENGTH.size + TABLE_HEADER.size
+        if length != TABLE_HEADER.size + rows * columns * 8 or offset + rows * columns * 8 > len(data):
+            raise ValueError("invalid length")
+        values = array("d")
+        values.frombytes(data[offset:offset + rows * columns * 8])
+        if sys.byteorder == "big":
+            values.byteswap()
+        if columns:
+            value = tuple(zip(*[iter(values)] * columns))
+        else:
+            value = ((),) * rows
+        setattr(group, self.name, value)
+
+
+def record_paths(template: Any, prefix: str = "") -> tuple[list[str], list[str]]:
+    """Split slots fields of template object into record field paths & other field names"""
+    paths = []
+    others = []
+    for name in type(template).__slots__:
+        value = getattr(template, name)
+        path = f"{prefix}{name}"
+        if isinstance(value, (bool, int, float, str)):
+            paths.append(path)
+        elif isinstance(value, array) and value.typecode in "bBhHiIqQfd":
+            paths.append(path)
+        elif is_record_object(value):
+            nested_paths, nested_others = record_paths(value, f"{path}.")
+            if nested_others:
+                raise ValueError(f"unsupported nested field: {path}.{nested_others[0]}")
+            paths.extend(nested_paths)
+        else:
+            others.append(name)
+    return paths, others
+
+
+def row_source(name: str, index: int) -> Callable[[Any], Any]:
+    """Get row object from group"""
+    return lambda group: getattr(group, name)[index]
+
+
+class GroupLayout:
+    """Minfo group payload layout
+
+    Args:
+        group_name: Minfo group name.
+        template: Group object with default values, such as new instance of group class.
+
+    Attributes:
+        group_name: Minfo group name.
+        units: Layout units, in payload order.
+        unit_sizes: Max data size of each unit (bytes).
+        size: Max payload size (bytes).
+        schema: Layout description.
+        layout_id: Layout checksum (crc32).
+    """
+
+    __slots__ = (
+        "group_name",
+        "units",
+        "unit_sizes",
+        "size",
+        "schema",
+        "layout_id",
+        "header",
+    )
+
+    def __init__(self, group_name: str, template: Any) -> None:
+        paths, others = record_paths(template)
+        units: list[Any] = [RecordUnit("", template, paths)]
+        for name in others:
+            value = getattr(template, name)
+            path = f"{group_name}.{name}"
+            if path in TABLE_FIELDS:
+                units.append(TableUnit(name))
+            elif isinstance(value, tuple) and value and all(map(is_record_object, value)):
+                row_paths, row_others = record_paths(value[0])
+                if row_others:
+                    raise ValueError(f"unsupported row field: {path}.{row_others[0]}")
+                units.extend(
+                    RecordUnit(f"{name}[{index}]", value[index], row_paths, row_source(name, index))
+                    for index in range(len(value)))
+            else:
+                units.append(JsonUnit(name, path, value))
+        self.group_name = group_name
+        self.units = tuple(units)
+        self.header = struct.Struct(f"<{len(units) * 2}I")  # unit versions & sizes
+        self.unit_sizes = tuple(unit.size for unit in units)
+        self.size = self.header.size + sum(self.unit_sizes)
+        self.schema = f"{group_name};" + ";".join(unit.schema for unit in units)
+        self.layout_id = zlib.crc32(self.schema.encode())
+
+
+class GroupWriter:
+    """Encode minfo group into payload, only changed unit version is incremented
+
+    Args:
+        layout: Group layout.
+    """
+
+    __slots__ = (
+        "layout",
+        "_versions",
+        "_data",
+        "_failed",
+    )
+
+    def __init__(self, layout: GroupLayout) -> None:
+        self.layout = layout
+        self._versions = [0] * len(layout.units)
+        self._data: list[bytes] = [b""] * len(layout.units)
+        self._failed: set[str] = set()
+
+    def update(self, group: Any) -> bytes | None:
+        """Encode group, returns payload if any unit changed, or None if not changed"""
+        layout = self.layout
+        last_data = self._data
+        changed = False
+        for index, unit in enumerate(layout.units):
+            try:
+                data = unit.encode(group)
+            except CODEC_ERRORS as error:
+                if unit.name not in self._failed:
+                    self._failed.add(unit.name)
+                    logger.warning("MODULE HOST: failed encoding %s.%s: %s",
+                        layout.group_name, unit.name, error)
+                continue
+            if data != last_data[index]:
+                last_data[index] = data
+                self._versions[index] += 1
+                changed = True
+        if not changed:
+            return None
+        return layout.header.pack(*self._versions, *map(len, last_data)) + b"".join(last_data)
+
+
+class GroupReader:
+    """Decode changed units from payload into minfo group
+
+    Args:
+        layout: Group layout.
+    """
+
+    __slots__ = (
+        "layout",
+        "_versions",
+        "_failed",
+    )
+
+    def __init__(self, layout: GroupLayout) -> None:
+        self.layout = layout
+        self._versions = (0,) * len(layout.units)
+        self._failed: set[str] = set()
+
+    def update(self, group: Any, payload: bytes) -> int:
+        """Decode changed units into group, returns number of decoded units"""
+        layout = self.layout
+        total = len(layout.units)
+        try:
+            header = layout.header.unpack_from(payload)
+        except struct.error:
+            return 0
+        versions = header[:total]
+        if versions == self._versions:
+            return 0
+        sizes = header[total:]
+        if (layout.header.size + sum(sizes) != len(payload)
+            or any(map(gt, sizes, layout.unit_sizes))):
+            if "" not in self._failed:  # group level
+                self._failed.add("")
+                logger.warning("MODULE HOST: failed decoding %s: invalid payload size",
+                    layout.group_name)
+            return 0
+        view = memoryview(payload)
+        offset = layout.header.size
+        decoded = 0
+        for unit, version, last_version, size in zip(
+            layout.units, versions, self._versions, sizes):
+            end = offset + size
+            if version != last_version and size:
+                try:
+                    unit.decode(group, view[offset:end])
+                    decoded += 1
+                except CODEC_ERRORS as error:
+                    if unit.name not in self._failed:
+                        self._failed.add(unit.name)
+                        logger.warning("MODULE HOST: failed decoding %s.%s: %s",
+                            layout.group_name, unit.name, error)
+            offset = end
+        self._versions = versions
+        return decoded
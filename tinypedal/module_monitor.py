@@ -0,0 +1,203 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module monitor
+
+Per-module update loop timing, measured from module update event:
+an iteration starts when `wait()` returns, and ends on next `wait()` call.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from time import monotonic
+from typing import NamedTuple
+
+EMA_FACTOR = 0.05  # moving average factor
+# Iteration duration histogram bucket upper bounds (seconds), last bucket is unbounded
+HISTOGRAM_BOUNDS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05)
+
+
+class TimingSnapshot(NamedTuple):
+    """Module timing snapshot
+
+    name: Module name.
+    iterations: Number of update iterations.
+    duration_avg: Average iteration duration (seconds, EMA).
+    duration_max: Max iteration duration (seconds).
+    overruns: Number of iterations that took longer than update interval.
+    frequency: Effective update rate (Hz, EMA).
+    staleness_avg: Average source data age at iteration start (seconds, EMA).
+    staleness_max: Max source data age at iteration start (seconds).
+    histogram: Iteration count per duration bucket, see HISTOGRAM_BOUNDS.
+    """
+
+    name: str
+    iterations: int
+    duration_avg: float
+    duration_max: float
+    overruns: int
+    frequency: float
+    staleness_avg: float
+    staleness_max: float
+    histogram: tuple[int, ...]
+
+
+class ModuleTiming:
+    """Module update loop timing
+
+    Updated from module thread only, read from any thread.
+    """
+
+    __slots__ = (
+        "_monitor",
+        "_start",
+        "name",
+        "iterations",
+        "duration_avg",
+        "duration_max",
+        "overruns",
+        "period_avg",
+        "staleness_avg",
+        "staleness_max",
+        "histogram",
+    )
+
+    def __init__(self, name: str, monitor: ModuleMonitor):
+        self._monitor = monitor
+        self._start = 0.0
+        self.name = name
+        self.iterations = 0
+        self.duration_avg = 0.0
+        self.duration_max = 0.0
+        self.overruns = 0
+        self.period_avg = 0.0
+        self.staleness_avg = 0.0
+        self.staleness_max = 0.0
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+
+    def begin(self):
+        """Iteration begin"""
+        now = monotonic()
+        if self._start:
+            period = now - self._start
+            if self.period_avg:
+                self.period_avg += (period - self.period_avg) * EMA_FACTOR
+            else:
+                self.period_avg = period
+        self._start = now
+        last_data_update = self._monitor.last_data_update
+        if last_data_update:
+            staleness = now - last_data_update
+            self.staleness_avg += (staleness - self.staleness_avg) * EMA_FACTOR
+            if self.staleness_max < staleness:
+                self.staleness_max = staleness
+
+    def end(self, interval: float | None):
+        """Iteration end
+
+        Args:
+            interval: Current module update interval (seconds).
+        """
+        if not self._start:
+            return
+        duration = monotonic() - self._start
+        self.iterations += 1
+        self.duration_avg += (duration - self.duration_avg) * EMA_FACTOR
+        if self.duration_max < duration:
+            self.duration_max = duration
+        if interval is not None and duration > interval:
+            self.overruns += 1
+        self.histogram[bisect_left(HISTOGRAM_BOUNDS, duration)] += 1
+
+    def reset(self):
+        """Reset timing"""
+        self.iterations = 0
+        self.duration_avg = 0.0
+        self.duration_max = 0.0
+        self.overruns = 0
+        self.period_avg = 0.0
+        self.staleness_avg = 0.0
+        self.staleness_max = 0.0
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+
+    def snapshot(self) -> TimingSnapshot:
+        """Timing snapshot"""
+        return TimingSnapshot(
+            name=self.name,
+            iterations=self.iterations,
+            duration_avg=self.duration_avg,
+            duration_max=self.duration_max,
+            overruns=self.overruns,
+            frequency=1 / self.period_avg if self.period_avg else 0.0,
+            staleness_avg=self.staleness_avg,
+            staleness_max=self.staleness_max,
+            histogram=tuple(self.histogram),
+        )
+
+
+class ModuleMonitor:
+    """Module timing monitor
+
+    Attributes:
+        last_data_update: Last source data version change time (monotonic seconds).
+    """
+
+    __slots__ = (
+        "_lock",
+        "_timings",
+        "last_data_update",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timings: dict[str, ModuleTiming] = {}
+        self.last_data_update = 0.0
+
+    def register(self, name: str) -> ModuleTiming:
+        """Register module, returns new timing"""
+        timing = ModuleTiming(name, self)
+        with self._lock:
+            self._timings[name] = timing
+        return timing
+
+    def unregister(self, name: str):
+        """Unregister module"""
+        with self._lock:
+            self._timings.pop(name, None)
+
+    def data_updated(self):
+        """Mark source data version changed, called from API sync thread"""
+        self.last_data_update = monotonic()
+
+    def reset(self):
+        """Reset all timings"""
+        with self._lock:
+            for timing in self._timings.values():
+                timing.reset()
+
+    def snapshot(self) -> tuple[TimingSnapshot, ...]:
+        """Timing snapshot of all registered modules, sorted by name"""
+        with self._lock:
+            timings = sorted(self._timings.values(), key=lambda timing: timing.name)
+        return tuple(timing.snapshot() for timing in timings)
+
+
+monitor = ModuleMonitor()
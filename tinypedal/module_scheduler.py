@@ -0,0 +1,311 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module tick scheduler
+
+Run data modules once per new shared memory data version (tick),
+in a defined order, instead of independent polling at unrelated phases.
+
+Each module keeps its own thread and update loop, scheduler only decides
+when module `wait()` returns, and waits for module to finish current
+update (hand-off) before triggering next module in order.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from time import monotonic
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+TICK_EMA_FACTOR = 0.05  # tick interval moving average factor
+TICK_INTERVAL_INIT = 0.01  # initial tick interval estimate (seconds)
+HANDOFF_TIMEOUT = 0.05  # max wait for module to finish update before moving on (seconds)
+
+
+class ModuleEvent:
+    """Module update event
+
+    Drop-in replacement for `threading.Event` used by module update loop.
+    `wait()` returns True if stopped, False if module should run an update.
+
+    If not scheduled, behaves the same as `threading.Event`.
+    If scheduled, returns on scheduler tick, or after fallback timeout
+    if no tick arrived (such as game paused or data freezed).
+
+    Attributes:
+        scheduled: Whether event is driven by scheduler.
+        fallback_timeout: Minimum wait timeout while scheduled (seconds).
+        timing: Optional module timing (see module_monitor), updated on each wait.
+    """
+
+    __slots__ = (
+        "_cond",
+        "_stopped",
+        "_pending",
+        "_busy",
+        "scheduled",
+        "fallback_timeout",
+        "timing",
+    )
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._pending = False
+        self._busy = False
+        self.scheduled = False
+        self.fallback_timeout = 0.2
+        self.timing = None
+
+    def is_set(self) -> bool:
+        """Is stopped"""
+        return self._stopped
+
+    def set(self) -> None:
+        """Set stop state, wake up waiting module"""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+
+    def clear(self) -> None:
+        """Clear stop state"""
+        with self._cond:
+            self._stopped = False
+            self._pending = False
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait for next update
+
+        Args:
+            timeout: Module update interval (seconds).
+
+        Returns:
+            True if stopped, False if should update.
+        """
+        timing = self.timing
+        if timing is not None:
+            timing.end(timeout)
+        with self._cond:
+            # Previous update finished, hand off to scheduler
+            self._busy = False
+            self._cond.notify_all()
+            if self.scheduled:
+                if timeout is not None:
+                    timeout = max(timeout, self.fallback_timeout)
+                self._cond.wait_for(self.__ready, timeout)
+                self._pending = False
+            else:
+                self._cond.wait_for(self.__is_stopped, timeout)
+            self._busy = not self._stopped
+            stopped = self._stopped
+        if timing is not None and not stopped:
+            timing.begin()
+        return stopped
+
+    def trigger(self) -> None:
+        """Trigger update from scheduler"""
+        with self._cond:
+            self._pending = True
+            self._busy = True
+            self._cond.notify_all()
+
+    def wait_done(self, timeout: float) -> bool:
+        """Wait module finish triggered update, True if finished in time"""
+        with self._cond:
+            return self._cond.wait_for(self.__is_idle, timeout)
+
+    def __ready(self) -> bool:
+        return self._stopped or self._pending
+
+    def __is_stopped(self) -> bool:
+        return self._stopped
+
+    def __is_idle(self) -> bool:
+        return self._stopped or not self._busy
+
+
+class ScheduledModule:
+    """Scheduled module entry
+
+    Attributes:
+        name: Module name.
+        event: Module update event.
+        interval: Module active update interval (seconds).
+        divider: Run once every N ticks, updated from measured tick interval.
+    """
+
+    __slots__ = (
+        "name",
+        "event",
+        "interval",
+        "divider",
+    )
+
+    def __init__(self, name: str, event: ModuleEvent, interval: float) -> None:
+        self.name = name
+        self.event = event
+        self.interval = interval
+        self.divider = 1
+
+
+class TickScheduler:
+    """Central module tick scheduler
+
+    Call `notify()` on each new data version (from API sync thread),
+    scheduler thread then runs subscribed modules in order.
+
+    Attributes:
+        enabled: Whether scheduler is enabled.
+        tick_count: Total ticks since start.
+        tick_interval: Measured average tick interval (seconds).
+        handoff_timeouts: Number of module updates that exceeded hand-off timeout.
+    """
+
+    __slots__ = (
+        "_lock",
+        "_tick_event",
+        "_thread",
+        "_running",
+        "_modules",
+        "_order",
+        "_last_tick",
+        "enabled",
+        "fallback_timeout",
+        "tick_count",
+        "tick_interval",
+        "handoff_timeouts",
+    )
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tick_event = threading.Event()
+        self._thread = None
+        self._running = False
+        self._modules: tuple[ScheduledModule, ...] = ()
+        self._order: tuple[str, ...] = ()
+        self._last_tick = 0.0
+        self.enabled = False
+        self.fallback_timeout = 0.2
+        self.tick_count = 0
+        self.tick_interval = TICK_INTERVAL_INIT
+        self.handoff_timeouts = 0
+
+    def setup(self, enabled: bool, fallback_timeout: float) -> None:
+        """Setup scheduler
+
+        Args:
+            enabled: Whether to enable scheduler.
+            fallback_timeout: Module fallback update timeout (seconds) if no tick arrived.
+        """
+        self.enabled = enabled
+        self.fallback_timeout = max(fallback_timeout, 0.01)
+
+    def set_order(self, names: Iterable[str]) -> None:
+        """Set module run order (from module dependency graph),
+        modules not in order are run afterwards in name order
+        """
+        with self._lock:
+            self._order = tuple(names)
+            self._modules = self.__sort(self._modules)
+
+    def register(self, name: str, event: ModuleEvent, interval: float) -> None:
+        """Register module event to scheduler"""
+        if not self.enabled:
+            return
+        event.fallback_timeout = self.fallback_timeout
+        event.scheduled = True
+        with self._lock:
+            modules = tuple(entry for entry in self._modules if entry.name != name)
+            self._modules = self.__sort(modules + (ScheduledModule(name, event, interval),))
+        if not self._running:
+            self.start()
+
+    def unregister(self, name: str) -> None:
+        """Unregister module from scheduler"""
+        with self._lock:
+            self._modules = tuple(entry for entry in self._modules if entry.name != name)
+
+    def notify(self) -> None:
+        """Notify new data version, called from API sync thread"""
+        self._tick_event.set()
+
+    def start(self) -> None:
+        """Start scheduler thread"""
+        if not self._running:
+            self._running = True
+            self._tick_event.clear()
+            self._thread = threading.Thread(target=self.__run, daemon=True)
+            self._thread.start()
+            logger.info("ENABLED: module tick scheduler")
+
+    def stop(self) -> None:
+        """Stop scheduler thread"""
+        if self._running:
+            self._running = False
+            self._tick_event.set()
+            self._thread.join()
+            self._thread = None
+            logger.info(
+                "DISABLED: module tick scheduler, %s ticks, %s hand-off timeouts",
+                self.tick_count,
+                self.handoff_timeouts,
+            )
+
+    @property
+    def order(self) -> tuple[str, ...]:
+        """Current module run order"""
+        return tuple(entry.name for entry in self._modules)
+
+    def __sort(self, modules: tuple[ScheduledModule, ...]) -> tuple[ScheduledModule, ...]:
+        """Sort modules by run order"""
+        rank = {name: index for index, name in enumerate(self._order)}
+        last = len(rank)
+        return tuple(sorted(modules, key=lambda entry: (rank.get(entry.name, last), entry.name)))
+
+    def __run(self) -> None:
+        """Run modules on each tick"""
+        _tick_wait = self._tick_event.wait
+        _tick_clear = self._tick_event.clear
+        while self._running:
+            if not _tick_wait(1):
+                continue
+            _tick_clear()
+            if not self._running:
+                break
+            now = monotonic()
+            if self._last_tick:
+                self.tick_interval += (now - self._last_tick - self.tick_interval) * TICK_EMA_FACTOR
+            self._last_tick = now
+            self.tick_count += 1
+            tick_count = self.tick_count
+            tick_interval = max(self.tick_interval, 0.001)
+            # Ordered hand-off, run module and wait finish before next module
+            for entry in self._modules:
+                entry.divider = max(round(entry.interval / tick_interval), 1)
+                if tick_count % entry.divider:
+                    continue
+                entry.event.trigger()
+                if not entry.event.wait_done(HANDOFF_TIMEOUT):
+                    self.handoff_timeouts += 1
+
+
+scheduler = TickScheduler()
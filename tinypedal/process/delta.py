@@ -0,0 +1,219 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Delta function
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from typing import Iterable
+
+from ..const_common import DELTA_DEFAULT
+
+MAX_CURSOR_STEPS = 8  # max forward steps before falling back to binary search
+
+
+class DeltaReference:
+    """Delta reference lap
+
+    Distance & laptime are stored as separated array columns.
+    Lookup keeps a cursor at last found position, and advances it
+    while position moves forward, so lookup is near constant time.
+    Falls back to binary search if position moves backward (new lap, position wrap)
+    or jumps forward.
+
+    Args:
+        dataset: Delta rows (distance, laptime), distance in ascending order.
+
+    Attributes:
+        distance: Distance column (meters).
+        laptime: Laptime column (seconds).
+    """
+
+    __slots__ = (
+        "_cursor",
+        "distance",
+        "laptime",
+    )
+
+    def __init__(self, dataset: Iterable[tuple[float, float]] = DELTA_DEFAULT):
+        self._cursor = 0
+        self.distance = array("d")
+        self.laptime = array("d")
+        self.load(dataset)
+
+    def __len__(self) -> int:
+        return len(self.distance)
+
+    def load(self, dataset: Iterable[tuple[float, float]]):
+        """Load delta rows (distance, laptime)"""
+        distance = array("d")
+        laptime = array("d")
+        for row in dataset:
+            distance.append(row[0])
+            laptime.append(row[1])
+        self.distance = distance
+        self.laptime = laptime
+        self._cursor = 0
+
+    def assign(self, reference: DeltaReference):
+        """Share columns from another reference, columns are never modified in place"""
+        self.distance = reference.distance
+        self.laptime = reference.laptime
+        self._cursor = 0
+
+    def rows(self) -> tuple[tuple[float, float], ...]:
+        """Delta rows (distance, laptime)"""
+        return tuple(zip(self.distance, self.laptime))
+
+    def reset_cursor(self):
+        """Reset lookup cursor"""
+        self._cursor = 0
+
+    def index_higher(self, position: float) -> int:
+        """Index of nearest distance equal or higher than position,
+        or last index if position exceeds all distance
+        """
+        distance = self.distance
+        end = len(distance) - 1
+        cursor = self._cursor
+        if cursor > end or (cursor > 0 and distance[cursor - 1] >= position):
+            cursor = bisect_left(distance, position, 0, end)  # moved backward
+        else:
+            steps = MAX_CURSOR_STEPS
+            while cursor < end and distance[cursor] < position:
+                if not steps:
+                    cursor = bisect_left(distance, position, cursor, end)  # jumped forward
+                    break
+                cursor += 1
+                steps -= 1
+        self._cursor = cursor
+        return cursor
+
+    def delta(self, position: float, target: float, condition: bool = True) -> float:
+        """Delta between target laptime and reference laptime at position,
+        see calculation.delta_telemetry
+        """
+        if not condition:
+            return 0
+        return self.delta_at(self.index_higher(position), position, target)
+
+    def delta_at(self, index_higher: int, position: float, target: float) -> float:
+        """Delta at found index, see index_higher"""
+        if index_higher > 0:
+            index_lower = index_higher - 1
+            distance_lower = self.distance[index_lower]
+            laptime_lower = self.laptime[index_lower]
+            distance_diff = self.distance[index_higher] - distance_lower
+            if distance_diff:
+                return target - (laptime_lower + (position - distance_lower) * (
+                    self.laptime[index_higher] - laptime_lower) / distance_diff)
+            return target - laptime_lower
+        return 0
+
+
+class DeltaEngine:
+    """Delta engine, evaluate any number of delta references in one pass
+
+    References that share same distance column (see DeltaReference.assign)
+    also share position lookup.
+
+    Args:
+        ema_factor: Delta smoothing factor (exponential moving average), 1 to disable.
+    """
+
+    __slots__ = (
+        "_names",
+        "_references",
+        "_deltas",
+        "ema_factor",
+    )
+
+    def __init__(self, ema_factor: float = 1.0):
+        self._names: list[str] = []
+        self._references: list[DeltaReference] = []
+        self._deltas: list[float] = []
+        self.ema_factor = ema_factor
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+
+    def register(self, name: str, reference: DeltaReference | None = None) -> DeltaReference:
+        """Register (or replace) delta reference, returns registered reference"""
+        if reference is None:
+            reference = DeltaReference()
+        if name in self._names:
+            index = self._names.index(name)
+            self._references[index] = reference
+            self._deltas[index] = 0.0
+        else:
+            self._names.append(name)
+            self._references.append(reference)
+            self._deltas.append(0.0)
+        return reference
+
+    def unregister(self, name: str):
+        """Unregister delta reference"""
+        if name in self._names:
+            index = self._names.index(name)
+            del self._names[index]
+            del self._references[index]
+            del self._deltas[index]
+
+    def reference(self, name: str) -> DeltaReference:
+        """Registered delta reference"""
+        return self._references[self._names.index(name)]
+
+    def reset(self):
+        """Reset smoothed delta & lookup cursor"""
+        for index, reference in enumerate(self._references):
+            reference.reset_cursor()
+            self._deltas[index] = 0.0
+
+    def update(self, position: float, target: float, condition: bool = True):
+        """Update smoothed delta of all references
+
+        Args:
+            position: Current position (meters).
+            target: Current laptime (seconds).
+            condition: Whether to calculate delta, otherwise raw delta is 0.
+        """
+        factor = self.ema_factor
+        deltas = self._deltas
+        found = {}
+        for index, reference in enumerate(self._references):
+            if condition:
+                column_id = id(reference.distance)
+                index_higher = found.get(column_id)
+                if index_higher is None:
+                    index_higher = found[column_id] = reference.index_higher(position)
+                raw_delta = reference.delta_at(index_higher, position, target)
+            else:
+                raw_delta = 0
+            deltas[index] += factor * (raw_delta - deltas[index])
+
+    def delta(self, name: str) -> float:
+        """Smoothed delta of reference"""
+        return self._deltas[self._names.index(name)]
+
+    def deltas(self) -> dict[str, float]:
+        """Smoothed delta of all references"""
+        return dict(zip(self._names, self._deltas))
@@ -41,6 +41,7 @@ CFG_BOOL = (
     "^remember_size$|"
     "^vr_compatibility$|"
     "^connect_to_remote$|"
+    "^websocket_sparse_frames$|"
     # Partial match
     "align_center|"
     "enable|"
@@ -67,6 +68,7 @@ CFG_TEXT_ALIGNMENT = "text_alignment"
 CFG_MULTIMEDIA_PLUGIN = "multimedia_plugin"
 CFG_STATS_CLASSIFICATION = "vehicle_classification"
 CFG_WINDOW_COLOR_THEME = "window_color_theme"
+CFG_WEBSOCKET_COMPRESSION = "^websocket_compression$"
 
 # String common
 CFG_FONT_NAME = "font_name"
@@ -82,6 +84,7 @@ CFG_STRING = (
     "^websocket_uri$|"
     "^websocket_session$|"
     "^auth_key$|"
+    "^shared_memory_name$|"
     # Partial match
     "file_name|"
     "prefix|"
@@ -101,6 +104,7 @@ CFG_INTEGER = (
     "^leading_zero$|"
     "^manual_steering_range$|"
     "^maximum_saving_attempts$|"
+    "^module_tick_fallback_timeout$|"
     "^player_index$|"
     "^parts_width$|"
     "^parts_max_height$|"
@@ -110,6 +114,8 @@ CFG_INTEGER = (
     "^snap_distance$|"
     "^snap_gap$|"
     "^stint_history_count$|"
+    "^websocket_keyframe_interval$|"
+    "^websocket_compression_level$|"
     "^window_width$|"
     "^window_height$|"
     
@@ -195,6 +201,7 @@ CHOICE_COMMON = {
     CFG_MULTIMEDIA_PLUGIN: ["WMF", "DirectShow"],
     CFG_STATS_CLASSIFICATION: ["Class - Brand", "Class", "Vehicle"],
     CFG_WINDOW_COLOR_THEME: ["Light", "Dark"],
+    CFG_WEBSOCKET_COMPRESSION: ["zlib", "lz4", "zstd", "none"],
 }
 CHOICE_UNITS = {
     "distance_unit": ["Meter", "Feet"],
@@ -442,6 +442,52 @@ class Setting:
     def websocket_interval(self, value: float):
         self.shared_memory_api["websocket_interval"] = value
 
+    @property
+    def websocket_segment_intervals(self) -> dict[str, float]:
+        """Sending interval (seconds) of each remote data segment, telemetry uses websocket_interval"""
+        return {
+            "scor": self.shared_memory_api.get("websocket_scoring_interval", 0.2),
+            "tele": self.websocket_interval,
+            "ext": self.shared_memory_api.get("websocket_extended_interval", 1.0),
+            "ffb": self.shared_memory_api.get("websocket_force_feedback_interval", 0.1),
+        }
+
+    @property
+    def websocket_keyframe_interval(self) -> int:
+        """Number of delta frames sent between full keyframes"""
+        return self.shared_memory_api.get("websocket_keyframe_interval", 50)
+
+    @websocket_keyframe_interval.setter
+    def websocket_keyframe_interval(self, value: int):
+        self.shared_memory_api["websocket_keyframe_interval"] = value
+
+    @property
+    def websocket_sparse_frames(self) -> bool:
+        """Send only populated vehicle slots in scoring & telemetry frames"""
+        return self.shared_memory_api.get("websocket_sparse_frames", True)
+
+    @websocket_sparse_frames.setter
+    def websocket_sparse_frames(self, value: bool):
+        self.shared_memory_api["websocket_sparse_frames"] = value
+
+    @property
+    def websocket_compression(self) -> str:
+        """Relay compression codec name"""
+        return self.shared_memory_api.get("websocket_compression", "zlib")
+
+    @websocket_compression.setter
+    def websocket_compression(self, value: str):
+        self.shared_memory_api["websocket_compression"] = value
+
+    @property
+    def websocket_compression_level(self) -> int:
+        """Relay compression level"""
+        return self.shared_memory_api.get("websocket_compression_level", 6)
+
+    @websocket_compression_level.setter
+    def websocket_compression_level(self, value: int):
+        self.shared_memory_api["websocket_compression_level"] = value
+
     @property
     def auth_key(self) -> str:
         return self.shared_memory_api.get("auth_key", "")
@@ -0,0 +1,183 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Shared memory block
+
+Single writer, multiple reader shared memory block protected by sequence lock (seqlock).
+
+Block layout (little-endian):
+    0   4s  magic (b"TPSB")
+    4   H   layout version
+    6   H   reserved
+    8   Q   sequence, odd while writing, even when payload is consistent
+    16  Q   payload size (bytes)
+    24  I   layout id, checksum of payload layout, set by writer
+    28  I   reserved
+    32  payload
+"""
+
+from __future__ import annotations
+
+import struct
+from multiprocessing import parent_process, resource_tracker, shared_memory
+
+BLOCK_MAGIC = b"TPSB"
+BLOCK_VERSION = 1
+HEADER = struct.Struct("<4sHHQQII")
+SEQUENCE = struct.Struct("<Q")
+SEQUENCE_OFFSET = 8
+SIZE_OFFSET = 16
+LAYOUT_ID_OFFSET = 24
+READ_RETRIES = 3
+
+
+def header_schema() -> dict:
+    """Block header description, for schema file"""
+    return {
+        "magic": BLOCK_MAGIC.decode(),
+        "version": BLOCK_VERSION,
+        "byte_order": "little",
+        "header_size": HEADER.size,
+        "sequence_offset": SEQUENCE_OFFSET,
+        "payload_size_offset": SIZE_OFFSET,
+        "layout_id_offset": LAYOUT_ID_OFFSET,
+        "payload_offset": HEADER.size,
+    }
+
+
+def attach_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach existing shared memory without resource tracking
+
+    Only creator should unlink shared memory, otherwise resource tracker
+    of unrelated reader process removes block on exit (python 3.12 and older).
+    Child process shares resource tracker with parent, no need to unregister.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # python 3.12 and older
+        shm = shared_memory.SharedMemory(name=name)
+        if parent_process() is None:
+            try:
+                resource_tracker.unregister(shm._name, "shared_memory")
+            except (AttributeError, KeyError):
+                pass
+        return shm
+
+
+class SharedBlock:
+    """Shared memory block
+
+    Args:
+        name: Shared memory name.
+        capacity: Max payload size (bytes), only used while creating.
+        create: Whether to create new block (writer), or attach existing block (reader).
+        layout_id: Payload layout id. Reader raises ValueError if mismatched,
+            set 0 to skip check.
+
+    Attributes:
+        name: Shared memory name.
+        capacity: Max payload size (bytes).
+        layout_id: Payload layout id.
+        sequence: Last written or read sequence.
+    """
+
+    __slots__ = (
+        "_shm",
+        "_buf",
+        "_owner",
+        "name",
+        "capacity",
+        "layout_id",
+        "sequence",
+    )
+
+    def __init__(self, name: str, capacity: int = 0, create: bool = False, layout_id: int = 0):
+        self._owner = create
+        if create:
+            self._shm = shared_memory.SharedMemory(
+                name=name, create=True, size=HEADER.size + capacity)
+            self._buf = self._shm.buf
+            HEADER.pack_into(self._buf, 0, BLOCK_MAGIC, BLOCK_VERSION, 0, 0, 0, layout_id, 0)
+        else:
+            self._shm = attach_memory(name)
+            self._buf = self._shm.buf
+            magic, version, _, _, _, block_layout_id, _ = HEADER.unpack_from(self._buf, 0)
+            if magic != BLOCK_MAGIC or version != BLOCK_VERSION:
+                self.close()
+                raise ValueError(f"shared block {name}: invalid header")
+            if layout_id and block_layout_id != layout_id:
+                self.close()
+                raise ValueError(f"shared block {name}: layout mismatch")
+            layout_id = block_layout_id
+        self.name = name
+        self.capacity = len(self._buf) - HEADER.size
+        self.layout_id = layout_id
+        self.sequence = 0
+
+    def write(self, payload: bytes) -> bool:
+        """Write payload, returns False if payload exceeds capacity"""
+        size = len(payload)
+        if size > self.capacity:
+            return False
+        buf = self._buf
+        sequence = self.sequence + 1
+        SEQUENCE.pack_into(buf, SEQUENCE_OFFSET, sequence)  # odd, writing
+        buf[HEADER.size:HEADER.size + size] = payload
+        SEQUENCE.pack_into(buf, SIZE_OFFSET, size)
+        self.sequence = sequence + 1
+        SEQUENCE.pack_into(buf, SEQUENCE_OFFSET, self.sequence)  # even, done
+        return True
+
+    def read(self, last_sequence: int = -1) -> bytes | None:
+        """Read payload
+
+        Args:
+            last_sequence: Skip reading if sequence not changed since last read.
+
+        Returns:
+            Payload bytes, or None if not changed, not written yet, or writer busy.
+        """
+        buf = self._buf
+        for _ in range(READ_RETRIES):
+            sequence = SEQUENCE.unpack_from(buf, SEQUENCE_OFFSET)[0]
+            if sequence == last_sequence or not sequence:
+                return None
+            if sequence & 1:  # writing
+                continue
+            size = SEQUENCE.unpack_from(buf, SIZE_OFFSET)[0]
+            if size > self.capacity:
+                continue
+            payload = bytes(buf[HEADER.size:HEADER.size + size])
+            if SEQUENCE.unpack_from(buf, SEQUENCE_OFFSET)[0] == sequence:
+                self.sequence = sequence
+                return payload
+        return None
+
+    def close(self):
+        """Close block, unlink if created by this process"""
+        if self._buf is None:
+            return
+        self._buf.release()
+        self._buf = None
+        self._shm.close()
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
@@ -39,10 +39,18 @@ COMMON_DEFAULT = {
         "enable_player_index_override": False,
         "player_index": -1,
         "character_encoding": "UTF-8",
+        "enable_vehicle_snapshot": False,
         
         "connect_to_remote": False,
         "websocket_uri": "ws.spqracing.it",  # New websocket URI for remote telemetry
         "websocket_interval": 0.1,
+        "websocket_scoring_interval": 0.2,
+        "websocket_extended_interval": 1.0,
+        "websocket_force_feedback_interval": 0.1,
+        "websocket_keyframe_interval": 50,
+        "websocket_sparse_frames": True,
+        "websocket_compression": "zlib",
+        "websocket_compression_level": 6,
         "websocket_session" : "default",
         "auth_key" : ""
     },
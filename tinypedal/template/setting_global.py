@@ -36,6 +36,10 @@ GLOBAL_DEFAULT = {
         "snap_gap": 0,
         "grid_move_size": 8,
         "minimum_update_interval": 10,
+        "enable_module_tick_scheduler": False,
+        "module_tick_fallback_timeout": 200,
+        "enable_module_process_host": False,
+        "module_host_update_interval": 10,
         "maximum_saving_attempts": 10,
         "position_x": 0,
         "position_y": 0,
@@ -30,12 +30,25 @@ MODULE_DEFAULT = {
         "delta_smoothing_samples": 30,
         "laptime_pace_samples": 6,
         "laptime_pace_margin": 5,
+        "reference_lap_file_suffix": "",
+        "enable_csv_export": False,
     },
     "module_energy": {
         "enable": True,
         "update_interval": 10,
         "idle_update_interval": 400,
         "minimum_delta_distance": 5,
+        "enable_csv_export": False,
+    },
+    "module_export": {
+        "enable": False,
+        "update_interval": 20,
+        "idle_update_interval": 400,
+        "shared_memory_name": "TinyPedal_Export",
+        "enable_delta_export": True,
+        "enable_energy_export": False,
+        "enable_fuel_export": True,
+        "enable_relative_export": True,
     },
     "module_force": {
         "enable": True,
@@ -53,6 +66,7 @@ MODULE_DEFAULT = {
         "update_interval": 10,
         "idle_update_interval": 400,
         "minimum_delta_distance": 5,
+        "enable_csv_export": False,
     },
     "module_hybrid": {
         "enable": True,
@@ -74,6 +88,7 @@ MODULE_DEFAULT = {
         "enable": True,
         "update_interval": 100,
         "idle_update_interval": 400,
+        "enable_vectorized_engine": False,
     },
     "module_restapi": {
         "enable": True,
@@ -110,6 +125,7 @@ MODULE_DEFAULT = {
         "idle_update_interval": 400,
         "lap_difference_ahead_threshold": 0.9,
         "lap_difference_behind_threshold": 0.9,
+        "enable_vectorized_engine": False,
     },
     "module_wheels": {
         "enable": True,
@@ -22,12 +22,16 @@ Driver stats viewer
 
 from __future__ import annotations
 
+import sqlite3
+from math import ceil
+
 from PySide6.QtCore import QPoint, Qt
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QComboBox,
     QHBoxLayout,
     QHeaderView,
+    QLabel,
     QMenu,
     QMessageBox,
     QTableWidget,
@@ -38,14 +42,18 @@ from PySide6.QtWidgets import (
 from .. import calculation as calc
 from ..api_control import api
 from ..const_common import MAX_SECONDS
+from ..file_writer import file_writer
 from ..formatter import strip_invalid_char
 from ..setting import cfg
 from ..units import liter_to_gallon, meter_to_kilometer, meter_to_mile
 from ..userfile.driver_stats import (
     DriverStats,
-    load_stats_json_file,
-    save_stats_json_file,
-    validate_stats_file,
+    count_stats_vehicles,
+    delete_stats,
+    query_stats_tracks,
+    query_stats_vehicles,
+    reset_stats_value,
+    stats_db_filename_full,
 )
 from ._common import (
     BaseEditor,
@@ -55,6 +63,8 @@ from ._common import (
 )
 from .track_map_viewer import TrackMapViewer
 
+PAGE_SIZE = 100  # max vehicles per page
+
 
 def parse_display_value(key: str, value: int | float) -> str | int | float:
     """Parse stats display value"""
@@ -104,9 +114,11 @@ class DriverStatsViewer(BaseEditor):
         self.set_utility_title("Driver Stats Viewer")
         self.setMinimumSize(UIScaler.size(66), UIScaler.size(30))
 
-        self.stats_temp = {}
         self.selected_stats_key = ""  # get active session key
-        self.selected_stats_dict = {}
+        self.sort_column = 1  # sort by laptime
+        self.sort_descending = False
+        self.page_index = 0
+        self.page_total = 1
 
         # Preset selector
         self.stats_list = QComboBox()
@@ -128,11 +140,22 @@ class DriverStatsViewer(BaseEditor):
             self.table_stats.horizontalHeader().setSectionResizeMode(idx, QHeaderView.Fixed)
             self.table_stats.setColumnWidth(idx, UIScaler.size(5))
 
+        # Sort by database query instead of table, as table only holds current page
+        self.table_stats.horizontalHeader().setSortIndicatorShown(True)
+        self.table_stats.horizontalHeader().setSortIndicator(self.sort_column, Qt.AscendingOrder)
+        self.table_stats.horizontalHeader().sectionClicked.connect(self.sort_stats)
+
         self.table_stats.setContextMenuPolicy(Qt.CustomContextMenu)
         self.table_stats.customContextMenuRequested.connect(self.open_context_menu)
 
+        # Page
+        self.label_page = QLabel("")
+        self.button_prev_page = CompactButton("<")
+        self.button_prev_page.clicked.connect(self.prev_page)
+        self.button_next_page = CompactButton(">")
+        self.button_next_page.clicked.connect(self.next_page)
+
         self.reload_stats()
-        self.refresh_table()
 
         # Button
         button_delete = CompactButton("Delete")
@@ -158,6 +181,10 @@ class DriverStatsViewer(BaseEditor):
 
         layout_button.addWidget(button_reload)
         layout_button.addStretch(1)
+        layout_button.addWidget(self.button_prev_page)
+        layout_button.addWidget(self.label_page)
+        layout_button.addWidget(self.button_next_page)
+        layout_button.addStretch(1)
         layout_button.addWidget(button_close)
 
         layout_main.addLayout(layout_selector)
@@ -168,38 +195,56 @@ class DriverStatsViewer(BaseEditor):
 
     def reload_stats(self):
         """Reload stats data"""
-        stats_user = load_stats_json_file(
-            filepath=cfg.path.config,
-        )
-        if stats_user is None:
+        file_writer.wait(stats_db_filename_full(cfg.path.config))  # pending save
+        try:
+            track_list = query_stats_tracks(cfg.path.config)
+        except sqlite3.Error as error:
+            QMessageBox.warning(self, "Error", f"Unable to load stats data.<br><br>{error}")
             return
 
-        self.stats_temp = validate_stats_file(stats_user)
-
         if self.selected_stats_key:
             last_selected_stats_key = self.selected_stats_key
         else:  # initial load current track name
             last_selected_stats_key = api.read.session.track_name()
 
+        self.stats_list.blockSignals(True)
         self.stats_list.clear()
-        if self.stats_temp:
-            self.stats_list.addItems(sorted(self.stats_temp.keys(), key=sort_stats_key))
+        self.stats_list.addItems(track_list)
         self.stats_list.setCurrentText(last_selected_stats_key)
+        self.stats_list.blockSignals(False)
+        self.select_stats()
 
     def refresh_table(self):
-        """Refresh stats table"""
-        self.table_stats.setSortingEnabled(False)  # must disable before refresh
+        """Refresh stats table, query current page only"""
         self.table_stats.setRowCount(0)
-
-        row_index = 0
-        for veh_name, veh_data in self.selected_stats_dict.items():
-            self.add_stats_vehicle(row_index, veh_name, veh_data)
-            row_index += 1
-
-        self.table_stats.setSortingEnabled(True)
-        self.table_stats.sortByColumn(1, Qt.AscendingOrder)  # sort by laptime
-
-    def add_stats_vehicle(self, row_index: int, veh_name: str, veh_data: dict):
+        vehicle_stats = ()
+        if self.selected_stats_key:
+            try:
+                total = count_stats_vehicles(cfg.path.config, self.selected_stats_key)
+                self.page_total = max(ceil(total / PAGE_SIZE), 1)
+                self.page_index = min(self.page_index, self.page_total - 1)
+                vehicle_stats = query_stats_vehicles(
+                    cfg.path.config,
+                    self.selected_stats_key,
+                    order_by=self.table_header_key[self.sort_column],
+                    descending=self.sort_descending,
+                    limit=PAGE_SIZE,
+                    offset=self.page_index * PAGE_SIZE,
+                )
+            except sqlite3.Error as error:
+                QMessageBox.warning(self, "Error", f"Unable to load stats data.<br><br>{error}")
+        else:  # clear table if no track data found
+            self.page_total = 1
+            self.page_index = 0
+
+        for row_index, (veh_name, veh_stats) in enumerate(vehicle_stats):
+            self.add_stats_vehicle(row_index, veh_name, veh_stats)
+
+        self.label_page.setText(f"{self.page_index + 1}/{self.page_total}")
+        self.button_prev_page.setEnabled(self.page_index > 0)
+        self.button_next_page.setEnabled(self.page_index < self.page_total - 1)
+
+    def add_stats_vehicle(self, row_index: int, veh_name: str, veh_stats: DriverStats):
         """Add stats vehicle to table"""
         self.table_stats.insertRow(row_index)
         flag_selectable = Qt.ItemIsSelectable | Qt.ItemIsEnabled
@@ -212,7 +257,7 @@ class DriverStatsViewer(BaseEditor):
                 self.table_stats.setItem(row_index, column_index, item)
                 continue
             # Vehicle stats
-            value_raw = veh_data.get(header_key, 0)
+            value_raw = getattr(veh_stats, header_key)
             item = NumericTableItem(value_raw, str(parse_display_value(header_key, value_raw)))
             item.setFlags(flag_selectable)
             item.setTextAlignment(Qt.AlignCenter)
@@ -221,11 +266,32 @@ class DriverStatsViewer(BaseEditor):
     def select_stats(self):
         """Select stats key"""
         self.selected_stats_key = self.stats_list.currentText()
-        if self.selected_stats_key:
-            self.selected_stats_dict = self.stats_temp[self.selected_stats_key]
-            self.refresh_table()
+        self.page_index = 0
+        self.refresh_table()
+
+    def sort_stats(self, column_index: int):
+        """Sort stats by column, toggle order if same column"""
+        if self.sort_column == column_index:
+            self.sort_descending = not self.sort_descending
         else:
-            self.table_stats.setRowCount(0)  # clear table if no track data found
+            self.sort_column = column_index
+            self.sort_descending = False
+        self.table_stats.horizontalHeader().setSortIndicator(
+            column_index, Qt.DescendingOrder if self.sort_descending else Qt.AscendingOrder)
+        self.page_index = 0
+        self.refresh_table()
+
+    def prev_page(self):
+        """Previous page"""
+        if self.page_index > 0:
+            self.page_index -= 1
+            self.refresh_table()
+
+    def next_page(self):
+        """Next page"""
+        if self.page_index < self.page_total - 1:
+            self.page_index += 1
+            self.refresh_table()
 
     def delete_stats_key(self):
         """Delete stats key"""
@@ -239,11 +305,8 @@ class DriverStatsViewer(BaseEditor):
             "This cannot be undone!"
         )
         if self.confirm_operation(message=msg_text):
-            self.stats_temp.pop(self.selected_stats_key, None)  # remove from dict
-            save_stats_json_file(
-                stats_user=self.stats_temp,
-                filepath=cfg.path.config,
-            )
+            file_writer.wait(stats_db_filename_full(cfg.path.config))  # pending save
+            delete_stats(cfg.path.config, self.selected_stats_key)
             self.reload_stats()
 
     def remove_vehicle(self):
@@ -253,22 +316,14 @@ class DriverStatsViewer(BaseEditor):
             QMessageBox.warning(self, "Error", "No data selected.")
             return
 
-        track_stats = self.stats_temp.get(self.selected_stats_key, None)
-        if not isinstance(track_stats, dict):
-            QMessageBox.warning(self, "Error", "No data found.")
-            return
-
         selected_vehicle = self.table_stats.item(selected_rows[0], 0).text()
         msg_text = (
             f"Remove all stats from <b>{selected_vehicle}</b>?<br><br>"
             "This cannot be undone!"
         )
         if self.confirm_operation(message=msg_text):
-            track_stats.pop(selected_vehicle, None)  # remove from dict
-            save_stats_json_file(
-                stats_user=self.stats_temp,
-                filepath=cfg.path.config,
-            )
+            file_writer.wait(stats_db_filename_full(cfg.path.config))  # pending save
+            delete_stats(cfg.path.config, self.selected_stats_key, selected_vehicle)
             self.reload_stats()
 
     def reset_stat(self, row: int, column: int):
@@ -281,12 +336,8 @@ class DriverStatsViewer(BaseEditor):
             "This cannot be undone!"
         )
         if self.confirm_operation(message=msg_text):
-            default_value = DriverStats.__dict__[selected_column]
-            self.stats_temp[self.selected_stats_key][selected_vehicle][selected_column] = default_value
-            save_stats_json_file(
-                stats_user=self.stats_temp,
-                filepath=cfg.path.config,
-            )
+            file_writer.wait(stats_db_filename_full(cfg.path.config))  # pending save
+            reset_stats_value(cfg.path.config, self.selected_stats_key, selected_vehicle, selected_column)
             self.reload_stats()
 
     def open_context_menu(self, position: QPoint):
@@ -327,8 +378,3 @@ class DriverStatsViewer(BaseEditor):
             filename=strip_invalid_char(self.selected_stats_key),
         )
         _dialog.show()
-
-
-def sort_stats_key(key: str):
-    """Sort stats key in lower case"""
-    return key.lower()
@@ -171,7 +171,8 @@ class ResetDataMenu(QMenu):
         """Reset deltabest data"""
         self.__confirmation(
             data_type="delta best",
-            extension="csv",
+            extension="delta",
+            extension_legacy="csv",
             filepath=cfg.path.delta_best,
             filename=api.read.check.combo_id(),
         )
@@ -180,7 +181,8 @@ class ResetDataMenu(QMenu):
         """Reset energy delta data"""
         self.__confirmation(
             data_type="energy delta",
-            extension="energy",
+            extension="energydelta",
+            extension_legacy="energy",
             filepath=cfg.path.energy_delta,
             filename=api.read.check.combo_id(),
         )
@@ -189,7 +191,8 @@ class ResetDataMenu(QMenu):
         """Reset fuel delta data"""
         self.__confirmation(
             data_type="fuel delta",
-            extension="fuel",
+            extension="fueldelta",
+            extension_legacy="fuel",
             filepath=cfg.path.fuel_delta,
             filename=api.read.check.combo_id(),
         )
@@ -222,8 +225,13 @@ class ResetDataMenu(QMenu):
             filename=api.read.check.track_id(),
         )
 
-    def __confirmation(self, data_type: str, extension: str, filepath: str, filename: str) -> bool:
-        """Message confirmation, returns true if file deleted"""
+    def __confirmation(
+        self, data_type: str, extension: str, filepath: str, filename: str,
+        extension_legacy: str = "") -> bool:
+        """Message confirmation, returns true if file deleted
+
+        Legacy file (if exists) is deleted together, so it won't be migrated again.
+        """
         # Check if on track
         if api.state:
             QMessageBox.warning(
@@ -233,8 +241,11 @@ class ResetDataMenu(QMenu):
             )
             return False
         # Check if file exist
-        filename_full = f"{filepath}{filename}.{extension}"
-        if not os.path.exists(filename_full):
+        filenames_full = tuple(
+            f"{filepath}{filename}.{ext}" for ext in (extension, extension_legacy)
+            if ext and os.path.exists(f"{filepath}{filename}.{ext}")
+        )
+        if not filenames_full:
             QMessageBox.warning(
                 self._parent,
                 "Error",
@@ -255,7 +266,8 @@ class ResetDataMenu(QMenu):
         if delete_msg != QMessageBox.Yes:
             return False
         # Delete file
-        os.remove(filename_full)
+        for filename_full in filenames_full:
+            os.remove(filename_full)
         QMessageBox.information(
             self._parent,
             f"Reset {data_type.title()}",
@@ -0,0 +1,155 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Module diagnostics
+"""
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+
+from ..formatter import format_module_name
+from ..module_monitor import HISTOGRAM_BOUNDS, TimingSnapshot, monitor
+from ._common import BaseDialog, CompactButton, UIScaler
+
+REFRESH_INTERVAL = 1000  # ms
+TABLE_HEADER = (
+    "Module",
+    "Hz",
+    "Avg (ms)",
+    "Max (ms)",
+    "Overruns",
+    "Data Age (ms)",
+    "Max Age (ms)",
+    "Duration Histogram",
+)
+
+
+def format_histogram(histogram: tuple[int, ...]) -> str:
+    """Format duration histogram as percentage per bucket, skip empty buckets"""
+    total = sum(histogram)
+    if not total:
+        return ""
+    output = []
+    for index, count in enumerate(histogram):
+        if not count:
+            continue
+        if index < len(HISTOGRAM_BOUNDS):
+            label = f"<{HISTOGRAM_BOUNDS[index] * 1000:g}"
+        else:
+            label = f">{HISTOGRAM_BOUNDS[-1] * 1000:g}"
+        output.append(f"{label}:{count / total:.0%}")
+    return "  ".join(output)
+
+
+def format_row(timing: TimingSnapshot) -> tuple[str, ...]:
+    """Format timing table row"""
+    return (
+        format_module_name(timing.name),
+        f"{timing.frequency:.1f}",
+        f"{timing.duration_avg * 1000:.3f}",
+        f"{timing.duration_max * 1000:.3f}",
+        f"{timing.overruns}",
+        f"{timing.staleness_avg * 1000:.1f}",
+        f"{timing.staleness_max * 1000:.1f}",
+        format_histogram(timing.histogram),
+    )
+
+
+class ModuleDiagnostics(BaseDialog):
+    """Module diagnostics, show data module update loop timing"""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.set_utility_title("Module Diagnostics")
+        self.setMinimumSize(UIScaler.size(60), UIScaler.size(24))
+
+        # Label
+        self.label_info = QLabel("")
+
+        # Table
+        self.table_timing = QTableWidget(self)
+        self.table_timing.setColumnCount(len(TABLE_HEADER))
+        self.table_timing.setHorizontalHeaderLabels(TABLE_HEADER)
+        self.table_timing.setSelectionMode(QAbstractItemView.NoSelection)
+        self.table_timing.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table_timing.verticalHeader().setVisible(False)
+        self.table_timing.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table_timing.horizontalHeader().setStretchLastSection(True)
+
+        # Button
+        button_reset = CompactButton("Reset")
+        button_reset.clicked.connect(self.reset_timing)
+
+        button_close = CompactButton("Close")
+        button_close.clicked.connect(self.reject)
+
+        # Layout
+        layout_button = QHBoxLayout()
+        layout_button.addWidget(button_reset)
+        layout_button.addStretch(1)
+        layout_button.addWidget(button_close)
+
+        layout_main = QVBoxLayout()
+        layout_main.addWidget(self.label_info)
+        layout_main.addWidget(self.table_timing)
+        layout_main.addLayout(layout_button)
+        layout_main.setContentsMargins(self.MARGIN, self.MARGIN, self.MARGIN, self.MARGIN)
+        self.setLayout(layout_main)
+
+        # Refresh timer
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.refresh_timing)
+        self._timer.start(REFRESH_INTERVAL)
+        self.refresh_timing()
+
+    def refresh_timing(self):
+        """Refresh timing table"""
+        timings = monitor.snapshot()
+        self.table_timing.setRowCount(len(timings))
+        for row_index, timing in enumerate(timings):
+            for column_index, text in enumerate(format_row(timing)):
+                item = self.table_timing.item(row_index, column_index)
+                if item is None:
+                    item = QTableWidgetItem()
+                    if column_index:
+                        item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                    self.table_timing.setItem(row_index, column_index, item)
+                item.setText(text)
+        if timings:
+            self.label_info.setText(f"Running: <b>{len(timings)}</b>")
+        else:
+            self.label_info.setText("Running: <b>0</b> (modules in host process are not monitored)")
+
+    def reset_timing(self):
+        """Reset all timing"""
+        monitor.reset()
+        self.refresh_timing()
+
+    def reject(self):
+        """Stop refreshing before close"""
+        self._timer.stop()
+        super().reject()
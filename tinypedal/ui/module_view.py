@@ -31,11 +31,13 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from ..const_file import ConfigType
 from ..formatter import format_module_name
 from ..module_control import ModuleControl
 from ..setting import cfg
 from ._common import UIScaler
 from .config import UserConfig
+from .module_diagnostics import ModuleDiagnostics
 
 
 class ModuleList(QWidget):
@@ -68,6 +70,11 @@ class ModuleList(QWidget):
         layout_button = QHBoxLayout()
         layout_button.addWidget(button_enable)
         layout_button.addStretch(1)
+        if module_control.type_id == ConfigType.MODULE:
+            button_diagnostics = QPushButton("Diagnostics")
+            button_diagnostics.clicked.connect(self.open_diagnostics)
+            layout_button.addWidget(button_diagnostics)
+            layout_button.addStretch(1)
         layout_button.addWidget(button_disable)
 
         # Layout
@@ -117,6 +124,11 @@ class ModuleList(QWidget):
                 self.module_control.disable_all()
                 self.refresh()
 
+    def open_diagnostics(self):
+        """Open module diagnostics"""
+        _dialog = ModuleDiagnostics(self)
+        _dialog.show()
+
     def confirm_batch_toggle(self, confirm_type: str) -> bool:
         """Batch toggle confirmation"""
         if not cfg.application["show_confirmation_for_batch_toggle"]:
@@ -26,6 +26,7 @@ import csv
 import logging
 
 from ..const_file import FileExt
+from ..file_writer import atomic_open, file_writer
 from ..module_info import ConsumptionDataSet
 from ..validator import dict_value_type, invalid_save_name
 
@@ -36,6 +37,7 @@ def load_consumption_history_file(
     filepath: str, filename: str, extension: str = FileExt.CONSUMPTION
 ) -> tuple[ConsumptionDataSet, ...]:
     """Load fuel/energy consumption history file (*.consumption)"""
+    file_writer.wait(f"{filepath}{filename}{extension}")  # pending save
     try:
         with open(f"{filepath}{filename}{extension}", newline="", encoding="utf-8") as csvfile:
             data_reader = csv.DictReader(csvfile, restval="", restkey="unknown")
@@ -60,7 +62,7 @@ def save_consumption_history_file(
     """Save fuel/energy consumption history file (*.consumption)"""
     if len(dataset) < 2 or invalid_save_name(filename):
         return
-    with open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as csvfile:
+    with atomic_open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as csvfile:
         data_writer = csv.writer(csvfile, quoting=csv.QUOTE_NONNUMERIC)
         data_writer.writerow(ConsumptionDataSet._fields)  # write field name as column header
         data_writer.writerows(dataset)
@@ -22,11 +22,11 @@ Delta best file function
 
 from __future__ import annotations
 
-import csv
 import logging
 
 from ..const_file import FileExt
-from ..validator import invalid_save_name, valid_delta_set
+from ..validator import invalid_save_name
+from .delta_binary import load_delta_file, save_delta_file
 
 logger = logging.getLogger(__name__)
 
@@ -34,13 +34,9 @@ logger = logging.getLogger(__name__)
 def load_delta_best_file(
     filepath: str, filename: str, defaults: tuple, extension: str = FileExt.CSV
 ) -> tuple[tuple, float]:
-    """Load delta best file (*.csv)"""
+    """Load delta best file (*.delta), or migrate from legacy file (*.csv)"""
     try:
-        with open(f"{filepath}{filename}{extension}", newline="", encoding="utf-8") as csvfile:
-            data_reader = csv.reader(csvfile, quoting=csv.QUOTE_NONNUMERIC)
-            temp_list = tuple(tuple(data) for data in data_reader)
-        # Validate data
-        bestlist = valid_delta_set(temp_list)
+        bestlist = load_delta_file(filepath, filename, extension)
         laptime_best = bestlist[-1][1]
         return bestlist, laptime_best
     except FileNotFoundError:
@@ -51,12 +47,10 @@ def load_delta_best_file(
 
 
 def save_delta_best_file(
-    filepath: str, filename: str, dataset: tuple, extension: str = FileExt.CSV
+    filepath: str, filename: str, dataset: tuple, extension: str = FileExt.CSV,
+    export_csv: bool = False,
 ) -> None:
-    """Save delta best file (*.csv)"""
+    """Save delta best file (*.delta), optionally export CSV file (*.csv)"""
     if len(dataset) < 10 or invalid_save_name(filename):
         return
-    with open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as csvfile:
-        data_writer = csv.writer(csvfile)
-        data_writer.writerows(dataset)
-        logger.info("USERDATA: %s%s saved", filename, extension)
+    save_delta_file(filepath, filename, extension, dataset, export_csv)
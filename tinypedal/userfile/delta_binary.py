@@ -0,0 +1,189 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2025 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Binary delta file function
+
+Delta data (delta best, fuel & energy delta) binary file structure (little-endian):
+    Header (20 bytes):
+        4s  magic (b"TPDT")
+        H   format version
+        H   number of columns
+        I   number of rows
+        c   value type code, b"d" float64, b"f" float32
+        3x  reserved
+        I   payload checksum (crc32), 0 if not set
+    Payload:
+        columns in order, each column contains (number of rows) packed values
+
+Legacy CSV delta files are imported and migrated to binary format on first load,
+legacy files are kept untouched. Delta rows can also be exported to CSV file
+(same format as legacy file) for reading in other applications.
+"""
+
+from __future__ import annotations
+
+import csv
+import logging
+import os
+import struct
+import sys
+import zlib
+from array import array
+from typing import Sequence
+
+from ..const_file import FileExt
+from ..file_writer import atomic_open, file_writer
+from ..validator import valid_delta_set
+
+DELTA_MAGIC = b"TPDT"
+DELTA_VERSION = 1
+HEADER = struct.Struct("<4sHHIc3xI")
+VALUE_TYPES = (b"d", b"f")
+# Legacy CSV extension : binary extension
+BINARY_EXTENSION = {
+    FileExt.CSV: FileExt.DELTA,
+    FileExt.ENERGY: FileExt.ENERGY_DELTA,
+    FileExt.FUEL: FileExt.FUEL_DELTA,
+}
+
+logger = logging.getLogger(__name__)
+
+
+def pack_delta_columns(
+    columns: Sequence[Sequence[float]], typecode: str = "d", checksum: bool = True) -> bytes:
+    """Pack delta columns to bytes"""
+    rows = len(columns[0]) if columns else 0
+    payload = bytearray()
+    for column in columns:
+        if len(column) != rows:
+            raise ValueError("column length mismatch")
+        values = array(typecode, column)
+        if sys.byteorder == "big":
+            values.byteswap()
+        payload += values.tobytes()
+    crc = zlib.crc32(payload) if checksum else 0
+    return HEADER.pack(
+        DELTA_MAGIC, DELTA_VERSION, len(columns), rows, typecode.encode(), crc) + payload
+
+
+def unpack_delta_columns(data: bytes) -> list[array]:
+    """Unpack delta columns from bytes, raises ValueError if invalid"""
+    if len(data) < HEADER.size:
+        raise ValueError("incomplete header")
+    magic, version, num_columns, rows, typecode, crc = HEADER.unpack_from(data, 0)
+    if magic != DELTA_MAGIC or version != DELTA_VERSION or typecode not in VALUE_TYPES:
+        raise ValueError("invalid header")
+    typecode = typecode.decode()
+    column_size = rows * array(typecode).itemsize
+    payload = memoryview(data)[HEADER.size:]
+    if len(payload) != column_size * num_columns:
+        raise ValueError("invalid payload size")
+    if crc and zlib.crc32(payload) != crc:
+        raise ValueError("checksum mismatch")
+    columns = []
+    for offset in range(0, column_size * num_columns, column_size):
+        values = array(typecode)
+        values.frombytes(payload[offset:offset + column_size])
+        if sys.byteorder == "big":
+            values.byteswap()
+        if typecode != "d":
+            values = array("d", values)
+        columns.append(values)
+    return columns
+
+
+def load_delta_binary(filename_full: str) -> tuple[tuple[float, ...], ...]:
+    """Load delta binary file as rows"""
+    with open(filename_full, "rb") as binfile:
+        columns = unpack_delta_columns(binfile.read())
+    return tuple(zip(*columns))
+
+
+def save_delta_binary(filename_full: str, dataset: Sequence[Sequence[float]]) -> None:
+    """Save delta rows to binary file"""
+    data = pack_delta_columns(tuple(zip(*dataset)))
+    with atomic_open(filename_full, "wb") as binfile:
+        binfile.write(data)
+
+
+def import_delta_csv(filename_full: str) -> tuple[tuple[float, ...], ...]:
+    """Import delta CSV file as rows"""
+    with open(filename_full, newline="", encoding="utf-8") as csvfile:
+        data_reader = csv.reader(csvfile, quoting=csv.QUOTE_NONNUMERIC)
+        return tuple(tuple(data) for data in data_reader)
+
+
+def export_delta_csv(filename_full: str, dataset: Sequence[Sequence[float]]) -> None:
+    """Export delta rows to CSV file"""
+    with atomic_open(filename_full, "w", newline="", encoding="utf-8") as csvfile:
+        data_writer = csv.writer(csvfile)
+        data_writer.writerows(dataset)
+
+
+def delta_filename_full(filepath: str, filename: str, extension: str) -> str:
+    """Delta binary file full path from legacy CSV file extension"""
+    return f"{filepath}{filename}{BINARY_EXTENSION[extension]}"
+
+
+def load_delta_file(
+    filepath: str, filename: str, extension: str
+) -> tuple[tuple[float, ...], ...]:
+    """Load & validate delta file, migrate from legacy CSV file if binary file not found
+
+    Args:
+        filepath: Delta file path.
+        filename: Delta file name without extension.
+        extension: Legacy CSV file extension, see BINARY_EXTENSION.
+
+    Raises:
+        FileNotFoundError: If neither binary nor legacy file found.
+        IndexError, ValueError, TypeError: If invalid data.
+    """
+    filename_binary = delta_filename_full(filepath, filename, extension)
+    filename_legacy = f"{filepath}{filename}{extension}"
+    file_writer.wait(filename_binary)  # pending save
+    try:
+        return valid_delta_set(load_delta_binary(filename_binary))
+    except (FileNotFoundError, IndexError, ValueError):
+        if not os.path.exists(filename_legacy):
+            raise
+    dataset = valid_delta_set(import_delta_csv(filename_legacy))
+    save_delta_binary(filename_binary, dataset)
+    logger.info("USERDATA: %s%s migrated to %s", filename, extension, BINARY_EXTENSION[extension])
+    return dataset
+
+
+def save_delta_file(
+    filepath: str, filename: str, extension: str, dataset: Sequence[Sequence[float]],
+    export_csv: bool = False,
+) -> None:
+    """Save delta file in binary format
+
+    Args:
+        filepath: Delta file path.
+        filename: Delta file name without extension.
+        extension: Legacy CSV file extension, see BINARY_EXTENSION.
+        dataset: Delta rows.
+        export_csv: Whether to also export CSV file (with legacy CSV file extension).
+    """
+    save_delta_binary(delta_filename_full(filepath, filename, extension), dataset)
+    logger.info("USERDATA: %s%s saved", filename, BINARY_EXTENSION[extension])
+    if export_csv:
+        export_delta_csv(f"{filepath}{filename}{extension}", dataset)
+        logger.info("USERDATA: %s%s exported", filename, extension)
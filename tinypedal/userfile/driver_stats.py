@@ -16,27 +16,33 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+
 """
 Driver stats file function
+
+Driver stats are stored in SQLite database (WAL mode), one row per (track, vehicle).
+Stats are updated with increment upsert, so saving never rewrites whole stats.
+Legacy JSON stats file is imported once on database creation, and kept untouched.
 """
 
 from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass
-from time import sleep
-from typing import KeysView, get_type_hints
+import os
+import sqlite3
+from contextlib import closing, contextmanager
+from dataclasses import astuple, dataclass
+from typing import Iterator, KeysView, get_type_hints
 
 from ..const_common import MAX_SECONDS
 from ..const_file import FileExt, StatsFile
-from ..validator import convert_value_type, purge_data_key
-from .json_setting import (
-    create_backup_file,
-    save_and_verify_json_file,
-    save_json_file,
-    set_backup_timestamp,
-)
+from ..file_writer import file_writer
+from ..validator import convert_value_type
+
+STATS_TABLE = "driver_stats"
+STATS_SCHEMA_VERSION = 1
+SQL_TYPES = {float: "REAL", int: "INTEGER"}
 
 logger = logging.getLogger(__name__)
 
@@ -62,11 +68,108 @@ class DriverStats:
         return cls.__annotations__.keys()
 
 
+def stats_db_filename_full(filepath: str, filename: str = StatsFile.DRIVER) -> str:
+    """Stats database file full path"""
+    return f"{filepath}{filename}{FileExt.DB}"
+
+
+def create_stats_table_query() -> str:
+    """Create stats table query"""
+    default_type = get_type_hints(DriverStats)
+    columns = ", ".join(
+        f"{key} {SQL_TYPES[default_type[key]]} NOT NULL DEFAULT {DriverStats.__dict__[key]}"
+        for key in DriverStats.keys()
+    )
+    return (
+        f"CREATE TABLE IF NOT EXISTS {STATS_TABLE} ("
+        f"track TEXT NOT NULL, vehicle TEXT NOT NULL, {columns}, "
+        "PRIMARY KEY (track, vehicle))"
+    )
+
+
+def upsert_stats_query() -> str:
+    """Insert or increment stats query, personal best keeps lower value"""
+    keys = ", ".join(DriverStats.keys())
+    values = ", ".join("?" for _ in range(len(DriverStats.keys()) + 2))
+    updates = ", ".join(
+        f"{key} = MIN({key}, excluded.{key})" if key == "pb" else f"{key} = {key} + excluded.{key}"
+        for key in DriverStats.keys()
+    )
+    return (
+        f"INSERT INTO {STATS_TABLE} (track, vehicle, {keys}) VALUES ({values}) "
+        f"ON CONFLICT (track, vehicle) DO UPDATE SET {updates}"
+    )
+
+
+QUERY_CREATE_TABLE = create_stats_table_query()
+QUERY_UPSERT = upsert_stats_query()
+QUERY_REPLACE = (
+    f"INSERT OR REPLACE INTO {STATS_TABLE} "
+    f"VALUES ({', '.join('?' * (len(DriverStats.keys()) + 2))})"
+)
+
+
+@contextmanager
+def open_stats_db(filepath: str, filename: str = StatsFile.DRIVER) -> Iterator[sqlite3.Connection]:
+    """Open stats database (autocommit), create & import legacy stats file if not exists"""
+    with closing(sqlite3.connect(
+        stats_db_filename_full(filepath, filename), timeout=5, isolation_level=None)
+    ) as connection:
+        if connection.execute("PRAGMA user_version").fetchone()[0] < STATS_SCHEMA_VERSION:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                # Check again in case created by another connection
+                if connection.execute("PRAGMA user_version").fetchone()[0] < STATS_SCHEMA_VERSION:
+                    connection.execute(QUERY_CREATE_TABLE)
+                    import_stats_json_file(connection, filepath, filename)
+                    connection.execute(f"PRAGMA user_version = {STATS_SCHEMA_VERSION}")
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        connection.execute("PRAGMA synchronous=NORMAL")
+        yield connection
+
+
+def import_stats_json_file(
+    connection: sqlite3.Connection, filepath: str, filename: str = StatsFile.DRIVER
+) -> int:
+    """Import legacy stats json file to database, returns number of imported rows"""
+    if not os.path.exists(f"{filepath}{filename}{FileExt.STATS}"):
+        return 0
+    stats_user = load_stats_json_file(filepath, filename, show_log=False)
+    if stats_user is None:
+        logger.info("USERDATA: unable to import invalid %s%s", filename, FileExt.STATS)
+        return 0
+    rows = [
+        (track, vehicle, *astuple(stats_from_dict(vehicle_stats)))
+        for track, track_stats in validate_stats_file(stats_user).items()
+        for vehicle, vehicle_stats in track_stats.items()
+    ]
+    connection.executemany(QUERY_REPLACE, rows)
+    logger.info("USERDATA: %s%s imported (%s entries)", filename, FileExt.STATS, len(rows))
+    return len(rows)
+
+
+def stats_from_dict(stats_dict: dict) -> DriverStats:
+    """Create driver stats from dict, auto correct value type, ignore unknown key"""
+    default_dict = DriverStats.__dict__
+    default_type = get_type_hints(DriverStats)
+    stats = DriverStats()
+    for key in DriverStats.keys():
+        value = stats_dict.get(key, default_dict[key])
+        if not isinstance(value, default_type[key]):
+            value = convert_value_type(value, default_dict[key], default_type[key])
+        setattr(stats, key, value)
+    return stats
+
+
 def validate_stats_file(stats_user: dict) -> dict:
     """Validate stats file
 
     Full validation for every primary key (track name) and secondary key (vehicle name),
-    Only required for loading file in Driver Stats Viewer.
+    Only required for importing legacy stats file.
     """
     for key in stats_user:
         if not isinstance(stats_user[key], dict):
@@ -78,96 +181,115 @@ def validate_stats_file(stats_user: dict) -> dict:
     return stats_user
 
 
-def get_sub_dict(source: dict, key_name: str) -> dict:
-    """Get sub dict, create new if not exist"""
-    sub_dict = source.get(key_name)
-    if not isinstance(sub_dict, dict):
-        source[key_name] = {}
-        sub_dict = source[key_name]
-    return sub_dict
-
-
 def load_driver_stats(
     key_list: tuple[str, str], filepath: str, filename: str = StatsFile.DRIVER
 ) -> DriverStats:
     """Load driver stats"""
-    stats_user = load_stats_json_file(
-        filepath=filepath,
-        filename=filename,
-    )
-    if stats_user is None:
-        return DriverStats()
-    # Get data from matching key
-    loaded_dict = stats_user
-    for key in key_list:
-        loaded_dict = loaded_dict.get(key)
-        if not isinstance(loaded_dict, dict):  # not exist, set to default
-            return DriverStats()
-    # Add data to DriverStats
+    file_writer.wait(stats_db_filename_full(filepath, filename))  # pending save
     try:
-        return DriverStats(**purge_data_key(loaded_dict, DriverStats.keys()))
-    except (AttributeError, TypeError, KeyError, ValueError):
+        with open_stats_db(filepath, filename) as connection:
+            row = connection.execute(
+                f"SELECT {', '.join(DriverStats.keys())} FROM {STATS_TABLE} "
+                "WHERE track = ? AND vehicle = ?",
+                key_list,
+            ).fetchone()
+    except sqlite3.Error as error:
+        logger.error("USERDATA: unable to load %s%s, %s", filename, FileExt.DB, error)
         return DriverStats()
+    if row is None:  # not exist, set to default
+        return DriverStats()
+    return DriverStats(*row)
 
 
 def save_driver_stats(
     key_list: tuple[str, str], stats_update: DriverStats, filepath: str, filename: str = StatsFile.DRIVER
 ) -> None:
-    """Save driver stats"""
+    """Save driver stats, increment stats of matching key"""
     if not key_list or not all(key_list):  # ignore invalid key name
         return
-    # Load stats with limited attempts
-    load_attempts = 10
-    while load_attempts > 0:
-        stats_user = load_stats_json_file(
-            filepath=filepath,
-            filename=filename,
-            show_log=False,
+    try:
+        with open_stats_db(filepath, filename) as connection:
+            connection.execute(QUERY_UPSERT, (*key_list, *astuple(stats_update)))
+        logger.info("USERDATA: %s%s saved", filename, FileExt.DB)
+    except sqlite3.Error as error:
+        logger.error("USERDATA: %s%s failed saving, %s", filename, FileExt.DB, error)
+
+
+def query_stats_tracks(filepath: str, filename: str = StatsFile.DRIVER) -> tuple[str, ...]:
+    """Query track names, sorted in lower case"""
+    with open_stats_db(filepath, filename) as connection:
+        return tuple(row[0] for row in connection.execute(
+            f"SELECT DISTINCT track FROM {STATS_TABLE} ORDER BY LOWER(track)"))
+
+
+def count_stats_vehicles(filepath: str, track: str, filename: str = StatsFile.DRIVER) -> int:
+    """Count vehicles of track"""
+    with open_stats_db(filepath, filename) as connection:
+        return connection.execute(
+            f"SELECT COUNT(*) FROM {STATS_TABLE} WHERE track = ?", (track,)).fetchone()[0]
+
+
+def query_stats_vehicles(
+    filepath: str, track: str, order_by: str = "pb", descending: bool = False,
+    limit: int = -1, offset: int = 0, filename: str = StatsFile.DRIVER,
+) -> tuple[tuple[str, DriverStats], ...]:
+    """Query vehicle stats of track, sorted & paged
+
+    Args:
+        filepath: Stats file path.
+        track: Track name.
+        order_by: Sort key, "vehicle" or DriverStats key.
+        descending: Whether sort in descending order.
+        limit: Max number of rows, -1 for no limit.
+        offset: Number of rows to skip.
+        filename: Stats file name.
+
+    Returns:
+        (vehicle name, driver stats) rows.
+    """
+    if order_by == "vehicle":
+        order_by = "LOWER(vehicle)"
+    elif order_by not in DriverStats.keys():
+        raise ValueError(f"invalid stats key: {order_by}")
+    order = "DESC" if descending else "ASC"
+    with open_stats_db(filepath, filename) as connection:
+        rows = connection.execute(
+            f"SELECT vehicle, {', '.join(DriverStats.keys())} FROM {STATS_TABLE} WHERE track = ? "
+            f"ORDER BY {order_by} {order}, LOWER(vehicle) LIMIT ? OFFSET ?",
+            (track, limit, offset),
+        ).fetchall()
+    return tuple((row[0], DriverStats(*row[1:])) for row in rows)
+
+
+def delete_stats(
+    filepath: str, track: str, vehicle: str | None = None, filename: str = StatsFile.DRIVER
+) -> None:
+    """Delete all stats of track, or stats of vehicle only if vehicle is set"""
+    with open_stats_db(filepath, filename) as connection:
+        if vehicle is None:
+            connection.execute(f"DELETE FROM {STATS_TABLE} WHERE track = ?", (track,))
+        else:
+            connection.execute(
+                f"DELETE FROM {STATS_TABLE} WHERE track = ? AND vehicle = ?", (track, vehicle))
+
+
+def reset_stats_value(
+    filepath: str, track: str, vehicle: str, key: str, filename: str = StatsFile.DRIVER
+) -> None:
+    """Reset stats value to default"""
+    if key not in DriverStats.keys():
+        raise ValueError(f"invalid stats key: {key}")
+    with open_stats_db(filepath, filename) as connection:
+        connection.execute(
+            f"UPDATE {STATS_TABLE} SET {key} = ? WHERE track = ? AND vehicle = ?",
+            (DriverStats.__dict__[key], track, vehicle),
         )
-        if stats_user is not None:
-            break
-        load_attempts -= 1
-        logger.info("USERDATA: unable to load %s%s, %s attempt(s) left", filename, FileExt.STATS, load_attempts)
-        sleep(0.05)
-    # Create backup if failed to load stats
-    if stats_user is None:
-        logger.info("USERDATA: unable to load %s%s, creating backup", filename, FileExt.STATS)
-        if not create_backup_file(f"{filename}{FileExt.STATS}", filepath, set_backup_timestamp(), show_log=True):
-            return  # abort saving if failed to create backup
-        stats_user = {}  # reset stats
-    # Get data from matching key
-    loaded_dict = stats_user
-    for key in key_list:
-        loaded_dict = get_sub_dict(loaded_dict, key)
-    # Verify and update new data
-    default_dict = DriverStats.__dict__
-    default_type = get_type_hints(DriverStats)
-    for key, value in stats_update.__dict__.items():
-        # Add new default value if not exists
-        if key not in loaded_dict:
-            loaded_dict[key] = default_dict[key]
-        # Check value type, auto correct if mismatch
-        if not isinstance(loaded_dict[key], default_type[key]):
-            loaded_dict[key] = convert_value_type(loaded_dict[key], default_dict[key], default_type[key])
-        # Update laptime value faster than old value
-        if key == "pb":
-            if loaded_dict[key] > value:
-                loaded_dict[key] = value
-            continue
-        # Update value (increment)
-        loaded_dict[key] += value
-    # Save new data
-    save_stats_json_file(
-        stats_user=stats_user,
-        filepath=filepath,
-        filename=filename,
-    )
 
 
 def load_stats_json_file(
     filepath: str, filename: str = StatsFile.DRIVER, extension: str = FileExt.STATS, show_log: bool = True
 ) -> dict | None:
-    """Load stats json file, create new if not exists, or returns "None" if invalid"""
+    """Load legacy stats json file, or returns "None" if not found or invalid"""
     try:
         with open(f"{filepath}{filename}{extension}", "r", encoding="utf-8") as jsonfile:
             stats_user = json.load(jsonfile)
@@ -176,24 +298,8 @@ def load_stats_json_file(
             return stats_user
     except FileNotFoundError:
         if show_log:
-            logger.info("MISSING: %s stats (%s) data, create new stats", filename, extension)
-        stats_user = {}
-        save_json_file(stats_user, filename, filepath, extension, compact_json=True)
-        return stats_user
+            logger.info("MISSING: %s stats (%s) data", filename, extension)
     except (AttributeError, TypeError, KeyError, ValueError):
         if show_log:
             logger.info("MISSING: invalid %s stats (%s) data", filename, extension)
     return None
-
-
-def save_stats_json_file(
-    stats_user: dict, filepath: str, filename: str = StatsFile.DRIVER, extension: str = FileExt.STATS
-) -> None:
-    """Save stats to json file"""
-    save_and_verify_json_file(
-        dict_user=stats_user,
-        filename=f"{filename}{extension}",
-        filepath=filepath,
-        max_attempts=10,
-        compact_json=True,
-    )
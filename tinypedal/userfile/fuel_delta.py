@@ -22,10 +22,10 @@ Fuel/Energy delta file function
 
 from __future__ import annotations
 
-import csv
 import logging
 
-from ..validator import invalid_save_name, valid_delta_set
+from ..validator import invalid_save_name
+from .delta_binary import load_delta_file, save_delta_file
 
 logger = logging.getLogger(__name__)
 
@@ -33,13 +33,11 @@ logger = logging.getLogger(__name__)
 def load_fuel_delta_file(
     filepath: str, filename: str, extension: str, defaults: tuple
 ) -> tuple[tuple, float, float]:
-    """Load fuel/energy delta file (*.fuel, *.energy)"""
+    """Load fuel/energy delta file (*.fueldelta, *.energydelta),
+    or migrate from legacy file (*.fuel, *.energy)
+    """
     try:
-        with open(f"{filepath}{filename}{extension}", newline="", encoding="utf-8") as csvfile:
-            data_reader = csv.reader(csvfile, quoting=csv.QUOTE_NONNUMERIC)
-            temp_list = tuple(tuple(data) for data in data_reader)
-        # Validate data
-        lastlist = valid_delta_set(temp_list)
+        lastlist = load_delta_file(filepath, filename, extension)
         used_last = lastlist[-1][1]
         laptime_last = lastlist[-1][2]
         return lastlist, used_last, laptime_last
@@ -51,12 +49,11 @@ def load_fuel_delta_file(
 
 
 def save_fuel_delta_file(
-    filepath: str, filename: str, extension: str, dataset: tuple
+    filepath: str, filename: str, extension: str, dataset: tuple, export_csv: bool = False
 ) -> None:
-    """Save fuel/energy delta file (*.fuel, *.energy)"""
+    """Save fuel/energy delta file (*.fueldelta, *.energydelta),
+    optionally export CSV file (*.fuel, *.energy)
+    """
     if len(dataset) < 10 or invalid_save_name(filename):
         return
-    with open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as csvfile:
-        data_writer = csv.writer(csvfile)
-        data_writer.writerows(dataset)
-        logger.info("USERDATA: %s%s saved", filename, extension)
+    save_delta_file(filepath, filename, extension, dataset, export_csv)
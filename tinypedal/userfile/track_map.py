@@ -27,6 +27,7 @@ import xml.dom.minidom
 import xml.parsers.expat
 
 from ..const_file import FileExt
+from ..file_writer import atomic_open, file_writer
 from ..validator import invalid_save_name
 
 logger = logging.getLogger(__name__)
@@ -75,6 +76,7 @@ def coords_to_points(coords: tuple | list) -> str:
 
 def load_track_map_file(filepath: str, filename: str, extension: str = FileExt.SVG):
     """Load svg track map file (*.svg)"""
+    file_writer.wait(f"{filepath}{filename}{extension}")  # pending save
     try:
         dom = xml.dom.minidom.parse(f"{filepath}{filename}{extension}")
         desc_col = dom.documentElement.getElementsByTagName("desc")
@@ -158,6 +160,6 @@ def save_track_map_file(
     dist_node.setAttribute("points", svg_dists)
     root_node.appendChild(dist_node)
     # Save svg
-    with open(f"{filepath}{filename}{extension}", "w", encoding="utf-8") as svgfile:
+    with atomic_open(f"{filepath}{filename}{extension}", "w", encoding="utf-8") as svgfile:
         new_svg.writexml(svgfile, indent="", addindent="\t", newl="\n", encoding="utf-8")
         logger.info("USERDATA: %s%s saved", filename, extension)
@@ -67,6 +67,7 @@ class Realtime(Overlay):
         # Empty dataset
         self.pixmap_brandlogo = {}
         self.row_visible = [False] * self.veh_range
+        self.row_keys = [None] * self.veh_range
 
         # Driver position
         if self.wcfg["show_position"]:
@@ -384,6 +385,14 @@ class Realtime(Overlay):
             veh_info = minfo.vehicles.dataSet[rel_idx]
             # Highlighted player
             hi_player = self.wcfg["show_player_highlighted"] and veh_info.isPlayer
+            # Time gap
+            if self.wcfg["show_time_gap"]:
+                self.update_gap(self.bars_gap[idx], rel_time_gap, hi_player, state)
+            # Skip other columns if row not changed
+            row_key = (rel_idx, state, veh_info.rowVersion)
+            if self.row_keys[idx] == row_key:
+                continue
+            self.row_keys[idx] = row_key
             # Check whether is lapped
             is_lapped = veh_info.isLapped
             # Driver position
@@ -405,9 +414,6 @@ class Realtime(Overlay):
             # Brand logo
             if self.wcfg["show_brand_logo"]:
                 self.update_brd(self.bars_brd[idx], veh_info.vehicleName, hi_player, state)
-            # Time gap
-            if self.wcfg["show_time_gap"]:
-                self.update_gap(self.bars_gap[idx], rel_time_gap, hi_player, state)
             # Vehicle laptime
             if self.wcfg["show_laptime"]:
                 if veh_info.pitTimer.pitting:
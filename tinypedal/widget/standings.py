@@ -81,6 +81,7 @@ class Realtime(Overlay):
             self.veh_range = min(max(int(self.wcfg["max_vehicles_combined_mode"]), 5), 126)
         self.pixmap_brandlogo = {}
         self.row_visible = [False] * self.veh_range
+        self.row_keys = [None] * self.veh_range
 
         # Driver position
         if self.wcfg["show_position"]:
@@ -463,6 +464,8 @@ class Realtime(Overlay):
         player_idx = minfo.vehicles.playerIndex
         plr_veh_info = minfo.vehicles.dataSet[player_idx]
         in_race = api.read.session.in_race()
+        # Shared row inputs: session type, leader best (time gap), player lap history (delta laptime)
+        shared_key = (in_race, minfo.vehicles.leaderBestLapTime, plr_veh_info.lapTimeHistory[5])
 
         # Standings update
         for idx in range(self.veh_range):
@@ -484,6 +487,11 @@ class Realtime(Overlay):
 
             # Get vehicle dataset
             veh_info = minfo.vehicles.dataSet[std_idx]
+            # Skip update if row not changed
+            row_key = (std_idx, state, veh_info.rowVersion, shared_key)
+            if self.row_keys[idx] == row_key:
+                continue
+            self.row_keys[idx] = row_key
             # Highlighted player
             hi_player = self.wcfg["show_player_highlighted"] and veh_info.isPlayer
             # Driver position